@@ -1,6 +1,6 @@
 # src/adapters/inbound/http/pipeline_controller.py
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 
 from application.services.ingestion_pipeline_service import IngestionPipelineService
@@ -8,19 +8,19 @@ from application.services.publishing_pipeline_service import PublishingPipelineS
 
 router = APIRouter(prefix="", tags=["pipeline"])
 
-# global services variables, where the instances with the adapters put in place will be injected from main.py
-ingestion_pipeline_service: IngestionPipelineService
-publishing_pipeline_service: PublishingPipelineService
+# the service instances (with the adapters put in place) are set on app.state by main.py and read from the request
+# (plain attribute lookup: no per-request Depends resolution, no module-level references back to the services)
 
 
 @router.post("/pipelines/ingestion/run/{user_id}")
-async def run_ingestion_pipeline(user_id: str, service: IngestionPipelineService = Depends(lambda: ingestion_pipeline_service)):
+async def run_ingestion_pipeline(user_id: str, request: Request):
     """
     Lanza el pipeline de ingestion para el user indicado:
       - user_id: User ID
     """
+    ingestion_pipeline_service: IngestionPipelineService = request.app.state.ingestion_pipeline_service
     try:
-        await service.run_for_user(user_id = user_id)
+        await ingestion_pipeline_service.run_for_user(user_id = user_id)
         return {"status": "success"}
     # User not found
     except LookupError as e:
@@ -31,13 +31,14 @@ async def run_ingestion_pipeline(user_id: str, service: IngestionPipelineService
 
 
 @router.post("/pipelines/publishing/run/{user_id}")
-async def run_publishing_pipeline(user_id: str, service: PublishingPipelineService = Depends(lambda: publishing_pipeline_service)):
+async def run_publishing_pipeline(user_id: str, request: Request):
     """
     Lanza el pipeline de publicación para el user indicado:
       - user_id: User ID
     """
+    publishing_pipeline_service: PublishingPipelineService = request.app.state.publishing_pipeline_service
     try:
-        await service.run_for_user(user_id=user_id)
+        await publishing_pipeline_service.run_for_user(user_id=user_id)
         return {"status": "success"}
     except LookupError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -0,0 +1,55 @@
+# src/adapters/outbound/cached_app_config_repository.py
+
+import asyncio
+import time
+from typing import Optional
+
+# logging
+import logging
+
+from domain.entities.app_config import AppConfig
+from domain.ports.outbound.mongodb.app_config_repository_port import AppConfigRepositoryPort
+
+# Specific logger for this module
+logger = logging.getLogger(__name__)
+
+
+class CachedAppConfigRepository(AppConfigRepositoryPort):
+    """
+    Decorador de AppConfigRepositoryPort que cachea en memoria el AppConfig global durante `ttl_seconds`.
+    - Los jobs del scheduler leen la config al inicio y al final de cada tick: dentro del TTL ambas lecturas salen del caché.
+    - Un asyncio.Lock evita lecturas duplicadas concurrentes cuando el TTL expira (thundering herd).
+    - update_config escribe en el repositorio interno y deja el valor escrito en el caché (write-through).
+    """
+
+    def __init__(self, inner: AppConfigRepositoryPort, ttl_seconds: float = 30):
+        self._inner = inner
+        self._ttl_seconds = ttl_seconds
+        self._value: Optional[AppConfig] = None
+        self._expires_at = 0.0     # time.monotonic() deadline
+        self._lock = asyncio.Lock()
+
+    async def get_config(self) -> AppConfig:
+        if self._value is not None and time.monotonic() < self._expires_at:
+            return self._value
+
+        async with self._lock:
+            # another coroutine may have refreshed the entry while we were waiting
+            if self._value is not None and time.monotonic() < self._expires_at:
+                return self._value
+
+            self._value = await self._inner.get_config()
+            self._expires_at = time.monotonic() + self._ttl_seconds
+            logger.debug("App config refreshed (ttl: %ss)", self._ttl_seconds, extra={"class": self.__class__.__name__})
+            return self._value
+
+    async def update_config(self, config: AppConfig) -> None:
+        await self._inner.update_config(config)
+        self._value = config
+        self._expires_at = time.monotonic() + self._ttl_seconds
+
+    def invalidate(self) -> None:
+        """
+        Fuerza la relectura en la siguiente llamada a get_config.
+        """
+        self._expires_at = 0.0
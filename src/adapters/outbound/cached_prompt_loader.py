@@ -0,0 +1,65 @@
+# src/adapters/outbound/cached_prompt_loader.py
+
+import os
+import asyncio
+from typing import Dict, Optional, Tuple
+
+# logging
+import logging
+
+from domain.ports.outbound.prompt_loader_port import PromptLoaderPort
+
+# Specific logger for this module
+logger = logging.getLogger(__name__)
+
+
+class CachedPromptLoader(PromptLoaderPort):
+    """
+    Decorador de PromptLoaderPort que cachea en memoria el contenido de cada fichero de prompt.
+    - Valida cada entrada con el mtime del fichero (os.stat), así que un fichero editado se vuelve a leer.
+    - Un asyncio.Lock por fichero evita lecturas duplicadas concurrentes (thundering herd).
+    """
+
+    def __init__(self, inner: PromptLoaderPort, prompts_dir: str):
+        self._inner = inner
+        self._prompts_dir = prompts_dir
+        self._cache: Dict[str, Tuple[float, str]] = {}     # prompt_file_name -> (mtime, content)
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def load_prompt(self, prompt_file_name: str) -> str:
+        """
+        Devuelve el contenido cacheado si el mtime no ha cambiado; si no, delega en el loader interno.
+        """
+        mtime = self._get_mtime(prompt_file_name)
+        cached = self._cache.get(prompt_file_name)
+        if cached is not None and mtime is not None and cached[0] == mtime:
+            return cached[1]
+
+        lock = self._locks.setdefault(prompt_file_name, asyncio.Lock())
+        async with lock:
+            # another coroutine may have refreshed the entry while we were waiting
+            cached = self._cache.get(prompt_file_name)
+            if cached is not None and mtime is not None and cached[0] == mtime:
+                return cached[1]
+
+            content = await self._inner.load_prompt(prompt_file_name)
+            if mtime is not None:
+                self._cache[prompt_file_name] = (mtime, content)
+            logger.info("Prompt cached (prompt_file: %s)", prompt_file_name, extra={"class": self.__class__.__name__})
+            return content
+
+    def invalidate(self, prompt_file_name: Optional[str] = None) -> None:
+        """
+        Elimina del caché un fichero concreto, o todos si no se indica ninguno.
+        """
+        if prompt_file_name is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(prompt_file_name, None)
+
+    def _get_mtime(self, prompt_file_name: str) -> Optional[float]:
+        try:
+            return os.stat(os.path.join(self._prompts_dir, prompt_file_name)).st_mtime
+        except OSError:
+            # let the inner loader raise its own error for missing files
+            return None
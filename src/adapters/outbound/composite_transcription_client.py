@@ -0,0 +1,39 @@
+# src/adapters/outbound/composite_transcription_client.py
+
+from typing import List, Optional, Sequence
+
+# logging
+import logging
+
+from domain.ports.outbound.transcription_port import TranscriptionPort
+
+# Specific logger for this module
+logger = logging.getLogger(__name__)
+
+
+class CompositeTranscriptionClient(TranscriptionPort):
+    """
+    Decorador de TranscriptionPort que encadena varios clientes en orden (primario y fallbacks).
+    - Devuelve la primera transcripción no vacía: los clientes posteriores (p.ej. ASR con Whisper, el más caro) sólo se invocan si los anteriores no devuelven nada.
+    - Un cliente que lanza excepción se registra y se pasa al siguiente.
+    - Los clientes None se ignoran; add() permite añadir un cliente construido más tarde (p.ej. en el lifespan).
+    """
+
+    def __init__(self, clients: Sequence[Optional[TranscriptionPort]]):
+        self._clients: List[TranscriptionPort] = [client for client in clients if client is not None]
+
+    def add(self, client: TranscriptionPort) -> None:
+        self._clients.append(client)
+
+    async def transcribe(self, video_id: str, language: Optional[str] = None) -> Optional[str]:
+        for index, client in enumerate(self._clients, start=1):
+            client_name = client.__class__.__name__
+            try:
+                logger.info("Attempting transcription client %s/%s (%s) for video %s", index, len(self._clients), client_name, video_id, extra={"class": self.__class__.__name__})
+                transcript = await client.transcribe(video_id, language=language)
+            except Exception as e:
+                logger.warning("Transcription client %s failed for video %s: %s", client_name, video_id, str(e), extra={"class": self.__class__.__name__})
+                continue
+            if transcript:
+                return transcript
+        return None
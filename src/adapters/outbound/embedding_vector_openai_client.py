@@ -4,12 +4,11 @@
 #   text-embedding-3-small → 1536 dimensiones
 #   text-embedding-3-large → 3072 dimensiones
 
-import aiohttp
 from typing import List
 from domain.ports.outbound.embedding_vector_port import EmbeddingVectorPort
+from infrastructure.http_client import get_http_session
 
 # logging
-import inspect
 import logging
 
 logger = logging.getLogger(__name__)
@@ -36,7 +35,7 @@ class EmbeddingVectorOpenAIClient(EmbeddingVectorPort):
         """
         # Validate API key
         if not self.api_key:
-            logger.error("Missing API key", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+            logger.error("Missing API key", extra={"class": self.__class__.__name__})
             raise RuntimeError("Please set the OPENAI_API_KEY environment variable.")
         
         # compose URL and headers
@@ -52,21 +51,20 @@ class EmbeddingVectorOpenAIClient(EmbeddingVectorPort):
             "input": text,
         }
 
-        # consume openAI to get embedding vector of the 'text'
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload, headers=headers) as response:
-                if response.status != 200:
-                    body = await response.text()
-                    raise RuntimeError(
-                        f"OpenAI embedding API error {response.status}: {body}"
-                    )
+        # consume openAI to get embedding vector of the 'text' (shared session: pooled keep-alive connection)
+        async with get_http_session().post(url, json=payload, headers=headers) as response:
+            if response.status != 200:
+                body = await response.text()
+                raise RuntimeError(
+                    f"OpenAI embedding API error {response.status}: {body}"
+                )
 
-                data = await response.json()
+            data = await response.json()
 
-                # Extract the embedding vector
-                try:
-                    return data["data"][0]["embedding"]
-                except Exception as e:
-                    raise RuntimeError(
-                        f"Unexpected embedding API response format: {data}"
-                    ) from e
+            # Extract the embedding vector
+            try:
+                return data["data"][0]["embedding"]
+            except Exception as e:
+                raise RuntimeError(
+                    f"Unexpected embedding API response format: {data}"
+                ) from e
@@ -14,7 +14,6 @@ import os
 import asyncio
 
 # logging
-import inspect
 import logging
 
 from domain.ports.outbound.prompt_loader_port import PromptLoaderPort
@@ -31,7 +30,7 @@ class FilePromptLoader(PromptLoaderPort):
         self.prompts_dir = prompts_dir
         
         # Logging
-        logger.info("Finished OK", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+        logger.info("Finished OK", extra={"class": self.__class__.__name__})
         # print(f"[{self.__class__.__name__}][{inspect.currentframe().f_code.co_name}] Finished OK")
 
 
@@ -43,9 +42,9 @@ class FilePromptLoader(PromptLoaderPort):
         content = await asyncio.to_thread(self._read_file, path)
         
         # Logging
-        logger.info("Prompt loaded successfully (prompt_file: %s)", prompt_file_name, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+        logger.info("Prompt loaded successfully (prompt_file: %s)", prompt_file_name, extra={"class": self.__class__.__name__})
         # print(f"[FilePromptLoader] Prompt loaded successfully from file: {prompt_file_name}")
-        logger.info("Finished OK", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+        logger.info("Finished OK", extra={"class": self.__class__.__name__})
         
         return content
     
@@ -54,5 +53,5 @@ class FilePromptLoader(PromptLoaderPort):
         with open(path, "r", encoding="utf-8") as f:
             # Logging
             # print(f"[{self.__class__.__name__}][{inspect.currentframe().f_code.co_name}] Finished OK")
-            logger.info("File read successfully (file_path: %s)", path, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+            logger.info("File read successfully (file_path: %s)", path, extra={"class": self.__class__.__name__})
             return f.read()
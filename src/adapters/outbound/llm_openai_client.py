@@ -23,7 +23,6 @@ import json
 import asyncio
 
 # logging
-import inspect
 import logging
 
 from openai import OpenAI
@@ -44,33 +43,34 @@ class LLMOpenAIClient(LLMPort):
             raise RuntimeError("API key (OpenAI) is required")
         
         self.api_key = api_key
-        logger.info("Finished OK", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+        # OpenAI client built once and reused by every call (thread-safe; its connection pool keeps the TLS connection alive)
+        self.client = OpenAI(api_key=self.api_key)
+        logger.info("Finished OK", extra={"class": self.__class__.__name__})
 
     async def generate_tweets(self, prompt_user_message: str, prompt_system_message: str, model: str = "gpt-3.5-turbo") -> dict:
         # Validate API key
         if not self.api_key:
-            logger.error("Missing API key", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+            logger.error("Missing API key", extra={"class": self.__class__.__name__})
             raise RuntimeError("Please set the OPENAI_API_KEY environment variable.")
 
         # Validate inputs
         if not prompt_system_message or not str(prompt_system_message).strip():
-            logger.error("Empty prompt_system_message provided; aborting OpenAI call", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+            logger.error("Empty prompt_system_message provided; aborting OpenAI call", extra={"class": self.__class__.__name__})
             raise ValueError("prompt_system_message must not be empty")
 
         if not prompt_user_message or not str(prompt_user_message).strip():
-            logger.error("Empty prompt_user_message provided; aborting OpenAI call", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+            logger.error("Empty prompt_user_message provided; aborting OpenAI call", extra={"class": self.__class__.__name__})
             raise ValueError("prompt_user_message must not be empty")
 
         # Run OpenAI call in a separate thread
         json_response = await asyncio.to_thread(self._call_and_process, prompt_user_message, prompt_system_message, model)
 
-        logger.info("Finished OK", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+        logger.info("Finished OK", extra={"class": self.__class__.__name__})
         return json_response
 
 
     def _call_and_process(self, prompt_user_message: str, prompt_system_message: str, model: str) -> dict:
-        # Initialize OpenAI client
-        client = OpenAI(api_key=self.api_key)
+        client = self.client
 
         # Build messages
         system_message = {"role": "system", "content": prompt_system_message}
@@ -86,7 +86,7 @@ class LLMOpenAIClient(LLMPort):
                 frequency_penalty=0.4
             )
         except Exception as e:
-            logger.exception("OpenAI API call failed", extra={"method": inspect.currentframe().f_code.co_name, "error": str(e)})
+            logger.exception("OpenAI API call failed", extra={"error": str(e)})
             raise RuntimeError(f"OpenAI API call failed: {e}") from e
 
         # Extract raw content from the first choice
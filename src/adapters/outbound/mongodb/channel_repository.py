@@ -8,7 +8,9 @@ from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from domain.entities.channel import Channel
 from domain.ports.outbound.mongodb.channel_repository_port import ChannelRepositoryPort
-from infrastructure.mongodb import db
+
+# index backing find_by_user_id and the users → channels $lookup (see MongoUserRepository.iter_scheduler_users_with_channels)
+USER_ID_INDEX_NAME = "userId_1"
 
 
 class MongoChannelRepository(ChannelRepositoryPort):
@@ -16,8 +18,8 @@ class MongoChannelRepository(ChannelRepositoryPort):
     MongoDB adapter for ChannelRepositoryPort. Maps between Channel entities and Mongo documents.
     """
 
-    def __init__(self, database: AsyncIOMotorDatabase = db):
-        # Use the shared `db` instance from infrastructure.mongodb
+    def __init__(self, database: AsyncIOMotorDatabase):
+        # database handle comes from the shared Motor client (injected by the composition root)
         self._collection = database.get_collection("channels")
 
     async def save(self, channel: Channel) -> str:
@@ -98,9 +100,15 @@ class MongoChannelRepository(ChannelRepositoryPort):
         res = await self._collection.delete_many({})
         return res.deleted_count
 
-    def _to_entity(self, doc: dict) -> Channel:
+    async def ensure_indexes(self) -> None:
+        # backs find_by_user_id and the users → channels $lookup of the scheduler (no per-user collection scan)
+        await self._collection.create_index([("userId", 1)], name=USER_ID_INDEX_NAME, background=True)
+
+    @staticmethod
+    def _to_entity(doc: dict) -> Channel:
         """
         Convert a Mongo document into a Channel entity.
+        Static: also used to map channels embedded by other repositories' $lookup stages.
         """
         return Channel(
             id=str(doc["_id"]),
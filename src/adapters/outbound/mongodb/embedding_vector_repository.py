@@ -1,10 +1,13 @@
 # src/adapters/outbound/mongodb/embedding_vector_repository.py
 
 from datetime import datetime
-from typing import Optional
-from bson import ObjectId
+from typing import AsyncIterator, Optional, List, Tuple
+from bson import ObjectId, Binary
+
+import numpy as np
 
 from domain.value_objects.embedding_vector import EmbeddingVector
+from domain.value_objects.embedding_matrix import EmbeddingMatrix
 from domain.value_objects.embedding_type import EmbeddingType
 from domain.ports.outbound.mongodb.embedding_vector_repository_port import EmbeddingVectorRepositoryPort
 
@@ -21,19 +24,41 @@ class MongoEmbeddingVectorRepository(EmbeddingVectorRepositoryPort):
         self.collection = database["embeddings"]   # Single collection for all embeddings
 
     def _to_entity(self, doc) -> EmbeddingVector:
+        # Legacy documents store the vector as a list of fp32 floats (no "scale"): quantize on read
+        if isinstance(doc["vector"], list):
+            return EmbeddingVector.from_fp32(
+                doc["vector"],
+                id=str(doc["_id"]),
+                tweet_id=doc["tweet_id"],
+                type=EmbeddingType.from_str(doc["type"]),
+                created_at=doc["created_at"],
+            )
+
         return EmbeddingVector(
             id=str(doc["_id"]),
             tweet_id=doc["tweet_id"],
-            type=EmbeddingType(doc["type"]),            
-            vector=doc["vector"],
+            type=EmbeddingType.from_str(doc["type"]),            
+            vector=np.frombuffer(doc["vector"], dtype=np.int8).reshape(-1),
+            scale=doc["scale"],
             created_at=doc["created_at"],
+            norm=doc.get("norm"),           # older docs without norm → computed in __post_init__
+            normalized=doc.get("normalized", False),
         )
 
+    def _to_row(self, doc) -> Tuple[str, str, EmbeddingType, np.ndarray, float]:
+        # Legacy documents hold the fp32 list directly → scale 1.0
+        if isinstance(doc["vector"], list):
+            return str(doc["_id"]), doc["tweet_id"], EmbeddingType.from_str(doc["type"]), np.asarray(doc["vector"], dtype=np.float32), 1.0
+        return str(doc["_id"]), doc["tweet_id"], EmbeddingType.from_str(doc["type"]), np.frombuffer(doc["vector"], dtype=np.int8), doc["scale"]
+
     async def save(self, embedding: EmbeddingVector) -> str:
         doc = {
             "tweet_id": embedding.tweet_id,
-            "type": embedding.type.value,
-            "vector": embedding.vector,
+            "type": embedding.type.to_str(),
+            "vector": Binary(embedding.vector.tobytes()),     # subtype 0 (generic binary)
+            "scale": embedding.scale,
+            "norm": embedding.norm,
+            "normalized": embedding.normalized,
             "created_at": embedding.created_at or datetime.utcnow(),
         }
 
@@ -43,10 +68,41 @@ class MongoEmbeddingVectorRepository(EmbeddingVectorRepositoryPort):
     async def get_by_tweet_and_type(self, tweet_id: str, type: EmbeddingType) -> Optional[EmbeddingVector]:
         doc = await self.collection.find_one({
             "tweet_id": tweet_id,
-            "type": type.value
+            "type": type.to_str()
         })
 
         return self._to_entity(doc) if doc else None
 
     async def delete_by_tweet(self, tweet_id: str) -> None:
         await self.collection.delete_many({"tweet_id": tweet_id})
+
+    async def find_matrix(self, tweet_ids: Optional[List[str]] = None, type: Optional[EmbeddingType] = None) -> EmbeddingMatrix:
+        query = {}
+        if tweet_ids is not None:
+            query["tweet_id"] = {"$in": tweet_ids}
+        if type is not None:
+            query["type"] = type.to_str()
+
+        projection = {"tweet_id": 1, "type": 1, "vector": 1, "scale": 1}
+        docs = await self.collection.find(query, projection).to_list(length=None)
+        return EmbeddingMatrix.from_rows((self._to_row(doc) for doc in docs), count=len(docs))
+
+    async def iter_newest_matrices(self, type: EmbeddingType, limit: int, batch_size: int = 1000) -> AsyncIterator[EmbeddingMatrix]:
+        query = {"type": type.to_str()}
+
+        # _id of the limit-th newest embedding (ObjectIds grow with insertion time): everything from it onwards
+        # is streamed in insertion order, so the oldest loaded rows are the first ones evicted afterwards
+        oldest = await self.collection.find(query, {"_id": 1}).sort("_id", -1).skip(max(limit - 1, 0)).limit(1).to_list(length=1)
+        if oldest:
+            query["_id"] = {"$gte": oldest[0]["_id"]}
+
+        projection = {"tweet_id": 1, "type": 1, "vector": 1, "scale": 1}
+        cursor = self.collection.find(query, projection).sort("_id", 1).limit(limit).batch_size(batch_size)
+        docs = []
+        async for doc in cursor:
+            docs.append(doc)
+            if len(docs) == batch_size:
+                yield EmbeddingMatrix.from_rows((self._to_row(d) for d in docs), count=len(docs))
+                docs = []
+        if docs:
+            yield EmbeddingMatrix.from_rows((self._to_row(d) for d in docs), count=len(docs))
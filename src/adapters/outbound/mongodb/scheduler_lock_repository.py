@@ -0,0 +1,34 @@
+# src/adapters/outbound/mongodb/scheduler_lock_repository.py
+
+from datetime import datetime, timedelta
+
+from pymongo.errors import DuplicateKeyError
+
+from domain.ports.outbound.mongodb.scheduler_lock_repository_port import SchedulerLockRepositoryPort
+
+
+class MongoSchedulerLockRepository(SchedulerLockRepositoryPort):
+    """
+    MongoDB implementation of SchedulerLockRepositoryPort.
+    One document per lock: {_id: name, owner, expiresAt, renewedAt}.
+    """
+
+    def __init__(self, database):
+        self._coll = database.get_collection("scheduler_locks")
+
+    async def try_acquire(self, name: str, owner: str, ttl_seconds: int) -> bool:
+        now = datetime.utcnow()
+        try:
+            # matches only a lock we already hold or an expired one; otherwise the upsert collides on _id
+            await self._coll.find_one_and_update(
+                {"_id": name, "$or": [{"owner": owner}, {"expiresAt": {"$lt": now}}]},
+                {"$set": {"owner": owner, "expiresAt": now + timedelta(seconds=ttl_seconds), "renewedAt": now}},
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            # held by another owner whose lease is still valid
+            return False
+        return True
+
+    async def release(self, name: str, owner: str) -> None:
+        await self._coll.delete_one({"_id": name, "owner": owner})
@@ -16,12 +16,10 @@ from domain.entities.tweet import (
 from domain.ports.outbound.mongodb.tweet_repository_port import TweetRepositoryPort
 from domain.entities.user import TweetFetchSortOrder
 
-from infrastructure.mongodb import db
-
 
 class MongoTweetRepository(TweetRepositoryPort):
 
-    def __init__(self, database: AsyncIOMotorDatabase = db):
+    def __init__(self, database: AsyncIOMotorDatabase):
         self._coll = database.get_collection("tweets")
 
     # ---------------------------------------------------------
@@ -292,6 +290,7 @@ class MongoTweetRepository(TweetRepositoryPort):
             video_id=str(doc["videoId"]),
             generation_id=str(doc["generationId"]),
             text=doc["text"],
+            text_tokens=frozenset(doc["textTokens"]) if doc.get("textTokens") is not None else None,
             index_in_generation=doc.get("indexInGeneration"),
             published=doc.get("published", False),
             published_at=doc.get("publishedAt"),
@@ -309,6 +308,7 @@ class MongoTweetRepository(TweetRepositoryPort):
             "videoId": ObjectId(tweet.video_id),
             "generationId": ObjectId(tweet.generation_id),
             "text": tweet.text,
+            "textTokens": sorted(tweet.text_tokens) if tweet.text_tokens is not None else None,
             "indexInGeneration": tweet.index_in_generation,
             "published": tweet.published,
             "publishedAt": tweet.published_at,
@@ -1,9 +1,11 @@
 # src/adapters/outbound/mongodb/user_prompt_repository.py
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Dict, Any
 
 from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.write_concern import WriteConcern
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from domain.entities.user_prompt import (
@@ -20,14 +22,26 @@ class MongoUserPromptRepository(UserPromptRepositoryPort):
     """
     MongoDB adapter for UserPromptRepositoryPort. Maps between UserPrompt entities and Mongo documents.
     """
-    def __init__(self, database: AsyncIOMotorDatabase):    # TODO: eliminar el db por defecto y el import de db, y que solo sea por inyección al constructor
-        self._collection = database.get_collection("user_prompts")
+    def __init__(self, database: AsyncIOMotorDatabase, write_concern: Optional[WriteConcern] = None):
+        # write_concern=None keeps the database/URI default (w=majority)
+        self._collection = database.get_collection("user_prompts", write_concern=write_concern)
 
     async def save(self, user_prompt: UserPrompt) -> str:
         doc = self._to_document(user_prompt)
         result = await self._collection.insert_one(doc)
         return str(result.inserted_id)
 
+    async def save_many(self, user_prompts: List[UserPrompt], batch_size: int = 500) -> List[str]:
+        if not user_prompts:
+            return []
+
+        inserted_ids: List[str] = []
+        for start in range(0, len(user_prompts), batch_size):
+            docs = [self._to_document(user_prompt) for user_prompt in user_prompts[start:start + batch_size]]
+            result = await self._collection.insert_many(docs, ordered=False)
+            inserted_ids.extend(str(_id) for _id in result.inserted_ids)
+        return inserted_ids
+
     async def find_by_id(self, user_prompt_id: str) -> Optional[UserPrompt]:
         raw = await self._collection.find_one({"_id": ObjectId(user_prompt_id)})
         return self._to_entity(raw) if raw else None
@@ -63,13 +77,60 @@ class MongoUserPromptRepository(UserPromptRepositoryPort):
         if result.matched_count == 0:
             raise LookupError(f"UserPrompt {user_prompt.id} not found for update")
 
+    async def update_many(self, user_prompts: List[UserPrompt], batch_size: int = 500) -> int:
+        """
+        Bulk update of existing UserPrompt documents by id (same rules as update()).
+        - Preserves createdAt.
+        - Refreshes updatedAt to now.
+        """
+        if not user_prompts:
+            return 0
+
+        if any(not user_prompt.id for user_prompt in user_prompts):
+            raise ValueError("UserPrompt id is required for update")
+
+        now = datetime.utcnow()
+        modified = 0
+        for start in range(0, len(user_prompts), batch_size):
+            ops = []
+            for user_prompt in user_prompts[start:start + batch_size]:
+                update_doc = self._to_document(user_prompt)
+                update_doc.pop("createdAt", None)
+                update_doc["updatedAt"] = now
+                ops.append(UpdateOne({"_id": ObjectId(user_prompt.id)}, {"$set": update_doc}))
+            result = await self._collection.bulk_write(ops, ordered=False)
+            modified += result.modified_count
+        return modified
+
     async def delete(self, user_prompt_id: str) -> None:
         await self._collection.delete_one({"_id": ObjectId(user_prompt_id)})
 
+    async def delete_many(self, user_prompt_ids: List[str]) -> int:
+        if not user_prompt_ids:
+            return 0
+
+        res = await self._collection.delete_many({"_id": {"$in": [ObjectId(user_prompt_id) for user_prompt_id in user_prompt_ids]}})
+        return res.deleted_count
+
     async def delete_all(self) -> int:
         res = await self._collection.delete_many({})
         return res.deleted_count
 
+    async def truncate(self) -> None:
+        index_information = await self._collection.index_information()
+        await self._collection.drop()
+        await self._ensure_indexes(index_information)
+
+    async def _ensure_indexes(self, index_information: Dict[str, Any]) -> None:
+        """
+        Re-create the given indexes (as returned by index_information()), skipping the default _id index.
+        """
+        for name, spec in index_information.items():
+            if name == "_id_":
+                continue
+            options = {k: v for k, v in spec.items() if k not in ("key", "v", "ns")}
+            await self._collection.create_index(spec["key"], name=name, **options)
+
     def _to_entity(self, doc: dict) -> UserPrompt:
         # Parse tweetLengthPolicy if present
         tlp_doc = doc.get("tweetLengthPolicy")
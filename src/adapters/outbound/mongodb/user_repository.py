@@ -1,26 +1,81 @@
 # src/adapters/outbound/mongodb/user_repository.py
 
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import AsyncIterator, Optional, List, Dict, Any, Tuple, Union
 
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
 
 from domain.entities.user import User, UserTwitterCredentials, TweetFetchSortOrder
+from domain.entities.channel import Channel
 from domain.value_objects.scheduler_config import SchedulerConfig
-from domain.ports.outbound.mongodb.user_repository_port import UserRepositoryPort
-from infrastructure.mongodb import db
+from domain.value_objects.pipeline_transition import PipelineName
+from domain.ports.outbound.mongodb.user_repository_port import UserRepositoryPort, UserId
+from adapters.outbound.mongodb.channel_repository import MongoChannelRepository
 
 from infrastructure.security.encription import encrypt_value, decrypt_value
 
 
+def _to_object_id(value: Union[str, ObjectId]) -> ObjectId:
+    # fast path: ids already parsed upstream skip ObjectId's hex validation
+    return value if isinstance(value, ObjectId) else ObjectId(value)
+
+
+def _projection(fields: Optional[List[str]]) -> Optional[Dict[str, int]]:
+    # only fetch the requested fields (smaller documents over the wire); None = full document
+    return {f: 1 for f in fields} if fields else None
+
+
+# Fields read by the scheduler jobs (per-user pipeline flags/frequencies); everything else (credentials...) is skipped
+SCHEDULER_FIELDS = ["_id", "username", "schedulerConfig"]
+
+# pipeline name -> camelCase infix of the stored field names (schedulerConfig.isIngestionPipelineEnabled, lastIngestionPipelineStartedAt...)
+_PIPELINE_FIELD_NAMES = {"ingestion": "Ingestion", "publishing": "Publishing", "stats": "Stats", "embeddings": "Embeddings"}
+
+# Lowest frequency (minutes) the jobs can apply when schedulerConfig has no value for the pipeline: the mapping defaults of
+# _doc_to_entity / SchedulerConfig (the jobs fall back to 1440 only when schedulerConfig is missing, which is never lower).
+# Embeddings are not read from the user document, so their stored frequency/flag are ignored by the pre-filter too.
+_DUE_MIN_FREQUENCY_MINUTES = {"ingestion": 1, "publishing": 10, "stats": 10, "embeddings": 10}
+
+
+def _due_stages(pipeline: PipelineName, now: datetime) -> List[Dict[str, Any]]:
+    """
+    Aggregation stages keeping only users for which `pipeline` may be due at `now`:
+    not disabled by the user, and never started or last started more than one frequency ago
+    (last start read from user_scheduler_runtime_status, joined on the indexed userId).
+    A superset of the jobs' own decision, so no due user is ever dropped.
+    """
+    name = _PIPELINE_FIELD_NAMES[pipeline]
+    min_frequency = _DUE_MIN_FREQUENCY_MINUTES[pipeline]
+
+    stages: List[Dict[str, Any]] = []
+    if pipeline == "embeddings":
+        frequency_minutes: Any = min_frequency
+    else:
+        stages.append({"$match": {f"schedulerConfig.is{name}PipelineEnabled": {"$ne": False}}})
+        frequency_minutes = {"$ifNull": [f"$schedulerConfig.{pipeline}PipelineFrequencyMinutes", min_frequency]}
+
+    last_started = f"$_runtime.last{name}PipelineStartedAt"
+    stages += [
+        {"$lookup": {"from": "user_scheduler_runtime_status", "localField": "_id", "foreignField": "userId", "as": "_runtime"}},
+        {"$set": {"_lastStartedAt": {"$arrayElemAt": [last_started, 0]}}},
+        {"$match": {"$expr": {"$or": [
+            {"$eq": [{"$ifNull": ["$_lastStartedAt", None]}, None]},
+            {"$lt": ["$_lastStartedAt", {"$subtract": [now, {"$multiply": [frequency_minutes, 60_000]}]}]},
+        ]}}},
+        {"$unset": ["_runtime", "_lastStartedAt"]},
+    ]
+    return stages
+
+
 class MongoUserRepository(UserRepositoryPort):
     """
     MongoDB implementation of the UserRepositoryPort.
     Handles persistence and retrieval of User entities.
     """
 
-    def __init__(self, database: AsyncIOMotorDatabase = db):
+    def __init__(self, database: AsyncIOMotorDatabase):
         self._coll = database.get_collection("users")
 
     # ---------------------------------------------------------
@@ -41,15 +96,26 @@ class MongoUserRepository(UserRepositoryPort):
         """
         doc = self._entity_to_doc(user)
         await self._coll.update_one(
-            {"_id": ObjectId(user.id)},
+            {"_id": _to_object_id(user.id)},
             {"$set": doc}
         )
 
-    async def delete(self, user_id: str) -> None:
+    async def update_and_return(self, user: User) -> Optional[User]:
+        """
+        Update all fields of an existing User and return the post-image (single findOneAndUpdate).
+        """
+        doc = await self._coll.find_one_and_update(
+            {"_id": _to_object_id(user.id)},
+            {"$set": self._entity_to_doc(user)},
+            return_document=ReturnDocument.AFTER,
+        )
+        return self._doc_to_entity(doc) if doc else None
+
+    async def delete(self, user_id: UserId) -> None:
         """
         Delete a User by ID.
         """
-        await self._coll.delete_one({"_id": ObjectId(user_id)})
+        await self._coll.delete_one({"_id": _to_object_id(user_id)})
 
     async def delete_all(self) -> int:
         """
@@ -58,25 +124,91 @@ class MongoUserRepository(UserRepositoryPort):
         res = await self._coll.delete_many({})
         return res.deleted_count
 
+    async def truncate(self) -> None:
+        """
+        Drop the users collection and re-create the indexes it had.
+        """
+        index_information = await self._coll.index_information()
+        await self._coll.drop()
+        await self._ensure_indexes(index_information)
+
+    async def _ensure_indexes(self, index_information: Dict[str, Any]) -> None:
+        """
+        Re-create the given indexes (as returned by index_information()), skipping the default _id index.
+        """
+        for name, spec in index_information.items():
+            if name == "_id_":
+                continue
+            options = {k: v for k, v in spec.items() if k not in ("key", "v", "ns")}
+            await self._coll.create_index(spec["key"], name=name, **options)
+
     # ---------------------------------------------------------
     # Retrieval operations
     # ---------------------------------------------------------
 
-    async def find_by_id(self, user_id: str) -> Optional[User]:
+    async def find_by_id(self, user_id: UserId, fields: Optional[List[str]] = None) -> Optional[Union[User, Dict[str, Any]]]:
         """
         Retrieve a User by its MongoDB _id.
+        With `fields`, returns the raw projected document instead of the entity.
         """
-        doc = await self._coll.find_one({"_id": ObjectId(user_id)})
-        return self._doc_to_entity(doc) if doc else None
+        doc = await self._coll.find_one({"_id": _to_object_id(user_id)}, projection=_projection(fields))
+        if not doc:
+            return None
+        return doc if fields else self._doc_to_entity(doc)
 
-    async def find_all(self) -> List[User]:
+    async def find_by_ids(self, user_ids: List[UserId]) -> List[User]:
+        """
+        Retrieve several Users with a single $in query, preserving input order.
+        """
+        if not user_ids:
+            return []
+
+        cursor = self._coll.find({"_id": {"$in": [_to_object_id(user_id) for user_id in user_ids]}})
+        docs = await cursor.to_list(length=len(user_ids))
+        docs_by_id = {str(doc["_id"]): doc for doc in docs}
+        return [self._doc_to_entity(docs_by_id[str(user_id)]) for user_id in user_ids if str(user_id) in docs_by_id]
+
+    async def find_all(self, fields: Optional[List[str]] = None) -> List[Union[User, Dict[str, Any]]]:
         """
         Retrieve all Users.
+        With `fields`, returns the raw projected documents instead of entities.
         """
-        cursor = self._coll.find({})
+        cursor = self._coll.find({}, projection=_projection(fields))
         docs = await cursor.to_list(length=None)
+        if fields:
+            return docs
         return [self._doc_to_entity(doc) for doc in docs]
 
+    async def iter_all(self, batch_size: int = 500, fields: Optional[List[str]] = None) -> AsyncIterator[Union[User, Dict[str, Any]]]:
+        cursor = self._coll.find({}, projection=_projection(fields)).batch_size(batch_size)
+        async for doc in cursor:
+            yield doc if fields else self._doc_to_entity(doc)
+
+    async def iter_scheduler_users(self, batch_size: int = 500, due_pipeline: Optional[PipelineName] = None, now: Optional[datetime] = None) -> AsyncIterator[User]:
+        if due_pipeline is None:
+            cursor = self._coll.find({}, projection=_projection(SCHEDULER_FIELDS)).batch_size(batch_size)
+        else:
+            cursor = self._coll.aggregate(self._scheduler_users_pipeline(due_pipeline, now), batchSize=batch_size)
+        async for doc in cursor:
+            yield self._doc_to_entity(doc)
+
+    async def iter_scheduler_users_with_channels(self, batch_size: int = 500, due_pipeline: Optional[PipelineName] = None, now: Optional[datetime] = None) -> AsyncIterator[Tuple[User, List[Channel]]]:
+        # one aggregation for the whole tick: channels are joined server-side ($lookup on channels.userId, indexed by MongoChannelRepository.ensure_indexes)
+        pipeline = self._scheduler_users_pipeline(due_pipeline, now) + [
+            {"$lookup": {"from": "channels", "localField": "_id", "foreignField": "userId", "as": "channels"}},
+        ]
+        cursor = self._coll.aggregate(pipeline, batchSize=batch_size)
+        async for doc in cursor:
+            channel_docs = doc.pop("channels", [])
+            yield self._doc_to_entity(doc), [MongoChannelRepository._to_entity(channel_doc) for channel_doc in channel_docs]
+
+    @staticmethod
+    def _scheduler_users_pipeline(due_pipeline: Optional[PipelineName], now: Optional[datetime]) -> List[Dict[str, Any]]:
+        stages: List[Dict[str, Any]] = [{"$project": _projection(SCHEDULER_FIELDS)}]
+        if due_pipeline is not None:
+            stages += _due_stages(due_pipeline, now or datetime.utcnow())
+        return stages
+
     async def find_by_username(self, username: str) -> Optional[User]:
         """
         Retrieve a User by username.
@@ -96,13 +228,13 @@ class MongoUserRepository(UserRepositoryPort):
     # Password operations
     # ---------------------------------------------------------
 
-    async def update_password(self, user_id: str, hashed_password: str) -> None:
+    async def update_password(self, user_id: UserId, hashed_password: str) -> None:
         """
         Update only the hashed password of a User.
         The repository NEVER hashes passwords; it only stores the hashed value.
         """
         await self._coll.update_one(
-            {"_id": ObjectId(user_id)},
+            {"_id": _to_object_id(user_id)},
             {"$set": {
                 "hashedPassword": hashed_password,
                 "updatedAt": datetime.utcnow()
@@ -113,12 +245,12 @@ class MongoUserRepository(UserRepositoryPort):
     # Twitter credentials
     # ---------------------------------------------------------
 
-    async def update_twitter_credentials(self, user_id: str, creds: UserTwitterCredentials) -> None:
+    async def update_twitter_credentials(self, user_id: UserId, creds: UserTwitterCredentials) -> None:
         """
         Update encrypted Twitter credentials for a User.
         """
         await self._coll.update_one(
-            {"_id": ObjectId(user_id)},
+            {"_id": _to_object_id(user_id)},
             {"$set": {
                 "userTwitterCredentials": {
                     "oauth1AccessToken": encrypt_value(creds.oauth1_access_token) if creds.oauth1_access_token else None,
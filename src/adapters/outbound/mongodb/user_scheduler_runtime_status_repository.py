@@ -1,14 +1,16 @@
 # src/adapters/outbound/mongodb/user_scheduler_runtime_status_repository.py
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any, Union
 
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument, UpdateOne
 from datetime import datetime, timezone
 
 from domain.entities.user_scheduler_runtime_status import UserSchedulerRuntimeStatus
 from domain.ports.outbound.mongodb.user_scheduler_runtime_status_repository_port import UserSchedulerRuntimeStatusRepositoryPort
+from domain.value_objects.pipeline_transition import PipelineTransition, PipelineName
 
 # Type alias for user id inputs
 UserId = Union[str, ObjectId]
@@ -20,6 +22,15 @@ def _to_object_id(value: UserId) -> ObjectId:
     return ObjectId(value)
 
 
+# pipeline name -> camelCase infix used in stored field names (e.g. "isIngestionPipelineRunning")
+_PIPELINE_FIELD_NAMES = {
+    "ingestion": "Ingestion",
+    "publishing": "Publishing",
+    "stats": "Stats",
+    "embeddings": "Embeddings",
+}
+
+
 def _snake_to_camel(s: str) -> str:
     parts = s.split("_")
     return parts[0] + "".join(p.capitalize() for p in parts[1:])
@@ -66,6 +77,13 @@ class MongoUserSchedulerRuntimeStatusRepository(UserSchedulerRuntimeStatusReposi
             next_scheduled_stats_pipeline_starting_at=doc.get("nextScheduledStatsPipelineStartingAt"),
             consecutive_failures_stats_pipeline=int(doc.get("consecutiveFailuresStatsPipeline", 0)),
 
+            # EMBEDDINGS
+            is_embeddings_pipeline_running=bool(doc.get("isEmbeddingsPipelineRunning", False)),
+            last_embeddings_pipeline_started_at=doc.get("lastEmbeddingsPipelineStartedAt"),
+            last_embeddings_pipeline_finished_at=doc.get("lastEmbeddingsPipelineFinishedAt"),
+            next_scheduled_embeddings_pipeline_starting_at=doc.get("nextScheduledEmbeddingsPipelineStartingAt"),
+            consecutive_failures_embeddings_pipeline=int(doc.get("consecutiveFailuresEmbeddingsPipeline", 0)),
+
             created_at=doc.get("createdAt") or datetime.utcnow(),
             updated_at=doc.get("updatedAt") or datetime.utcnow(),
         )
@@ -95,6 +113,13 @@ class MongoUserSchedulerRuntimeStatusRepository(UserSchedulerRuntimeStatusReposi
             "nextScheduledStatsPipelineStartingAt": ent.next_scheduled_stats_pipeline_starting_at,
             "consecutiveFailuresStatsPipeline": ent.consecutive_failures_stats_pipeline,
 
+            # EMBEDDINGS
+            "isEmbeddingsPipelineRunning": ent.is_embeddings_pipeline_running,
+            "lastEmbeddingsPipelineStartedAt": ent.last_embeddings_pipeline_started_at,
+            "lastEmbeddingsPipelineFinishedAt": ent.last_embeddings_pipeline_finished_at,
+            "nextScheduledEmbeddingsPipelineStartingAt": ent.next_scheduled_embeddings_pipeline_starting_at,
+            "consecutiveFailuresEmbeddingsPipeline": ent.consecutive_failures_embeddings_pipeline,
+
             "createdAt": ent.created_at,
             "updatedAt": ent.updated_at,
         }
@@ -103,11 +128,22 @@ class MongoUserSchedulerRuntimeStatusRepository(UserSchedulerRuntimeStatusReposi
     # -----------------------
     # CRUD + list
     # -----------------------
+    async def ensure_indexes(self) -> None:
+        # backs get_by_user_id and the users → runtime status $lookup of the scheduler's due-user pre-filter
+        await self._coll.create_index([("userId", 1)], name="userId_1", background=True)
+
     async def get_by_user_id(self, user_id: UserId) -> Optional[UserSchedulerRuntimeStatus]:
         oid = _to_object_id(user_id)
         doc = await self._coll.find_one({"userId": oid})
         return self._doc_to_entity(doc) if doc else None
 
+    async def get_many_by_user_ids(self, user_ids: List[UserId]) -> Dict[str, UserSchedulerRuntimeStatus]:
+        # single $in query on the userId_1 index (one round-trip per scheduler tick instead of one per user)
+        if not user_ids:
+            return {}
+        cursor = self._coll.find({"userId": {"$in": [_to_object_id(uid) for uid in user_ids]}})
+        return {str(doc["userId"]): self._doc_to_entity(doc) async for doc in cursor}
+
     async def update_by_user_id(self, user_id: str, update: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         update_payload = dict(update)
         if "updatedAt" not in update_payload:
@@ -121,9 +157,9 @@ class MongoUserSchedulerRuntimeStatusRepository(UserSchedulerRuntimeStatusReposi
             oid = None
 
         for filt in filter_candidates:
-            result = await self._coll.update_one(filt, {"$set": update_payload})
-            if result.matched_count > 0:
-                updated_doc = await self._coll.find_one(filt)
+            # single round trip: apply the $set and get the post-image back
+            updated_doc = await self._coll.find_one_and_update(filt, {"$set": update_payload}, return_document=ReturnDocument.AFTER)
+            if updated_doc is not None:
                 return updated_doc
 
         return None
@@ -146,6 +182,30 @@ class MongoUserSchedulerRuntimeStatusRepository(UserSchedulerRuntimeStatusReposi
             upsert=True
         )
 
+    async def upsert_many(self, statuses: List[UserSchedulerRuntimeStatus]) -> None:
+        if not statuses:
+            return
+        now = datetime.utcnow()
+        ops = []
+        for status in statuses:
+            insert_doc = self._entity_to_doc(status)
+            insert_doc.pop("updatedAt", None)   # set below; a field cannot be in $set and $setOnInsert at once
+            ops.append(UpdateOne(
+                {"userId": status.user_id},
+                {"$setOnInsert": insert_doc, "$set": {"updatedAt": now}},
+                upsert=True,
+            ))
+        await self._coll.bulk_write(ops, ordered=False)
+
+    async def update_and_return(self, status: UserSchedulerRuntimeStatus) -> Optional[UserSchedulerRuntimeStatus]:
+        status.updated_at = datetime.utcnow()
+        doc = await self._coll.find_one_and_update(
+            {"userId": _to_object_id(status.user_id)},
+            {"$set": self._entity_to_doc(status)},
+            return_document=ReturnDocument.AFTER,
+        )
+        return self._doc_to_entity(doc) if doc else None
+
     async def update_fields(self, user_id: UserId, fields: Dict[str, Any]) -> None:
         if not fields:
             return
@@ -161,243 +221,190 @@ class MongoUserSchedulerRuntimeStatusRepository(UserSchedulerRuntimeStatusReposi
         oid = _to_object_id(user_id)
         await self._coll.delete_one({"userId": oid})
 
-    async def list_all(self, limit: Optional[int] = None) -> List[UserSchedulerRuntimeStatus]:
-        cursor = self._coll.find({})
-        if limit:
-            cursor = cursor.limit(limit)
+    async def list_all(self, limit: Optional[int] = None, fields: Optional[List[str]] = None) -> List[Union[UserSchedulerRuntimeStatus, Dict[str, Any]]]:
+        projection = {f: 1 for f in fields} if fields else None
+        cursor = self._coll.find({}, projection=projection).limit(limit or 0)
         docs = await cursor.to_list(length=limit or 1000)
+        if fields:
+            return docs
         return [self._doc_to_entity(d) for d in docs]
 
     # -----------------------
-    # Convenience atomic operations — INGESTION
+    # Generic single-round-trip update
     # -----------------------
-    async def mark_ingestion_started(self, user_id: UserId, started_at: Any) -> None:
-        oid = _to_object_id(user_id)
-        await self._coll.update_one(
-            {"userId": oid},
+    async def atomic_update(self, user_id: UserId, set_fields: Dict[str, Any], inc_fields: Optional[Dict[str, int]] = None, upsert: bool = True) -> None:
+        update: Dict[str, Any] = {"$set": {**set_fields, "updatedAt": datetime.utcnow()}}
+        if inc_fields:
+            update["$inc"] = inc_fields
+        await self._coll.update_one({"userId": _to_object_id(user_id)}, update, upsert=upsert)
+
+    async def atomic_transition(self, user_id: UserId, transitions: List[PipelineTransition]) -> UserSchedulerRuntimeStatus:
+        doc = await self._coll.find_one_and_update(
+            {"userId": _to_object_id(user_id)},
+            self._transition_update(transitions),
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return self._doc_to_entity(doc)
+
+    async def bulk_transition(self, transitions_by_user: Dict[UserId, List[PipelineTransition]]) -> None:
+        if not transitions_by_user:
+            return
+        ops = [
+            UpdateOne({"userId": _to_object_id(user_id)}, self._transition_update(transitions), upsert=True)
+            for user_id, transitions in transitions_by_user.items()
+        ]
+        await self._coll.bulk_write(ops, ordered=False)
+
+    async def try_claim_pipeline(self, user_id: UserId, pipeline: PipelineName, now: datetime, lease_minutes: float) -> bool:
+        name = _PIPELINE_FIELD_NAMES[pipeline]
+        running_field, started_field = f"is{name}PipelineRunning", f"last{name}PipelineStartedAt"
+        doc = await self._coll.find_one_and_update(
             {
-                "$set": {
-                    "isIngestionPipelineRunning": True,
-                    "lastIngestionPipelineStartedAt": started_at,
-                    "updatedAt": datetime.utcnow()
-                }
+                "userId": _to_object_id(user_id),
+                # not running, or running with no start recorded / started more than one lease ago (stuck)
+                "$or": [
+                    {running_field: {"$ne": True}},
+                    {started_field: None},
+                    {started_field: {"$lt": now - timedelta(minutes=lease_minutes)}},
+                ],
             },
-            upsert=True
+            {"$set": {running_field: True, started_field: now, "updatedAt": now}},
+            projection={"_id": 1},
+        )
+        return doc is not None
+
+    @staticmethod
+    def _transition_update(transitions: List[PipelineTransition]) -> Dict[str, Any]:
+        """
+        Merge pipeline transitions into one {$set, $inc} update document (updatedAt always set to now).
+        """
+        set_fields: Dict[str, Any] = {}
+        inc_fields: Dict[str, int] = {}
+
+        for t in transitions:
+            name = _PIPELINE_FIELD_NAMES[t.pipeline]
+            if t.action == "start":
+                set_fields[f"is{name}PipelineRunning"] = True
+                set_fields[f"last{name}PipelineStartedAt"] = t.at
+            elif t.action == "finish_success":
+                set_fields[f"is{name}PipelineRunning"] = False
+                set_fields[f"last{name}PipelineFinishedAt"] = t.at
+                set_fields[f"consecutiveFailures{name}Pipeline"] = 0
+            elif t.action == "finish_fail":
+                set_fields[f"is{name}PipelineRunning"] = False
+                set_fields[f"last{name}PipelineFinishedAt"] = t.at
+                inc_fields[f"consecutiveFailures{name}Pipeline"] = inc_fields.get(f"consecutiveFailures{name}Pipeline", 0) + 1
+            elif t.action == "schedule_next":
+                set_fields[f"nextScheduled{name}PipelineStartingAt"] = t.at
+            else:
+                raise ValueError(f"Unknown pipeline transition action '{t.action}'")
+
+        conflicting = set_fields.keys() & inc_fields.keys()
+        if conflicting:
+            raise ValueError(f"Conflicting pipeline transitions on fields: {', '.join(sorted(conflicting))}")
+
+        update: Dict[str, Any] = {"$set": {**set_fields, "updatedAt": datetime.utcnow()}}
+        if inc_fields:
+            update["$inc"] = inc_fields
+        return update
+
+    # -----------------------
+    # Convenience atomic operations — INGESTION
+    # -----------------------
+    async def mark_ingestion_started(self, user_id: UserId, started_at: Any) -> None:
+        await self.atomic_update(
+            user_id,
+            set_fields={"isIngestionPipelineRunning": True, "lastIngestionPipelineStartedAt": started_at},
         )
 
     async def mark_ingestion_finished(self, user_id: UserId, finished_at: Any, success: bool) -> None:
-        oid = _to_object_id(user_id)
+        set_fields: Dict[str, Any] = {"isIngestionPipelineRunning": False, "lastIngestionPipelineFinishedAt": finished_at}
         if success:
-            update = {
-                "$set": {
-                    "isIngestionPipelineRunning": False,
-                    "lastIngestionPipelineFinishedAt": finished_at,
-                    "consecutiveFailuresIngestionPipeline": 0,
-                    "updatedAt": datetime.utcnow()
-                }
-            }
-        else:
-            update = {
-                "$set": {
-                    "isIngestionPipelineRunning": False,
-                    "lastIngestionPipelineFinishedAt": finished_at,
-                    "updatedAt": datetime.utcnow()
-                },
-                "$inc": {"consecutiveFailuresIngestionPipeline": 1}
-            }
-        await self._coll.update_one({"userId": oid}, update, upsert=True)
+            set_fields["consecutiveFailuresIngestionPipeline"] = 0
+        await self.atomic_update(
+            user_id,
+            set_fields=set_fields,
+            inc_fields=None if success else {"consecutiveFailuresIngestionPipeline": 1},
+        )
 
     async def increment_ingestion_failures(self, user_id: UserId, by: int = 1) -> None:
-        oid = _to_object_id(user_id)
-        await self._coll.update_one(
-            {"userId": oid},
-            {"$inc": {"consecutiveFailuresIngestionPipeline": int(by)}, "$set": {"updatedAt": datetime.utcnow()}},
-            upsert=True
-        )
+        await self.atomic_update(user_id, set_fields={}, inc_fields={"consecutiveFailuresIngestionPipeline": int(by)})
 
     async def reset_ingestion_failures(self, user_id: UserId) -> None:
-        oid = _to_object_id(user_id)
-        await self._coll.update_one(
-            {"userId": oid},
-            {"$set": {"consecutiveFailuresIngestionPipeline": 0, "updatedAt": datetime.utcnow()}},
-            upsert=False
-        )
+        await self.atomic_update(user_id, set_fields={"consecutiveFailuresIngestionPipeline": 0}, upsert=False)
 
     # -----------------------
     # Convenience atomic operations — PUBLISHING
     # -----------------------
     async def mark_publishing_started(self, user_id: UserId, started_at: Any) -> None:
-        oid = _to_object_id(user_id)
-        await self._coll.update_one(
-            {"userId": oid},
-            {
-                "$set": {
-                    "isPublishingPipelineRunning": True,
-                    "lastPublishingPipelineStartedAt": started_at,
-                    "updatedAt": datetime.utcnow()
-                }
-            },
-            upsert=True
+        await self.atomic_update(
+            user_id,
+            set_fields={"isPublishingPipelineRunning": True, "lastPublishingPipelineStartedAt": started_at},
         )
 
     async def mark_publishing_finished(self, user_id: UserId, finished_at: Any, success: bool) -> None:
-        oid = _to_object_id(user_id)
+        set_fields: Dict[str, Any] = {"isPublishingPipelineRunning": False, "lastPublishingPipelineFinishedAt": finished_at}
         if success:
-            update = {
-                "$set": {
-                    "isPublishingPipelineRunning": False,
-                    "lastPublishingPipelineFinishedAt": finished_at,
-                    "consecutiveFailuresPublishingPipeline": 0,
-                    "updatedAt": datetime.utcnow()
-                }
-            }
-        else:
-            update = {
-                "$set": {
-                    "isPublishingPipelineRunning": False,
-                    "lastPublishingPipelineFinishedAt": finished_at,
-                    "updatedAt": datetime.utcnow()
-                },
-                "$inc": {"consecutiveFailuresPublishingPipeline": 1}
-            }
-        await self._coll.update_one({"userId": oid}, update, upsert=True)
+            set_fields["consecutiveFailuresPublishingPipeline"] = 0
+        await self.atomic_update(
+            user_id,
+            set_fields=set_fields,
+            inc_fields=None if success else {"consecutiveFailuresPublishingPipeline": 1},
+        )
 
     async def increment_publishing_failures(self, user_id: UserId, by: int = 1) -> None:
-        oid = _to_object_id(user_id)
-        await self._coll.update_one(
-            {"userId": oid},
-            {"$inc": {"consecutiveFailuresPublishingPipeline": int(by)}, "$set": {"updatedAt": datetime.utcnow()}},
-            upsert=True
-        )
+        await self.atomic_update(user_id, set_fields={}, inc_fields={"consecutiveFailuresPublishingPipeline": int(by)})
 
     async def reset_publishing_failures(self, user_id: UserId) -> None:
-        oid = _to_object_id(user_id)
-        await self._coll.update_one(
-            {"userId": oid},
-            {"$set": {"consecutiveFailuresPublishingPipeline": 0, "updatedAt": datetime.utcnow()}},
-            upsert=False
-        )
+        await self.atomic_update(user_id, set_fields={"consecutiveFailuresPublishingPipeline": 0}, upsert=False)
 
     # -----------------------
     # Convenience atomic operations — STATS
     # -----------------------
     async def mark_stats_started(self, user_id: UserId, started_at: Any) -> None:
-        oid = _to_object_id(user_id)
-        await self._coll.update_one(
-            {"userId": oid},
-            {
-                "$set": {
-                    "isStatsPipelineRunning": True,
-                    "lastStatsPipelineStartedAt": started_at,
-                    "updatedAt": datetime.utcnow()
-                }
-            },
-            upsert=True
+        await self.atomic_update(
+            user_id,
+            set_fields={"isStatsPipelineRunning": True, "lastStatsPipelineStartedAt": started_at},
         )
 
     async def mark_stats_finished(self, user_id: UserId, finished_at: Any, success: bool) -> None:
-        oid = _to_object_id(user_id)
+        set_fields: Dict[str, Any] = {"isStatsPipelineRunning": False, "lastStatsPipelineFinishedAt": finished_at}
         if success:
-            update = {
-                "$set": {
-                    "isStatsPipelineRunning": False,
-                    "lastStatsPipelineFinishedAt": finished_at,
-                    "consecutiveFailuresStatsPipeline": 0,
-                    "updatedAt": datetime.utcnow()
-                }
-            }
-        else:
-            update = {
-                "$set": {
-                    "isStatsPipelineRunning": False,
-                    "lastStatsPipelineFinishedAt": finished_at,
-                    "updatedAt": datetime.utcnow()
-                },
-                "$inc": {"consecutiveFailuresStatsPipeline": 1}
-            }
-        await self._coll.update_one({"userId": oid}, update, upsert=True)
+            set_fields["consecutiveFailuresStatsPipeline"] = 0
+        await self.atomic_update(
+            user_id,
+            set_fields=set_fields,
+            inc_fields=None if success else {"consecutiveFailuresStatsPipeline": 1},
+        )
 
     async def increment_stats_failures(self, user_id: UserId, by: int = 1) -> None:
-        oid = _to_object_id(user_id)
-        await self._coll.update_one(
-            {"userId": oid},
-            {"$inc": {"consecutiveFailuresStatsPipeline": int(by)}, "$set": {"updatedAt": datetime.utcnow()}},
-            upsert=True
-        )
+        await self.atomic_update(user_id, set_fields={}, inc_fields={"consecutiveFailuresStatsPipeline": int(by)})
 
     async def reset_stats_failures(self, user_id: UserId) -> None:
-        oid = _to_object_id(user_id)
-        await self._coll.update_one(
-            {"userId": oid},
-            {"$set": {"consecutiveFailuresStatsPipeline": 0, "updatedAt": datetime.utcnow()}},
-            upsert=False
-        )
+        await self.atomic_update(user_id, set_fields={"consecutiveFailuresStatsPipeline": 0}, upsert=False)
 
     # -----------------------
     # Convenience atomic operations — EMBEDDINGS
     # -----------------------
-
     async def mark_embeddings_started(self, user_id: UserId, started_at: Any) -> None:
-        oid = _to_object_id(user_id)
-        await self._coll.update_one(
-            {"userId": oid},
-            {
-                "$set": {
-                    "isEmbeddingsPipelineRunning": True,
-                    "lastEmbeddingsPipelineStartedAt": started_at,
-                    "updatedAt": datetime.utcnow()
-                }
-            },
-            upsert=True
+        await self.atomic_update(
+            user_id,
+            set_fields={"isEmbeddingsPipelineRunning": True, "lastEmbeddingsPipelineStartedAt": started_at},
         )
 
-
     async def mark_embeddings_finished(self, user_id: UserId, finished_at: Any, success: bool) -> None:
-        oid = _to_object_id(user_id)
-
+        set_fields: Dict[str, Any] = {"isEmbeddingsPipelineRunning": False, "lastEmbeddingsPipelineFinishedAt": finished_at}
         if success:
-            update = {
-                "$set": {
-                    "isEmbeddingsPipelineRunning": False,
-                    "lastEmbeddingsPipelineFinishedAt": finished_at,
-                    "consecutiveFailuresEmbeddingsPipeline": 0,
-                    "updatedAt": datetime.utcnow()
-                }
-            }
-        else:
-            update = {
-                "$set": {
-                    "isEmbeddingsPipelineRunning": False,
-                    "lastEmbeddingsPipelineFinishedAt": finished_at,
-                    "updatedAt": datetime.utcnow()
-                },
-                "$inc": {"consecutiveFailuresEmbeddingsPipeline": 1}
-            }
-
-        await self._coll.update_one({"userId": oid}, update, upsert=True)
-
-
-    async def increment_embeddings_failures(self, user_id: UserId, by: int = 1) -> None:
-        oid = _to_object_id(user_id)
-        await self._coll.update_one(
-            {"userId": oid},
-            {
-                "$inc": {"consecutiveFailuresEmbeddingsPipeline": int(by)},
-                "$set": {"updatedAt": datetime.utcnow()}
-            },
-            upsert=True
+            set_fields["consecutiveFailuresEmbeddingsPipeline"] = 0
+        await self.atomic_update(
+            user_id,
+            set_fields=set_fields,
+            inc_fields=None if success else {"consecutiveFailuresEmbeddingsPipeline": 1},
         )
 
+    async def increment_embeddings_failures(self, user_id: UserId, by: int = 1) -> None:
+        await self.atomic_update(user_id, set_fields={}, inc_fields={"consecutiveFailuresEmbeddingsPipeline": int(by)})
 
     async def reset_embeddings_failures(self, user_id: UserId) -> None:
-        oid = _to_object_id(user_id)
-        await self._coll.update_one(
-            {"userId": oid},
-            {
-                "$set": {
-                    "consecutiveFailuresEmbeddingsPipeline": 0,
-                    "updatedAt": datetime.utcnow()
-                }
-            },
-            upsert=False
-        )
+        await self.atomic_update(user_id, set_fields={"consecutiveFailuresEmbeddingsPipeline": 0}, upsert=False)
@@ -1,32 +1,81 @@
 # src/adapters/outbound/mongodb/video_repository.py
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Dict, Any, Union
 
 from bson import ObjectId
+from pymongo import UpdateOne, ReturnDocument
+from pymongo.errors import BulkWriteError
+from pymongo.write_concern import WriteConcern
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+# logging
+import logging
 
 from domain.entities.video import Video, TranscriptSegment
-from domain.ports.outbound.mongodb.video_repository_port import VideoRepositoryPort
+from domain.ports.outbound.mongodb.video_repository_port import VideoRepositoryPort, VideoId
+from domain.ports.outbound.mongodb.user_repository_port import UserId
+
+# Specific logger for this module
+logger = logging.getLogger(__name__)
+
+# partial index backing find_videos_pending_tweets (see port contract)
+PENDING_TWEETS_INDEX_NAME = "tweetsGenerated_1_createdAt_-1"
+
 
-# Importa sólo la instancia de DB, no la configuración
-from infrastructure.mongodb import db  
+def _to_object_id(value: Union[str, ObjectId]) -> ObjectId:
+    # fast path: ids already parsed upstream skip ObjectId's hex validation
+    return value if isinstance(value, ObjectId) else ObjectId(value)
+
+
+def _projection(fields: Optional[List[str]]) -> Optional[Dict[str, int]]:
+    # only fetch the requested fields (smaller documents over the wire); None = full document
+    return {f: 1 for f in fields} if fields else None
 
 
 class MongoVideoRepository(VideoRepositoryPort):
-    def __init__(self, database=None):
-        if database is not None:
-            self._coll = database.get_collection("videos")
-        else:
-            self._coll = db.get_collection("videos")
+    def __init__(self, database: AsyncIOMotorDatabase, write_concern: Optional[WriteConcern] = None):
+        # write_concern=None keeps the database/URI default (w=majority)
+        self._coll = database.get_collection("videos", write_concern=write_concern)
 
     async def save(self, video: Video) -> str:
         doc = self._entity_to_doc(video)
         result = await self._coll.insert_one(doc)
         return str(result.inserted_id)
 
-    async def find_by_id(self, video_id: str) -> Optional[Video]:
-        doc = await self._coll.find_one({"_id": ObjectId(video_id)})
-        return self._doc_to_entity(doc) if doc else None
+    async def save_many(self, videos: List[Video], batch_size: int = 500) -> List[Optional[str]]:
+        if not videos:
+            return []
+
+        inserted_ids: List[Optional[str]] = []
+        for start in range(0, len(videos), batch_size):
+            docs = [self._entity_to_doc(video) for video in videos[start:start + batch_size]]
+            failed_indexes = set()
+            try:
+                await self._coll.insert_many(docs, ordered=False)
+            except BulkWriteError as exc:
+                # unordered: every other document of the batch was inserted (insert_many set their _id client-side)
+                write_errors = exc.details.get("writeErrors", [])
+                failed_indexes = {error["index"] for error in write_errors}
+                logger.warning("%s of %s videos not inserted (first error: %s)", len(failed_indexes), len(docs), write_errors[0].get("errmsg") if write_errors else None, extra={"class": self.__class__.__name__})
+            inserted_ids.extend(None if index in failed_indexes else str(doc["_id"]) for index, doc in enumerate(docs))
+        return inserted_ids
+
+    async def find_by_id(self, video_id: VideoId, fields: Optional[List[str]] = None) -> Optional[Union[Video, Dict[str, Any]]]:
+        doc = await self._coll.find_one({"_id": _to_object_id(video_id)}, projection=_projection(fields))
+        if not doc:
+            return None
+        return doc if fields else self._doc_to_entity(doc)
+    
+    async def find_by_ids(self, video_ids: List[VideoId]) -> List[Video]:
+        if not video_ids:
+            return []
+
+        cursor = self._coll.find({"_id": {"$in": [_to_object_id(video_id) for video_id in video_ids]}})
+        docs = await cursor.to_list(length=len(video_ids))
+        # preserve input ordering
+        docs_by_id = {str(doc["_id"]): doc for doc in docs}
+        return [self._doc_to_entity(docs_by_id[str(video_id)]) for video_id in video_ids if str(video_id) in docs_by_id]
     
     async def find_by_youtube_video_id(self, youtube_video_id: str) -> Optional[Video]:
         """
@@ -35,41 +84,108 @@ class MongoVideoRepository(VideoRepositoryPort):
         doc = await self._coll.find_one({"youtubeVideoId": youtube_video_id})
         return self._doc_to_entity(doc) if doc else None
 
-    async def find_by_youtube_video_id_and_user_id(self, youtube_video_id: str, user_id: str) -> Optional[Video]:
+    async def find_by_youtube_video_id_and_user_id(self, youtube_video_id: str, user_id: UserId) -> Optional[Video]:
         """
         Fetch one video by its YouTube video ID and user ID.
         """
         query = {
             "youtubeVideoId": youtube_video_id,
-            "userId": ObjectId(user_id)
+            "userId": _to_object_id(user_id)
         }
         doc = await self._coll.find_one(query)
         return self._doc_to_entity(doc) if doc else None
 
     async def find_by_channel(
-        self, channel_id: str, limit: int = 50, offset: int = 0
-    ) -> List[Video]:
+        self, channel_id: str, limit: int = 50, offset: int = 0, fields: Optional[List[str]] = None
+    ) -> List[Union[Video, Dict[str, Any]]]:
         cursor = (
             self._coll
-            .find({"channelId": ObjectId(channel_id)})
+            .find({"channelId": ObjectId(channel_id)}, projection=_projection(fields))
             .sort("createdAt", -1)
             .skip(offset)
             .limit(limit)
         )
+        if fields:
+            return [doc async for doc in cursor]
         return [self._doc_to_entity(doc) async for doc in cursor]
 
-    async def find_videos_pending_tweets(self, limit: int = 50) -> List[Video]:
-        cursor = self._coll.find({"tweetsGenerated": False}).limit(limit)
+    async def find_videos_pending_tweets(self, limit: int = 50, fields: Optional[List[str]] = None) -> List[Union[Video, Dict[str, Any]]]:
+        cursor = (
+            self._coll
+            .find({"tweetsGenerated": False}, projection=_projection(fields))
+            .hint(PENDING_TWEETS_INDEX_NAME)
+            .sort("createdAt", -1)
+            .limit(limit)
+        )
+        if fields:
+            return [doc async for doc in cursor]
         return [self._doc_to_entity(doc) async for doc in cursor]
 
+    async def ensure_indexes(self) -> None:
+        await self._coll.create_index(
+            [("tweetsGenerated", 1), ("createdAt", -1)],
+            name=PENDING_TWEETS_INDEX_NAME,
+            partialFilterExpression={"tweetsGenerated": False},
+            background=True,
+        )
+
+        # self-check: the pending-tweets query must be an index scan, never a COLLSCAN
+        try:
+            explain = await (
+                self._coll
+                .find({"tweetsGenerated": False})
+                .hint(PENDING_TWEETS_INDEX_NAME)
+                .sort("createdAt", -1)
+                .limit(1)
+                .explain()
+            )
+            stages = []
+            plan = explain.get("queryPlanner", {}).get("winningPlan", {})
+            while plan:
+                stages.append(plan.get("stage"))
+                plan = plan.get("inputStage")
+            log = logger.info if "IXSCAN" in stages else logger.warning
+            log("find_videos_pending_tweets winning plan: %s", " <- ".join(str(stage) for stage in stages), extra={"class": self.__class__.__name__})
+        except Exception as e:
+            logger.warning("Could not explain find_videos_pending_tweets plan: %s", str(e), extra={"class": self.__class__.__name__})
+
     async def update(self, video: Video) -> None:
         doc = self._entity_to_doc(video)
         await self._coll.update_one(
-            {"_id": ObjectId(video.id)}, {"$set": doc}
+            {"_id": _to_object_id(video.id)}, {"$set": doc}
         )
 
-    async def delete(self, video_id: str) -> None:
-        await self._coll.delete_one({"_id": ObjectId(video_id)})
+    async def update_and_return(self, video: Video) -> Optional[Video]:
+        doc = await self._coll.find_one_and_update(
+            {"_id": _to_object_id(video.id)},
+            {"$set": self._entity_to_doc(video)},
+            return_document=ReturnDocument.AFTER,
+        )
+        return self._doc_to_entity(doc) if doc else None
+
+    async def update_many(self, videos: List[Video], batch_size: int = 500) -> int:
+        if not videos:
+            return 0
+
+        modified = 0
+        for start in range(0, len(videos), batch_size):
+            ops = [
+                UpdateOne({"_id": _to_object_id(video.id)}, {"$set": self._entity_to_doc(video)})
+                for video in videos[start:start + batch_size]
+            ]
+            result = await self._coll.bulk_write(ops, ordered=False)
+            modified += result.modified_count
+        return modified
+
+    async def delete(self, video_id: VideoId) -> None:
+        await self._coll.delete_one({"_id": _to_object_id(video_id)})
+
+    async def delete_many(self, video_ids: List[VideoId]) -> int:
+        if not video_ids:
+            return 0
+
+        result = await self._coll.delete_many({"_id": {"$in": [_to_object_id(video_id) for video_id in video_ids]}})
+        return result.deleted_count
 
     def _doc_to_entity(self, doc: dict) -> Video:
         return Video(
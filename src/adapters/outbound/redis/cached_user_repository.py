@@ -0,0 +1,305 @@
+# src/adapters/outbound/redis/cached_user_repository.py
+
+import hashlib
+import msgpack
+from datetime import datetime
+from typing import AsyncIterator, Callable, Optional, List, Dict, Any, Tuple, Union
+
+# logging
+import logging
+
+from domain.entities.user import User, UserTwitterCredentials, TweetFetchSortOrder
+from domain.entities.channel import Channel
+from domain.value_objects.pipeline_transition import PipelineName
+from domain.value_objects.scheduler_config import SchedulerConfig
+from domain.ports.outbound.mongodb.user_repository_port import UserRepositoryPort, UserId
+
+from infrastructure.security.encription import encrypt_value, decrypt_value
+
+# Specific logger for this module
+logger = logging.getLogger(__name__)
+
+
+class CachedUserRepository(UserRepositoryPort):
+    """
+    Read-aside Redis cache decorator for any UserRepositoryPort implementation.
+    - The full user payload is stored once under "user:id:{id}".
+    - "user:email:{sha1}" and "user:username:{sha1}" only store the user id (pointer keys).
+    - Mutations delete "user:id:{id}"; stale pointers are detected on read (payload must match the lookup value).
+    - Twitter credentials stay encrypted inside the cached payload.
+    - Payloads are encoded with msgpack by default; `serialize`/`deserialize` can be injected.
+    - Any Redis error falls back to the inner repository.
+    """
+
+    def __init__(
+        self,
+        inner: UserRepositoryPort,
+        redis,
+        ttl_seconds: int = 60,
+        serialize: Optional[Callable[[Dict[str, Any]], bytes]] = None,
+        deserialize: Optional[Callable[[bytes], Dict[str, Any]]] = None,
+    ):
+        self._inner = inner
+        self._redis = redis
+        self._ttl_seconds = ttl_seconds
+        self._serialize = serialize or _msgpack_dumps
+        self._deserialize = deserialize or _msgpack_loads
+
+    # ---------------------------------------------------------
+    # Basic CRUD (write-through to inner + invalidation)
+    # ---------------------------------------------------------
+
+    async def save(self, user: User) -> str:
+        return await self._inner.save(user)
+
+    async def update(self, user: User) -> None:
+        await self._inner.update(user)
+        await self._invalidate(user.id)
+
+    async def update_and_return(self, user: User) -> Optional[User]:
+        updated = await self._inner.update_and_return(user)
+        await self._invalidate(user.id)
+        if updated is not None:
+            await self._store(updated)
+        return updated
+
+    async def delete(self, user_id: UserId) -> None:
+        await self._inner.delete(user_id)
+        await self._invalidate(user_id)
+
+    async def delete_all(self) -> int:
+        deleted = await self._inner.delete_all()
+        await self._flush()
+        return deleted
+
+    async def truncate(self) -> None:
+        await self._inner.truncate()
+        await self._flush()
+
+    # ---------------------------------------------------------
+    # Retrieval operations (read-aside)
+    # ---------------------------------------------------------
+
+    async def find_by_id(self, user_id: UserId, fields: Optional[List[str]] = None) -> Optional[Union[User, Dict[str, Any]]]:
+        if fields:
+            # projected reads are already cheap and not cacheable as entities
+            return await self._inner.find_by_id(user_id, fields=fields)
+
+        user = await self._get_by_id_key(user_id)
+        if user is not None:
+            return user
+
+        user = await self._inner.find_by_id(user_id)
+        if user is not None:
+            await self._store(user)
+        return user
+
+    async def find_by_ids(self, user_ids: List[UserId]) -> List[User]:
+        return await self._inner.find_by_ids(user_ids)
+
+    async def find_all(self, fields: Optional[List[str]] = None) -> List[Union[User, Dict[str, Any]]]:
+        return await self._inner.find_all(fields=fields)
+
+    async def iter_all(self, batch_size: int = 500, fields: Optional[List[str]] = None) -> AsyncIterator[Union[User, Dict[str, Any]]]:
+        async for user in self._inner.iter_all(batch_size=batch_size, fields=fields):
+            yield user
+
+    async def iter_scheduler_users(self, batch_size: int = 500, due_pipeline: Optional[PipelineName] = None, now: Optional[datetime] = None) -> AsyncIterator[User]:
+        # partial entities → never stored in the cache
+        async for user in self._inner.iter_scheduler_users(batch_size=batch_size, due_pipeline=due_pipeline, now=now):
+            yield user
+
+    async def iter_scheduler_users_with_channels(self, batch_size: int = 500, due_pipeline: Optional[PipelineName] = None, now: Optional[datetime] = None) -> AsyncIterator[Tuple[User, List[Channel]]]:
+        async for user, channels in self._inner.iter_scheduler_users_with_channels(batch_size=batch_size, due_pipeline=due_pipeline, now=now):
+            yield user, channels
+
+    async def find_by_username(self, username: str) -> Optional[User]:
+        user = await self._get_by_pointer(self._username_key(username))
+        if user is not None and user.username == username:
+            return user
+
+        user = await self._inner.find_by_username(username)
+        if user is not None:
+            await self._store(user)
+        return user
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        user = await self._get_by_pointer(self._email_key(email))
+        if user is not None and user.email == email:
+            return user
+
+        user = await self._inner.get_by_email(email)
+        if user is not None:
+            await self._store(user)
+        return user
+
+    # ---------------------------------------------------------
+    # Password / Twitter credentials (write-through + invalidation)
+    # ---------------------------------------------------------
+
+    async def update_password(self, user_id: UserId, hashed_password: str) -> None:
+        await self._inner.update_password(user_id, hashed_password)
+        await self._invalidate(user_id)
+
+    async def update_twitter_credentials(self, user_id: UserId, creds: UserTwitterCredentials) -> None:
+        await self._inner.update_twitter_credentials(user_id, creds)
+        await self._invalidate(user_id)
+
+    # ---------------------------------------------------------
+    # Cache helpers
+    # ---------------------------------------------------------
+
+    @staticmethod
+    def _id_key(user_id: UserId) -> str:
+        return f"user:id:{user_id}"
+
+    @staticmethod
+    def _email_key(email: str) -> str:
+        return f"user:email:{hashlib.sha1(email.encode()).hexdigest()}"
+
+    @staticmethod
+    def _username_key(username: str) -> str:
+        return f"user:username:{hashlib.sha1(username.encode()).hexdigest()}"
+
+    async def _get_by_id_key(self, user_id: UserId) -> Optional[User]:
+        try:
+            raw = await self._redis.get(self._id_key(user_id))
+            return self._cache_dict_to_entity(self._deserialize(raw)) if raw else None
+        except Exception as e:
+            logger.warning("Redis cache read failed: %s", str(e), extra={"class": self.__class__.__name__})
+            return None
+
+    async def _get_by_pointer(self, pointer_key: str) -> Optional[User]:
+        try:
+            user_id = await self._redis.get(pointer_key)
+        except Exception as e:
+            logger.warning("Redis cache read failed: %s", str(e), extra={"class": self.__class__.__name__})
+            return None
+        if not user_id:
+            return None
+        return await self._get_by_id_key(user_id.decode() if isinstance(user_id, bytes) else user_id)
+
+    async def _store(self, user: User) -> None:
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.setex(self._id_key(user.id), self._ttl_seconds, self._serialize(self._entity_to_cache_dict(user)))
+                if user.email:
+                    pipe.setex(self._email_key(user.email), self._ttl_seconds, user.id)
+                if user.username:
+                    pipe.setex(self._username_key(user.username), self._ttl_seconds, user.id)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("Redis cache write failed: %s", str(e), extra={"class": self.__class__.__name__})
+
+    async def _flush(self) -> None:
+        try:
+            keys = [key async for key in self._redis.scan_iter(match="user:*")]
+            if keys:
+                await self._redis.delete(*keys)
+        except Exception as e:
+            logger.warning("Redis cache flush failed: %s", str(e), extra={"class": self.__class__.__name__})
+
+    async def _invalidate(self, user_id: Optional[str]) -> None:
+        if not user_id:
+            return
+        try:
+            await self._redis.delete(self._id_key(user_id))
+        except Exception as e:
+            logger.warning("Redis cache invalidation failed: %s", str(e), extra={"class": self.__class__.__name__})
+
+    # ---------------------------------------------------------
+    # Mapping helpers
+    # ---------------------------------------------------------
+
+    def _cache_dict_to_entity(self, data: Dict[str, Any]) -> User:
+        creds = data.get("twitterCredentials")
+        twitter_creds = None
+        if creds:
+            twitter_creds = UserTwitterCredentials(
+                oauth1_access_token=decrypt_value(creds["oauth1AccessToken"]) if creds.get("oauth1AccessToken") else None,
+                oauth1_access_token_secret=decrypt_value(creds["oauth1AccessTokenSecret"]) if creds.get("oauth1AccessTokenSecret") else None,
+                oauth2_access_token=decrypt_value(creds["oauth2AccessToken"]) if creds.get("oauth2AccessToken") else None,
+                oauth2_access_token_expires_at=_parse_dt(creds.get("oauth2AccessTokenExpiresAt")),
+                oauth2_refresh_token=decrypt_value(creds["oauth2RefreshToken"]) if creds.get("oauth2RefreshToken") else None,
+                oauth2_refresh_token_expires_at=_parse_dt(creds.get("oauth2RefreshTokenExpiresAt")),
+                oauth2_state=creds.get("oauth2State"),
+                screen_name=creds.get("screenName"),
+            )
+
+        sc = data.get("schedulerConfig")
+        scheduler_config = SchedulerConfig(**sc) if sc else None
+
+        return User(
+            id=data["id"],
+            username=data["username"],
+            email=data.get("email"),
+            hashed_password=data.get("hashedPassword"),
+            is_active=data.get("isActive", True),
+            openai_api_key=data.get("openaiApiKey"),
+            twitter_credentials=twitter_creds,
+            scheduler_config=scheduler_config,
+            max_tweets_to_fetch_from_db=data.get("maxTweetsToFetchFromDB", 10),
+            max_tweets_to_publish=data.get("maxTweetsToPublish", 5),
+            tweet_fetch_sort_order=TweetFetchSortOrder(data["tweetFetchSortOrder"]) if data.get("tweetFetchSortOrder") else None,
+            created_at=_parse_dt(data.get("createdAt")),
+            updated_at=_parse_dt(data.get("updatedAt")),
+        )
+
+    def _entity_to_cache_dict(self, user: User) -> Dict[str, Any]:
+        creds = user.twitter_credentials
+        sc = user.scheduler_config
+        return {
+            "id": user.id,
+            "username": user.username,
+            "email": user.email,
+            "hashedPassword": user.hashed_password,
+            "isActive": user.is_active,
+            "openaiApiKey": user.openai_api_key,
+            "twitterCredentials": {
+                "oauth1AccessToken": encrypt_value(creds.oauth1_access_token) if creds.oauth1_access_token else None,
+                "oauth1AccessTokenSecret": encrypt_value(creds.oauth1_access_token_secret) if creds.oauth1_access_token_secret else None,
+                "oauth2AccessToken": encrypt_value(creds.oauth2_access_token) if creds.oauth2_access_token else None,
+                "oauth2AccessTokenExpiresAt": _format_dt(creds.oauth2_access_token_expires_at),
+                "oauth2RefreshToken": encrypt_value(creds.oauth2_refresh_token) if creds.oauth2_refresh_token else None,
+                "oauth2RefreshTokenExpiresAt": _format_dt(creds.oauth2_refresh_token_expires_at),
+                "oauth2State": creds.oauth2_state,
+                "screenName": creds.screen_name,
+            } if creds else None,
+            "schedulerConfig": {
+                "ingestion_pipeline_frequency_minutes": sc.ingestion_pipeline_frequency_minutes,
+                "publishing_pipeline_frequency_minutes": sc.publishing_pipeline_frequency_minutes,
+                "stats_pipeline_frequency_minutes": sc.stats_pipeline_frequency_minutes,
+                "embeddings_pipeline_frequency_minutes": sc.embeddings_pipeline_frequency_minutes,
+                "is_ingestion_pipeline_enabled": sc.is_ingestion_pipeline_enabled,
+                "is_publishing_pipeline_enabled": sc.is_publishing_pipeline_enabled,
+                "is_stats_pipeline_enabled": sc.is_stats_pipeline_enabled,
+                "is_embeddings_pipeline_enabled": sc.is_embeddings_pipeline_enabled,
+            } if sc else None,
+            "maxTweetsToFetchFromDB": user.max_tweets_to_fetch_from_db,
+            "maxTweetsToPublish": user.max_tweets_to_publish,
+            "tweetFetchSortOrder": user.tweet_fetch_sort_order.value if user.tweet_fetch_sort_order else None,
+            "createdAt": _format_dt(user.created_at),
+            "updatedAt": _format_dt(user.updated_at),
+        }
+
+
+def _format_dt(value: Optional[datetime]) -> Optional[str]:
+    # oauth2 expiry fields may arrive as raw strings from env (bootstrap user), keep them as-is
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _parse_dt(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return value
+
+
+def _msgpack_dumps(data: Dict[str, Any]) -> bytes:
+    return msgpack.packb(data, use_bin_type=True)
+
+
+def _msgpack_loads(raw: bytes) -> Dict[str, Any]:
+    return msgpack.unpackb(raw, raw=False)
@@ -0,0 +1,321 @@
+# src/adapters/outbound/redis/cached_video_repository.py
+
+import msgpack
+from cachetools import TTLCache
+from datetime import datetime
+from typing import Callable, Iterable, List, Optional, Dict, Any, Set, Tuple, Union
+
+# logging
+import logging
+
+from domain.entities.video import Video, TranscriptSegment
+from domain.ports.outbound.mongodb.video_repository_port import VideoRepositoryPort, VideoId
+from domain.ports.outbound.mongodb.user_repository_port import UserId
+
+# Specific logger for this module
+logger = logging.getLogger(__name__)
+
+# in-process cache sentinels: "key not cached" vs "cached negative result (video does not exist)"
+_MISSING = object()
+_TOMBSTONE = object()
+
+
+class CachedVideoRepository(VideoRepositoryPort):
+    """
+    Read-aside Redis cache decorator for any VideoRepositoryPort implementation.
+    - The full video payload is stored once under "video:id:{id}".
+    - "video:yt:{youtube_video_id}" and "video:yt:{youtube_video_id}:user:{user_id}" only store the video id (pointer keys).
+    - Mutations delete "video:id:{id}"; stale pointers are detected on read (payload must match the lookup values).
+    - Payloads are encoded with msgpack by default; `serialize`/`deserialize` can be injected.
+    - Any Redis error falls back to the inner repository.
+    - YouTube-id lookups (ingestion dedup) are also answered from a small in-process TTLCache,
+      including negative results, so repeated checks of the same id skip Redis and Mongo.
+      It holds the cache dict (not the entity): every hit rebuilds a fresh Video, so callers mutating it never alter the cache.
+    """
+
+    def __init__(
+        self,
+        inner: VideoRepositoryPort,
+        redis,
+        ttl_seconds: int = 3600,
+        serialize: Optional[Callable[[Dict[str, Any]], bytes]] = None,
+        deserialize: Optional[Callable[[bytes], Dict[str, Any]]] = None,
+        local_cache_maxsize: int = 10000,
+        local_cache_ttl_seconds: int = 60,
+    ):
+        self._inner = inner
+        self._redis = redis
+        self._ttl_seconds = ttl_seconds
+        self._serialize = serialize or _msgpack_dumps
+        self._deserialize = deserialize or _msgpack_loads
+
+        # (youtube_video_id,) or (youtube_video_id, user_id) -> cache dict | _TOMBSTONE
+        # (no lock: the local cache helpers are sync, nothing awaits inside them)
+        self._local_cache: TTLCache = TTLCache(maxsize=local_cache_maxsize, ttl=local_cache_ttl_seconds)
+        # youtube_video_id / video id -> local cache keys, so evictions don't scan the whole cache
+        # (may keep keys already expired from the TTLCache: pruned when it grows past the cache size)
+        self._local_keys_by_youtube_id: Dict[str, Set[Tuple[str, ...]]] = {}
+        self._local_keys_by_video_id: Dict[str, Set[Tuple[str, ...]]] = {}
+        self._local_hits = 0
+        self._local_misses = 0
+
+    # ---------------------------------------------------------
+    # Writes (write-through to inner + invalidation)
+    # ---------------------------------------------------------
+
+    async def save(self, video: Video) -> str:
+        video_id = await self._inner.save(video)
+        self._local_evict(youtube_video_ids=[video.youtube_video_id])
+        return video_id
+
+    async def save_many(self, videos: List[Video], batch_size: int = 500) -> List[Optional[str]]:
+        video_ids = await self._inner.save_many(videos, batch_size=batch_size)
+        self._local_evict(youtube_video_ids=[video.youtube_video_id for video in videos])
+        return video_ids
+
+    async def update(self, video: Video) -> None:
+        await self._inner.update(video)
+        await self._invalidate([video.id])
+        self._local_evict(youtube_video_ids=[video.youtube_video_id])
+
+    async def update_and_return(self, video: Video) -> Optional[Video]:
+        updated = await self._inner.update_and_return(video)
+        await self._invalidate([video.id])
+        self._local_evict(youtube_video_ids=[video.youtube_video_id])
+        if updated is not None:
+            await self._store(updated)
+        return updated
+
+    async def update_many(self, videos: List[Video], batch_size: int = 500) -> int:
+        modified = await self._inner.update_many(videos, batch_size=batch_size)
+        await self._invalidate([video.id for video in videos])
+        self._local_evict(youtube_video_ids=[video.youtube_video_id for video in videos])
+        return modified
+
+    async def delete(self, video_id: VideoId) -> None:
+        await self._inner.delete(video_id)
+        await self._invalidate([video_id])
+        self._local_evict(video_ids=[video_id])
+
+    async def delete_many(self, video_ids: List[VideoId]) -> int:
+        deleted = await self._inner.delete_many(video_ids)
+        await self._invalidate(video_ids)
+        self._local_evict(video_ids=video_ids)
+        return deleted
+
+    # ---------------------------------------------------------
+    # Reads (read-aside)
+    # ---------------------------------------------------------
+
+    async def find_by_id(self, video_id: VideoId, fields: Optional[List[str]] = None) -> Optional[Union[Video, Dict[str, Any]]]:
+        if fields:
+            # projected reads are already cheap and not cacheable as entities
+            return await self._inner.find_by_id(video_id, fields=fields)
+
+        video = await self._get_by_id_key(video_id)
+        if video is not None:
+            return video
+
+        video = await self._inner.find_by_id(video_id)
+        if video is not None:
+            await self._store(video)
+        return video
+
+    async def find_by_ids(self, video_ids: List[VideoId]) -> List[Video]:
+        return await self._inner.find_by_ids(video_ids)
+
+    async def find_by_youtube_video_id(self, youtube_video_id: str) -> Optional[Video]:
+        local_key = (youtube_video_id,)
+        cached = self._local_get(local_key)
+        if cached is not _MISSING:
+            return cached
+
+        video = await self._get_by_pointer(self._yt_key(youtube_video_id))
+        if video is None or video.youtube_video_id != youtube_video_id:
+            video = await self._inner.find_by_youtube_video_id(youtube_video_id)
+            if video is not None:
+                await self._store(video)
+
+        self._local_set(local_key, video)
+        return video
+
+    async def find_by_youtube_video_id_and_user_id(self, youtube_video_id: str, user_id: UserId) -> Optional[Video]:
+        local_key = (youtube_video_id, str(user_id))
+        cached = self._local_get(local_key)
+        if cached is not _MISSING:
+            return cached
+
+        video = await self._get_by_pointer(self._yt_user_key(youtube_video_id, user_id))
+        if video is None or video.youtube_video_id != youtube_video_id or video.user_id != str(user_id):
+            video = await self._inner.find_by_youtube_video_id_and_user_id(youtube_video_id, user_id)
+            if video is not None:
+                await self._store(video)
+
+        self._local_set(local_key, video)
+        return video
+
+    async def find_by_channel(self, channel_id: str, limit: int = 50, offset: int = 0, fields: Optional[List[str]] = None) -> List[Union[Video, Dict[str, Any]]]:
+        return await self._inner.find_by_channel(channel_id, limit=limit, offset=offset, fields=fields)
+
+    async def find_videos_pending_tweets(self, limit: int = 50, fields: Optional[List[str]] = None) -> List[Union[Video, Dict[str, Any]]]:
+        return await self._inner.find_videos_pending_tweets(limit=limit, fields=fields)
+
+    async def ensure_indexes(self) -> None:
+        await self._inner.ensure_indexes()
+
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Hit/miss counters of the in-process YouTube-id cache (for observability).
+        """
+        return {
+            "hits": self._local_hits,
+            "misses": self._local_misses,
+            "size": len(self._local_cache),
+            "maxsize": int(self._local_cache.maxsize),
+        }
+
+    # ---------------------------------------------------------
+    # Cache helpers
+    # ---------------------------------------------------------
+
+    @staticmethod
+    def _id_key(video_id: VideoId) -> str:
+        return f"video:id:{video_id}"
+
+    @staticmethod
+    def _yt_key(youtube_video_id: str) -> str:
+        return f"video:yt:{youtube_video_id}"
+
+    @staticmethod
+    def _yt_user_key(youtube_video_id: str, user_id: UserId) -> str:
+        return f"video:yt:{youtube_video_id}:user:{user_id}"
+
+    async def _get_by_id_key(self, video_id: VideoId) -> Optional[Video]:
+        try:
+            raw = await self._redis.get(self._id_key(video_id))
+            return self._cache_dict_to_entity(self._deserialize(raw)) if raw else None
+        except Exception as e:
+            logger.warning("Redis cache read failed: %s", str(e), extra={"class": self.__class__.__name__})
+            return None
+
+    async def _get_by_pointer(self, pointer_key: str) -> Optional[Video]:
+        try:
+            video_id = await self._redis.get(pointer_key)
+        except Exception as e:
+            logger.warning("Redis cache read failed: %s", str(e), extra={"class": self.__class__.__name__})
+            return None
+        if not video_id:
+            return None
+        return await self._get_by_id_key(video_id.decode() if isinstance(video_id, bytes) else video_id)
+
+    async def _store(self, video: Video) -> None:
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.setex(self._id_key(video.id), self._ttl_seconds, self._serialize(self._entity_to_cache_dict(video)))
+                pipe.setex(self._yt_key(video.youtube_video_id), self._ttl_seconds, video.id)
+                if video.user_id:
+                    pipe.setex(self._yt_user_key(video.youtube_video_id, video.user_id), self._ttl_seconds, video.id)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("Redis cache write failed: %s", str(e), extra={"class": self.__class__.__name__})
+
+    def _local_get(self, key: Tuple[str, ...]) -> Any:
+        value = self._local_cache.get(key, _MISSING)
+        if value is _MISSING:
+            self._local_misses += 1
+            return _MISSING
+        self._local_hits += 1
+        return None if value is _TOMBSTONE else self._cache_dict_to_entity(value)
+
+    def _local_set(self, key: Tuple[str, ...], video: Optional[Video]) -> None:
+        if len(self._local_keys_by_youtube_id) + len(self._local_keys_by_video_id) > 2 * self._local_cache.maxsize:
+            self._local_prune_index()
+
+        self._local_cache[key] = self._entity_to_cache_dict(video) if video is not None else _TOMBSTONE
+        self._local_keys_by_youtube_id.setdefault(key[0], set()).add(key)
+        if video is not None and video.id:
+            self._local_keys_by_video_id.setdefault(str(video.id), set()).add(key)
+
+    def _local_evict(self, youtube_video_ids: Iterable[str] = (), video_ids: Iterable[Optional[VideoId]] = ()) -> None:
+        keys: Set[Tuple[str, ...]] = set()
+        for youtube_video_id in youtube_video_ids:
+            keys.update(self._local_keys_by_youtube_id.pop(youtube_video_id, ()))
+        for video_id in video_ids:
+            if video_id:
+                keys.update(self._local_keys_by_video_id.pop(str(video_id), ()))
+        for key in keys:
+            self._local_cache.pop(key, None)
+
+    def _local_prune_index(self) -> None:
+        # drop index entries whose keys already expired (or were evicted) from the TTLCache
+        for index in (self._local_keys_by_youtube_id, self._local_keys_by_video_id):
+            for index_key in list(index):
+                live = {key for key in index[index_key] if key in self._local_cache}
+                if live:
+                    index[index_key] = live
+                else:
+                    del index[index_key]
+
+    async def _invalidate(self, video_ids: List[Optional[str]]) -> None:
+        keys = [self._id_key(video_id) for video_id in video_ids if video_id]
+        if not keys:
+            return
+        try:
+            await self._redis.delete(*keys)
+        except Exception as e:
+            logger.warning("Redis cache invalidation failed: %s", str(e), extra={"class": self.__class__.__name__})
+
+    # ---------------------------------------------------------
+    # Mapping helpers
+    # ---------------------------------------------------------
+
+    def _cache_dict_to_entity(self, data: Dict[str, Any]) -> Video:
+        return Video(
+            id=data["id"],
+            user_id=data.get("userId"),
+            channel_id=data["channelId"],
+            youtube_video_id=data["youtubeVideoId"],
+            title=data["title"],
+            url=data["url"],
+            transcript=data.get("transcript", ""),
+            transcript_segments=[TranscriptSegment(**seg) for seg in data.get("transcriptSegments", [])],
+            transcript_fetched_at=_parse_dt(data.get("transcriptFetchedAt")),
+            tweets_generated=data.get("tweetsGenerated", False),
+            created_at=_parse_dt(data.get("createdAt")),
+            updated_at=_parse_dt(data.get("updatedAt")),
+        )
+
+    def _entity_to_cache_dict(self, video: Video) -> Dict[str, Any]:
+        return {
+            "id": video.id,
+            "userId": video.user_id,
+            "channelId": video.channel_id,
+            "youtubeVideoId": video.youtube_video_id,
+            "title": video.title,
+            "url": video.url,
+            "transcript": video.transcript,
+            "transcriptSegments": [
+                {"start": seg.start, "duration": seg.duration, "text": seg.text}
+                for seg in video.transcript_segments
+            ],
+            "transcriptFetchedAt": _format_dt(video.transcript_fetched_at),
+            "tweetsGenerated": video.tweets_generated,
+            "createdAt": _format_dt(video.created_at),
+            "updatedAt": _format_dt(video.updated_at),
+        }
+
+
+def _format_dt(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _parse_dt(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _msgpack_dumps(data: Dict[str, Any]) -> bytes:
+    return msgpack.packb(data, use_bin_type=True)
+
+
+def _msgpack_loads(raw: bytes) -> Dict[str, Any]:
+    return msgpack.unpackb(raw, raw=False)
@@ -15,16 +15,15 @@ This module preserves the TranscriptionPort interface and is fully compatible
 with the rest of the application.
 """
 
-import inspect
 import io
 import logging
+import threading
 import asyncio
 from typing import Optional, Any, Tuple
 
 import numpy as np
 import yt_dlp
 import soundfile as sf
-import whisper
 
 from domain.ports.outbound.transcription_port import TranscriptionPort
 
@@ -40,27 +39,44 @@ class YouTubeTranscriptionClientAndroidPlayerAPI_ASR(TranscriptionPort):
         self.model_name = model_name
         self.device = device
         self._model: Optional[Any] = None
+        self._model_lock = threading.Lock()
 
         logger.info(
             "Android Player API ASR adapter initialized (model=%s device=%s)",
             self.model_name,
             self.device,
-            extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+            extra={"class": self.__class__.__name__},
         )
 
     # -------------------------------------------------------------------------
     # Whisper model loading
     # -------------------------------------------------------------------------
     def _ensure_model_loaded(self) -> None:
-        if self._model is None:
-            logger.info(
-                "Loading Whisper model",
-                extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
-            )
-            self._model = whisper.load_model(self.model_name, device=self.device)
-            logger.info(
-                "Whisper model loaded",
-                extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+        # whisper (and torch) are imported here, not at module import: processes that never hit the ASR path never pay for them
+        with self._model_lock:
+            if self._model is None:
+                logger.info(
+                    "Loading Whisper model",
+                    extra={"class": self.__class__.__name__},
+                )
+                import whisper
+                self._model = whisper.load_model(self.model_name, device=self.device)
+                logger.info(
+                    "Whisper model loaded",
+                    extra={"class": self.__class__.__name__},
+                )
+
+    async def warm_up(self) -> None:
+        """
+        Load the Whisper model in a worker thread ahead of the first transcription.
+        Failures are logged, not raised: transcribe() retries the load on demand.
+        """
+        try:
+            await asyncio.to_thread(self._ensure_model_loaded)
+        except Exception:
+            logger.exception(
+                "Whisper model warm-up failed",
+                extra={"class": self.__class__.__name__},
             )
 
     # -------------------------------------------------------------------------
@@ -70,7 +86,7 @@ class YouTubeTranscriptionClientAndroidPlayerAPI_ASR(TranscriptionPort):
         logger.info(
             "Starting Android Player API ASR transcription (video_id=%s)",
             video_id,
-            extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+            extra={"class": self.__class__.__name__},
         )
         return await asyncio.to_thread(self._transcribe_sync, video_id, language)
 
@@ -78,7 +94,6 @@ class YouTubeTranscriptionClientAndroidPlayerAPI_ASR(TranscriptionPort):
     # Sync transcription pipeline
     # -------------------------------------------------------------------------
     def _transcribe_sync(self, video_id: str, language: Optional[str]) -> Optional[str]:
-        method_name = inspect.currentframe().f_code.co_name
 
         try:
             audio_bytes = self._download_audio_stream(video_id)
@@ -86,7 +101,7 @@ class YouTubeTranscriptionClientAndroidPlayerAPI_ASR(TranscriptionPort):
                 logger.warning(
                     "No audio obtained for video %s",
                     video_id,
-                    extra={"class": self.__class__.__name__, "method": method_name},
+                    extra={"class": self.__class__.__name__},
                 )
                 return None
 
@@ -95,7 +110,7 @@ class YouTubeTranscriptionClientAndroidPlayerAPI_ASR(TranscriptionPort):
                 logger.warning(
                     "Failed to decode audio for video %s",
                     video_id,
-                    extra={"class": self.__class__.__name__, "method": method_name},
+                    extra={"class": self.__class__.__name__},
                 )
                 return None
 
@@ -105,7 +120,7 @@ class YouTubeTranscriptionClientAndroidPlayerAPI_ASR(TranscriptionPort):
                 "Running Whisper transcription (video_id=%s, sample_rate=%s)",
                 video_id,
                 sr,
-                extra={"class": self.__class__.__name__, "method": method_name},
+                extra={"class": self.__class__.__name__},
             )
 
             lang_param = language[0] if isinstance(language, (list, tuple)) and language else language
@@ -118,14 +133,14 @@ class YouTubeTranscriptionClientAndroidPlayerAPI_ASR(TranscriptionPort):
                     "ASR transcription finished (video_id=%s, chars=%d)",
                     video_id,
                     len(text),
-                    extra={"class": self.__class__.__name__, "method": method_name},
+                    extra={"class": self.__class__.__name__},
                 )
                 return text
 
             logger.warning(
                 "ASR transcription returned empty result for video %s",
                 video_id,
-                extra={"class": self.__class__.__name__, "method": method_name},
+                extra={"class": self.__class__.__name__},
             )
             return None
 
@@ -134,7 +149,7 @@ class YouTubeTranscriptionClientAndroidPlayerAPI_ASR(TranscriptionPort):
                 "Unexpected error in Android Player API ASR transcription for video %s: %s",
                 video_id,
                 str(exc),
-                extra={"class": self.__class__.__name__, "method": method_name},
+                extra={"class": self.__class__.__name__},
             )
             return None
 
@@ -146,13 +161,12 @@ class YouTubeTranscriptionClientAndroidPlayerAPI_ASR(TranscriptionPort):
         Download audio using yt-dlp with the Android player client.
         This avoids 403 errors and does not require cookies.
         """
-        method_name = inspect.currentframe().f_code.co_name
         url = f"https://www.youtube.com/watch?v={video_id}"
 
         logger.info(
             "Preparing yt-dlp Android client download (video_id=%s)",
             video_id,
-            extra={"class": self.__class__.__name__, "method": method_name},
+            extra={"class": self.__class__.__name__},
         )
 
         ytdl_opts = {
@@ -178,7 +192,7 @@ class YouTubeTranscriptionClientAndroidPlayerAPI_ASR(TranscriptionPort):
                 logger.info(
                     "Downloading audio via Android client (video_id=%s)",
                     video_id,
-                    extra={"class": self.__class__.__name__, "method": method_name},
+                    extra={"class": self.__class__.__name__},
                 )
                 info = ydl.extract_info(url, download=True)
                 audio_bytes = info.get("__data")
@@ -187,7 +201,7 @@ class YouTubeTranscriptionClientAndroidPlayerAPI_ASR(TranscriptionPort):
                 "yt-dlp Android client failed for video %s: %s",
                 video_id,
                 str(exc),
-                extra={"class": self.__class__.__name__, "method": method_name},
+                extra={"class": self.__class__.__name__},
             )
             return None
 
@@ -195,7 +209,7 @@ class YouTubeTranscriptionClientAndroidPlayerAPI_ASR(TranscriptionPort):
             logger.warning(
                 "yt-dlp Android client returned empty audio for video %s",
                 video_id,
-                extra={"class": self.__class__.__name__, "method": method_name},
+                extra={"class": self.__class__.__name__},
             )
             return None
 
@@ -203,7 +217,7 @@ class YouTubeTranscriptionClientAndroidPlayerAPI_ASR(TranscriptionPort):
             "yt-dlp Android client downloaded %d bytes of audio for video %s",
             len(audio_bytes),
             video_id,
-            extra={"class": self.__class__.__name__, "method": method_name},
+            extra={"class": self.__class__.__name__},
         )
 
         return audio_bytes
@@ -212,7 +226,6 @@ class YouTubeTranscriptionClientAndroidPlayerAPI_ASR(TranscriptionPort):
     # Audio decoding
     # -------------------------------------------------------------------------
     def _load_audio_from_bytes(self, audio_bytes: bytes) -> Tuple[Optional[np.ndarray], Optional[int]]:
-        method_name = inspect.currentframe().f_code.co_name
 
         try:
             bio = io.BytesIO(audio_bytes)
@@ -225,7 +238,7 @@ class YouTubeTranscriptionClientAndroidPlayerAPI_ASR(TranscriptionPort):
                 "Decoded audio into numpy array (samples=%d, sr=%d)",
                 data.shape[0],
                 sr,
-                extra={"class": self.__class__.__name__, "method": method_name},
+                extra={"class": self.__class__.__name__},
             )
             return data, sr
 
@@ -233,6 +246,6 @@ class YouTubeTranscriptionClientAndroidPlayerAPI_ASR(TranscriptionPort):
             logger.exception(
                 "Failed to decode audio bytes: %s",
                 str(exc),
-                extra={"class": self.__class__.__name__, "method": method_name},
+                extra={"class": self.__class__.__name__},
             )
             return None, None
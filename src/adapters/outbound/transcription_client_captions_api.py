@@ -6,7 +6,6 @@ import os
 import asyncio
 
 # logging
-import inspect
 import logging 
 
 from typing import Optional
@@ -28,11 +27,11 @@ class YouTubeTranscriptionClientOfficialCaptionsAPI(TranscriptionPort):
         self.default_language = default_language
 
         # Logging
-        logger.info("Finished OK", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+        logger.info("Finished OK", extra={"class": self.__class__.__name__})
 
 
     async def transcribe(self, video_id: str, language: Optional[str] = None) -> Optional[str]:
-        logger.info("Starting...", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+        logger.info("Starting...", extra={"class": self.__class__.__name__})
 
         lang = language or self.default_language
 
@@ -44,7 +43,7 @@ class YouTubeTranscriptionClientOfficialCaptionsAPI(TranscriptionPort):
             )
         except Exception as e:
             logger.warning("Transcript API failed: %s", str(e),
-                        extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                        extra={"class": self.__class__.__name__})
             return None
 
         if not transcript_list:
@@ -58,7 +57,7 @@ class YouTubeTranscriptionClientOfficialCaptionsAPI(TranscriptionPort):
             return None
 
         logger.info("Video transcription created successfully (youtube_video_id: %s)", video_id,
-                    extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                    extra={"class": self.__class__.__name__})
 
         return full_text
 
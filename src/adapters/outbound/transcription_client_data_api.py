@@ -4,7 +4,6 @@ Adapter that uses the YouTube Data API (googleapiclient) to list and download ca
 The adapter expects an injected `youtube_client` (googleapiclient.discovery.Resource) constructed elsewhere (e.g., with an app-owned OAuth refresh token).
 """
 
-import inspect
 import logging
 import asyncio
 from typing import Optional, Any
@@ -38,7 +37,7 @@ class YouTubeTranscriptionClientOfficialDataAPI(TranscriptionPort):
 
         logger.info(
             "YouTube Data API official client initialized",
-            extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+            extra={"class": self.__class__.__name__},
         )
 
     async def transcribe(self, video_id: str, language: Optional[str] = None) -> Optional[str]:
@@ -48,7 +47,7 @@ class YouTubeTranscriptionClientOfficialDataAPI(TranscriptionPort):
         logger.info(
             "Starting transcription retrieval (video_id=%s)",
             video_id,
-            extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+            extra={"class": self.__class__.__name__},
         )
         return await asyncio.to_thread(self._get_captions_via_data_api, video_id)
 
@@ -65,7 +64,7 @@ class YouTubeTranscriptionClientOfficialDataAPI(TranscriptionPort):
                 "captions.list HttpError for video %s: %s",
                 video_id,
                 e,
-                extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+                extra={"class": self.__class__.__name__},
             )
             return None
         except Exception as e:
@@ -73,7 +72,7 @@ class YouTubeTranscriptionClientOfficialDataAPI(TranscriptionPort):
                 "Unexpected error listing captions for video %s: %s",
                 video_id,
                 e,
-                extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+                extra={"class": self.__class__.__name__},
             )
             return None
 
@@ -82,7 +81,7 @@ class YouTubeTranscriptionClientOfficialDataAPI(TranscriptionPort):
             logger.info(
                 "No captions found for video %s",
                 video_id,
-                extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+                extra={"class": self.__class__.__name__},
             )
             return None
 
@@ -105,7 +104,7 @@ class YouTubeTranscriptionClientOfficialDataAPI(TranscriptionPort):
                 video_id,
                 caption_id,
                 e,
-                extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+                extra={"class": self.__class__.__name__},
             )
             return None
         except Exception as e:
@@ -114,7 +113,7 @@ class YouTubeTranscriptionClientOfficialDataAPI(TranscriptionPort):
                 caption_id,
                 video_id,
                 e,
-                extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+                extra={"class": self.__class__.__name__},
             )
             return None
 
@@ -21,17 +21,16 @@ Pipeline:
 All public interfaces remain unchanged.
 """
 
-import inspect
 import io
 import logging
+import threading
 import asyncio
 import os
-from typing import Optional, Any, Tuple
+from typing import TYPE_CHECKING, Optional, Any, Tuple
 
-import numpy as np
-import yt_dlp
-import soundfile as sf
-import whisper
+# numpy, soundfile and yt_dlp are imported where used (like whisper): they are only needed once the ASR fallback actually runs
+if TYPE_CHECKING:
+    import numpy as np     # annotations only
 
 from domain.ports.outbound.transcription_port import TranscriptionPort
 
@@ -47,43 +46,59 @@ class YouTubeTranscriptionClientOfficialPublicPlayerAPI_ASR(TranscriptionPort):
         self.model_name = model_name
         self.device = device
         self._model: Optional[Any] = None
+        self._model_lock = threading.Lock()
 
         logger.info(
             "ASR adapter initialized (model=%s device=%s)",
             self.model_name,
             self.device,
-            extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+            extra={"class": self.__class__.__name__},
         )
 
     def _ensure_model_loaded(self) -> None:
-        if self._model is None:
-            logger.info(
-                "Loading Whisper model",
-                extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
-            )
-            self._model = whisper.load_model(self.model_name, device=self.device)
-            logger.info(
-                "Whisper model loaded",
-                extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+        # whisper (and torch) are imported here, not at module import: processes that never hit the ASR path never pay for them
+        with self._model_lock:
+            if self._model is None:
+                logger.info(
+                    "Loading Whisper model",
+                    extra={"class": self.__class__.__name__},
+                )
+                import whisper
+                self._model = whisper.load_model(self.model_name, device=self.device)
+                logger.info(
+                    "Whisper model loaded",
+                    extra={"class": self.__class__.__name__},
+                )
+
+    async def warm_up(self) -> None:
+        """
+        Load the Whisper model in a worker thread ahead of the first transcription.
+        Failures are logged, not raised: transcribe() retries the load on demand.
+        """
+        try:
+            await asyncio.to_thread(self._ensure_model_loaded)
+        except Exception:
+            logger.exception(
+                "Whisper model warm-up failed",
+                extra={"class": self.__class__.__name__},
             )
 
     async def transcribe(self, video_id: str, language: Optional[str] = None) -> Optional[str]:
         logger.info(
             "Starting ASR transcription (video_id=%s)",
             video_id,
-            extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+            extra={"class": self.__class__.__name__},
         )
         return await asyncio.to_thread(self._transcribe_sync, video_id, language)
 
     def _transcribe_sync(self, video_id: str, language: Optional[str]) -> Optional[str]:
-        method_name = inspect.currentframe().f_code.co_name
         try:
             audio_bytes = self._download_audio_stream(video_id)
             if not audio_bytes:
                 logger.warning(
                     "No audio obtained for video %s",
                     video_id,
-                    extra={"class": self.__class__.__name__, "method": method_name},
+                    extra={"class": self.__class__.__name__},
                 )
                 return None
 
@@ -92,7 +107,7 @@ class YouTubeTranscriptionClientOfficialPublicPlayerAPI_ASR(TranscriptionPort):
                 logger.warning(
                     "Failed to decode audio for video %s",
                     video_id,
-                    extra={"class": self.__class__.__name__, "method": method_name},
+                    extra={"class": self.__class__.__name__},
                 )
                 return None
 
@@ -102,7 +117,7 @@ class YouTubeTranscriptionClientOfficialPublicPlayerAPI_ASR(TranscriptionPort):
                 "Running Whisper transcription (video_id=%s, sample_rate=%s)",
                 video_id,
                 sr,
-                extra={"class": self.__class__.__name__, "method": method_name},
+                extra={"class": self.__class__.__name__},
             )
 
             try:
@@ -111,7 +126,7 @@ class YouTubeTranscriptionClientOfficialPublicPlayerAPI_ASR(TranscriptionPort):
             except TypeError:
                 logger.exception(
                     "Model transcribe call failed due to incompatible interface",
-                    extra={"class": self.__class__.__name__, "method": method_name},
+                    extra={"class": self.__class__.__name__},
                 )
                 return None
 
@@ -128,14 +143,14 @@ class YouTubeTranscriptionClientOfficialPublicPlayerAPI_ASR(TranscriptionPort):
                     "ASR transcription finished (video_id=%s, chars=%d)",
                     video_id,
                     len(text),
-                    extra={"class": self.__class__.__name__, "method": method_name},
+                    extra={"class": self.__class__.__name__},
                 )
                 return text
 
             logger.warning(
                 "ASR transcription returned empty result for video %s",
                 video_id,
-                extra={"class": self.__class__.__name__, "method": method_name},
+                extra={"class": self.__class__.__name__},
             )
             return None
 
@@ -144,7 +159,7 @@ class YouTubeTranscriptionClientOfficialPublicPlayerAPI_ASR(TranscriptionPort):
                 "Unexpected error in ASR transcription for video %s: %s",
                 video_id,
                 str(exc),
-                extra={"class": self.__class__.__name__, "method": method_name},
+                extra={"class": self.__class__.__name__},
             )
             return None
 
@@ -158,13 +173,12 @@ class YouTubeTranscriptionClientOfficialPublicPlayerAPI_ASR(TranscriptionPort):
           - Browser-like headers (Solution 1)
           - Optional cookies.txt support (Solution 2)
         """
-        method_name = inspect.currentframe().f_code.co_name
         url = f"https://www.youtube.com/watch?v={video_id}"
 
         logger.info(
             "Preparing yt-dlp download (video_id=%s)",
             video_id,
-            extra={"class": self.__class__.__name__, "method": method_name},
+            extra={"class": self.__class__.__name__},
         )
 
         # Check for cookies.txt
@@ -175,12 +189,12 @@ class YouTubeTranscriptionClientOfficialPublicPlayerAPI_ASR(TranscriptionPort):
             logger.info(
                 "Using cookies file for yt-dlp: %s",
                 cookie_file,
-                extra={"class": self.__class__.__name__, "method": method_name},
+                extra={"class": self.__class__.__name__},
             )
         else:
             logger.info(
                 "No cookies file found; proceeding without cookies",
-                extra={"class": self.__class__.__name__, "method": method_name},
+                extra={"class": self.__class__.__name__},
             )
 
         # yt-dlp options
@@ -200,11 +214,13 @@ class YouTubeTranscriptionClientOfficialPublicPlayerAPI_ASR(TranscriptionPort):
             ytdl_opts["cookiefile"] = cookie_file
 
         try:
+            import yt_dlp
+
             with yt_dlp.YoutubeDL(ytdl_opts) as ydl:
                 logger.info(
                     "Downloading audio with yt-dlp (video_id=%s)",
                     video_id,
-                    extra={"class": self.__class__.__name__, "method": method_name},
+                    extra={"class": self.__class__.__name__},
                 )
                 info = ydl.extract_info(url, download=True)
                 audio_bytes = info.get("__data")
@@ -213,7 +229,7 @@ class YouTubeTranscriptionClientOfficialPublicPlayerAPI_ASR(TranscriptionPort):
                 "yt-dlp failed to download audio for video %s: %s",
                 video_id,
                 str(exc),
-                extra={"class": self.__class__.__name__, "method": method_name},
+                extra={"class": self.__class__.__name__},
             )
             return None
 
@@ -221,7 +237,7 @@ class YouTubeTranscriptionClientOfficialPublicPlayerAPI_ASR(TranscriptionPort):
             logger.warning(
                 "yt-dlp returned empty audio for video %s",
                 video_id,
-                extra={"class": self.__class__.__name__, "method": method_name},
+                extra={"class": self.__class__.__name__},
             )
             return None
 
@@ -229,19 +245,21 @@ class YouTubeTranscriptionClientOfficialPublicPlayerAPI_ASR(TranscriptionPort):
             "yt-dlp downloaded %d bytes of audio for video %s",
             len(audio_bytes),
             video_id,
-            extra={"class": self.__class__.__name__, "method": method_name},
+            extra={"class": self.__class__.__name__},
         )
 
         return audio_bytes
 
     # -------------------------------------------------------------------------
 
-    def _load_audio_from_bytes(self, audio_bytes: bytes) -> Tuple[Optional[np.ndarray], Optional[int]]:
+    def _load_audio_from_bytes(self, audio_bytes: bytes) -> Tuple[Optional["np.ndarray"], Optional[int]]:
         """
         Decode audio bytes into a mono float32 numpy array and return (array, sample_rate).
         """
-        method_name = inspect.currentframe().f_code.co_name
         try:
+            import numpy as np
+            import soundfile as sf
+
             bio = io.BytesIO(audio_bytes)
             data, sr = sf.read(bio, dtype="float32")
 
@@ -252,7 +270,7 @@ class YouTubeTranscriptionClientOfficialPublicPlayerAPI_ASR(TranscriptionPort):
                 "Decoded audio into numpy array (samples=%d, sr=%d)",
                 data.shape[0],
                 sr,
-                extra={"class": self.__class__.__name__, "method": method_name},
+                extra={"class": self.__class__.__name__},
             )
             return data, sr
 
@@ -260,6 +278,6 @@ class YouTubeTranscriptionClientOfficialPublicPlayerAPI_ASR(TranscriptionPort):
             logger.exception(
                 "Failed to decode audio bytes: %s",
                 str(exc),
-                extra={"class": self.__class__.__name__, "method": method_name},
+                extra={"class": self.__class__.__name__},
             )
             return None, None
@@ -6,7 +6,6 @@ import tweepy
 import random
 
 # logging
-import inspect
 import logging
 
 import config
@@ -36,8 +35,7 @@ def skip_if_debug(fn):
             logger.info(
                 "[DEBUG] Se omitió TwitterPublicationClientOAuth1 publish con args=%s, kwargs=%s",
                 args,
-                kwargs,
-                extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name}
+                kwargs
             )
             # ID of an existing valid dummy tweet
             return "2023032187466183103" #"2019141630763073856"
@@ -72,7 +70,7 @@ class TwitterPublicationClientOAuth1(TwitterPublicationPort):
         
         logger.info(
             "TwitterPublicationClientOAuth1 initialized with app credentials",
-            extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name}
+            extra={"class": self.__class__.__name__}
         )
 
         # VALIDACIÓN AUTOMÁTICA DE CREDENCIALES DE APP 
@@ -80,7 +78,7 @@ class TwitterPublicationClientOAuth1(TwitterPublicationPort):
         
         logger.info(
             "Finished OK",
-            extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name}
+            extra={"class": self.__class__.__name__}
         )
 
     
@@ -151,7 +149,7 @@ class TwitterPublicationClientOAuth1(TwitterPublicationPort):
 
         logger.info(
             "Publish finished OK",
-            extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name}
+            extra={"class": self.__class__.__name__}
         )
 
         return tweet_id
@@ -175,7 +173,7 @@ class TwitterPublicationClientOAuth1(TwitterPublicationPort):
             "Tweet published with ID: %s (tweet text: '%s')",
             tweet_id,
             text,
-            extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name}
+            extra={"class": self.__class__.__name__}
         )
 
         return tweet_id
\ No newline at end of file
@@ -1,13 +1,12 @@
 # src/adapters/outbound/twitter_publication_client_oauth2.py
 
-import aiohttp
 import logging
-import inspect
 from datetime import datetime
 
 from domain.ports.outbound.twitter_publication_port import TwitterPublicationPort
 from domain.ports.outbound.mongodb.user_repository_port import UserRepositoryPort
 from infrastructure.auth.twitter_oauth2_service import TwitterOAuth2Service
+from infrastructure.http_client import get_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +29,7 @@ class TwitterPublicationClientOAuth2(TwitterPublicationPort):
 
         logger.info(
             "TwitterPublicationClient initialized (OAuth2 User Context)",
-            extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+            extra={"class": self.__class__.__name__},
         )
 
     # ---------------------------------------------------------
@@ -71,24 +70,23 @@ class TwitterPublicationClientOAuth2(TwitterPublicationPort):
             "Content-Type": "application/json",
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(self.TWEET_URL, json=payload, headers=headers) as resp:
-                body = await resp.text()
+        async with get_http_session().post(self.TWEET_URL, json=payload, headers=headers) as resp:
+            body = await resp.text()
 
-                if resp.status != 201:
-                    logger.error(
-                        f"Failed to publish tweet: {resp.status} - {body}",
-                        extra={"user_id": user_id, "module": __name__, "method": "publish"},
-                    )
-                    raise RuntimeError(f"Twitter publish failed: {resp.status}")
+            if resp.status != 201:
+                logger.error(
+                    f"Failed to publish tweet: {resp.status} - {body}",
+                    extra={"user_id": user_id, "module": __name__, "method": "publish"},
+                )
+                raise RuntimeError(f"Twitter publish failed: {resp.status}")
 
-                data = await resp.json()
+            data = await resp.json()
 
         tweet_id = data["data"]["id"]
 
         logger.info(
             f"Tweet published OK (tweet_id={tweet_id})",
-            extra={"user_id": user_id, "class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+            extra={"user_id": user_id, "class": self.__class__.__name__},
         )
 
         return tweet_id
@@ -1,7 +1,6 @@
 # adapters/outbound/twitter_stats/twitter_stats_client_apify_apidojo_tweet_scraper.py
 
 import logging
-import inspect
 from typing import Optional
 from datetime import datetime
 
@@ -27,10 +26,10 @@ class TwitterStatsClientApifyApidojoTweetScraper(TwitterStatsPort):
         self.actor_name = "apidojo/twitter-scraper-lite"
         self.client = ApifyClient(apify_token)
 
-        logger.info("Initialized", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+        logger.info("Initialized", extra={"class": self.__class__.__name__})
 
     async def fetch_tweet_stats(self, tweet_id: str) -> Optional[TwitterStats]:
-        logger.info("Fetching tweet stats...", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+        logger.info("Fetching tweet stats...", extra={"class": self.__class__.__name__})
 
         tweet_url = f"https://x.com/dummyusername/status/{tweet_id}"
     
@@ -45,20 +44,20 @@ class TwitterStatsClientApifyApidojoTweetScraper(TwitterStatsPort):
             run = self.client.actor(self.actor_name).call(run_input=run_input)
             dataset_id = run.get("defaultDatasetId")
             if not dataset_id:
-                logger.warning("Actor run did not return a datasetId", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                logger.warning("Actor run did not return a datasetId", extra={"class": self.__class__.__name__})
                 return None
 
             # 2. Fetch dataset items
             items = list(self.client.dataset(dataset_id).iterate_items())
 
         except Exception as e:
-            logger.error("Apify request failed: %s", str(e), extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+            logger.error("Apify request failed: %s", str(e), extra={"class": self.__class__.__name__})
             return None
 
         # 3. Validate response
         # logger.warning("DEBUG RAW DATA: %s", items)
         if not items:
-            logger.warning("Unexpected Apify response format (empty dataset)", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+            logger.warning("Unexpected Apify response format (empty dataset)", extra={"class": self.__class__.__name__})
             return None
         
         raw = items[0]
@@ -92,7 +91,7 @@ class TwitterStatsClientApifyApidojoTweetScraper(TwitterStatsPort):
 
         logger.info(
             "Tweet stats fetched successfully",
-            extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+            extra={"class": self.__class__.__name__},
         )
 
         return stats
\ No newline at end of file
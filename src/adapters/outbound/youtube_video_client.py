@@ -3,11 +3,9 @@
 import os
 
 # logging
-import inspect
 import logging
 
 from typing import List
-from googleapiclient.discovery import build
 
 from domain.ports.outbound.video_source_port import VideoSourcePort, VideoMetadata
 
@@ -37,16 +35,28 @@ class YouTubeVideoClient(VideoSourcePort):
         self.api_key = api_key
         
         
-        # Construye el cliente de YouTube
-        self.youtube = build(
-            "youtube",    # servicio
-            "v3",         # versión
-            developerKey=self.api_key
-        )
+        # el cliente de YouTube se construye en el primer uso (ver propiedad youtube): build() parsea el discovery document
+        self._youtube = None
 
         # Logging
-        logger.info("Finished OK", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+        logger.info("Finished OK", extra={"class": self.__class__.__name__})
+
+
+    @property
+    def youtube(self):
+        """
+        Cliente de YouTube Data API v3, construido una sola vez en el primer uso (no al importar main).
+        """
+        if self._youtube is None:
+            # googleapiclient.discovery (httplib2, google-auth, uritemplate...) se importa aquí: procesos sin scheduler no lo cargan
+            from googleapiclient.discovery import build
 
+            self._youtube = build(
+                "youtube",    # servicio
+                "v3",         # versión
+                developerKey=self.api_key
+            )
+        return self._youtube
 
     async def fetch_new_videos(self, channel_id: str, max_videos: int = 10) -> List[VideoMetadata]:
         
@@ -57,7 +67,7 @@ class YouTubeVideoClient(VideoSourcePort):
         )
         channel_resp = channel_req.execute()
         playlist_id = channel_resp["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
-        logger.info("Video playlist retrieved for channel: %s", channel_id , extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+        logger.info("Video playlist retrieved for channel: %s", channel_id , extra={"class": self.__class__.__name__})
 
 
         # 2) Listar ítems del playlist
@@ -67,7 +77,7 @@ class YouTubeVideoClient(VideoSourcePort):
             maxResults=max_videos
         )
         pl_resp = pl_req.execute()
-        logger.info("Items from playlist retrieved for channel: %s", channel_id , extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+        logger.info("Items from playlist retrieved for channel: %s", channel_id , extra={"class": self.__class__.__name__})
 
 
         # 3) Mapear a nuestro DTO / protocolo
@@ -79,7 +89,7 @@ class YouTubeVideoClient(VideoSourcePort):
             videos.append(YouTubeVideo(videoId=vid_id, title=title, url=url))
 
         # Logging
-        logger.info("Videos retrieved: %s (out of max: %s)", len(videos), max_videos , extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
-        logger.info("Finished OK", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+        logger.info("Videos retrieved: %s (out of max: %s)", len(videos), max_videos , extra={"class": self.__class__.__name__})
+        logger.info("Finished OK", extra={"class": self.__class__.__name__})
 
         return videos
@@ -62,7 +62,7 @@ def entity_to_response_dto(entity: MasterPrompt) -> MasterPromptResponseDTO:
 # -------------------------
 # Dependency wiring
 # -------------------------
-def get_master_prompt_service() -> MasterPromptService:
+async def get_master_prompt_service() -> MasterPromptService:
     return master_prompt_service
 
 
@@ -1,8 +1,10 @@
 # src/services/auth_service.py
 
+from functools import lru_cache
 from typing import Optional
 
-from adapters.outbound.mongodb.user_repository import MongoUserRepository
+from domain.ports.outbound.mongodb.user_repository_port import UserRepositoryPort
+from application.services.dependencies import build_user_repo, build_jwt_service
 
 from infrastructure.security.password_hasher import PasswordHasher
 from infrastructure.security.jwt_service import JWTService
@@ -23,7 +25,7 @@ class AuthService:
 
     def __init__(
         self,
-        user_repo: MongoUserRepository,
+        user_repo: UserRepositoryPort,
         password_hasher: PasswordHasher,
         jwt_service: JWTService,
     ):
@@ -45,7 +47,7 @@ class AuthService:
             return None
 
         # 2. Verify password
-        if not self._password_hasher.verify(password, user.hashed_password):
+        if not await self._password_hasher.averify(password, user.hashed_password):
             return None
 
         # 3. Generate JWT
@@ -68,7 +70,7 @@ class AuthService:
         - create User entity
         - persist it
         """
-        hashed = self._password_hasher.hash(password)
+        hashed = await self._password_hasher.ahash(password)
 
         new_user = User(
             email=email,
@@ -92,7 +94,7 @@ class AuthService:
         - hash the new password
         - persist the new hashed password
         """
-        hashed = self._password_hasher.hash(new_password)
+        hashed = await self._password_hasher.ahash(new_password)
         await self._user_repo.update_password(user_id=user_id, hashed_password=hashed)
 
 
@@ -100,17 +102,23 @@ class AuthService:
 # DEPENDENCY FACTORY (Composition Root)
 # ---------------------------------------------------------
 
-def get_auth_service() -> AuthService:
+@lru_cache(maxsize=1)
+def build_auth_service() -> AuthService:
     """
-    Composition root for AuthService.
-    Instantiates dependencies using configuration-driven JWTService.
+    Composition root for AuthService (one instance per process: all its dependencies are stateless).
+    Shares the process-wide user repository and configuration-driven JWTService.
     """
-    user_repo = MongoUserRepository()
+    user_repo = build_user_repo()
     password_hasher = PasswordHasher()
-    jwt_service = JWTService()
+    jwt_service = build_jwt_service()
 
     return AuthService(
         user_repo=user_repo,
         password_hasher=password_hasher,
         jwt_service=jwt_service,
     )
+
+
+async def get_auth_service() -> AuthService:
+    # async provider: resolved on the event loop, no threadpool hop per request
+    return build_auth_service()
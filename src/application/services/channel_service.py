@@ -7,7 +7,6 @@
 
 from datetime import datetime
 from typing import Optional
-import inspect
 import logging
 
 from domain.ports.inbound.channel_port import ChannelPort
@@ -74,7 +73,7 @@ class ChannelService(ChannelPort):
                 "Error fetching channel %s during update_channel_prompt(): %s",
                 channel_id,
                 exc,
-                extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+                extra={"class": self.__class__.__name__},
             )
             raise
 
@@ -91,7 +90,7 @@ class ChannelService(ChannelPort):
                 "Error fetching user prompt %s during update_channel_prompt(): %s",
                 selected_prompt_id,
                 exc,
-                extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+                extra={"class": self.__class__.__name__},
             )
             raise
 
@@ -118,7 +117,7 @@ class ChannelService(ChannelPort):
             "Channel %s updated to use UserPrompt %s.",
             channel_id,
             selected_prompt_id,
-            extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+            extra={"class": self.__class__.__name__},
         )
 
     # -------------------------------------------------------------------------
@@ -144,7 +143,7 @@ class ChannelService(ChannelPort):
             logger.info(
                 "Channel %s has no selected_prompt_id; cannot resolve prompt.",
                 channel.id,
-                extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+                extra={"class": self.__class__.__name__},
             )
             return None
 
@@ -159,7 +158,7 @@ class ChannelService(ChannelPort):
                 channel.selected_prompt_id,
                 channel.id,
                 exc,
-                extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+                extra={"class": self.__class__.__name__},
             )
             return None
 
@@ -168,7 +167,7 @@ class ChannelService(ChannelPort):
                 "Selected user prompt %s not found for channel %s.",
                 channel.selected_prompt_id,
                 channel.id,
-                extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+                extra={"class": self.__class__.__name__},
             )
             return None
 
@@ -181,7 +180,7 @@ class ChannelService(ChannelPort):
                 user_prompt.id,
                 user_id,
                 channel.user_id,
-                extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+                extra={"class": self.__class__.__name__},
             )
             return None
 
@@ -199,7 +198,7 @@ class ChannelService(ChannelPort):
                     user_prompt.master_prompt_id,
                     user_prompt.id,
                     exc,
-                    extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+                    extra={"class": self.__class__.__name__},
                 )
                 master_prompt = None  # fallback: ignore master prompt
 
@@ -208,7 +207,7 @@ class ChannelService(ChannelPort):
                     "MasterPrompt %s referenced by UserPrompt %s not found; using only UserPrompt.",
                     user_prompt.master_prompt_id,
                     user_prompt.id,
-                    extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+                    extra={"class": self.__class__.__name__},
                 )
 
         # ---------------------------------------------------------------------
@@ -225,7 +224,7 @@ class ChannelService(ChannelPort):
                 channel.id,
                 user_prompt.id,
                 exc,
-                extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+                extra={"class": self.__class__.__name__},
             )
             return None
 
@@ -236,7 +235,7 @@ class ChannelService(ChannelPort):
             "FinalPrompt successfully resolved for channel %s using UserPrompt %s.",
             channel.id,
             user_prompt.id,
-            extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},
+            extra={"class": self.__class__.__name__},
         )
 
         return final_prompt
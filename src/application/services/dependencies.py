@@ -1,9 +1,16 @@
 # src/application/services/dependencies.py
 
+from functools import lru_cache
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
+import config
+from domain.ports.outbound.mongodb.user_repository_port import UserRepositoryPort
 from adapters.outbound.mongodb.user_repository import MongoUserRepository
+from adapters.outbound.redis.cached_user_repository import CachedUserRepository
+from infrastructure.mongodb import get_database
+from infrastructure.redis_client import get_redis_client
 from infrastructure.security.jwt_service import JWTService
 from infrastructure.auth.twitter_oauth2_service import TwitterOAuth2Service
 
@@ -12,16 +19,31 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
 # FACTORIES
-def get_user_repo() -> MongoUserRepository:
-    return MongoUserRepository()
+# Providers are `async def` so FastAPI resolves them on the event loop (sync providers are run in the threadpool
+# on every request); the stateless adapters behind them are built once per process (lru_cache'd builders).
+@lru_cache(maxsize=1)
+def build_user_repo() -> UserRepositoryPort:
+    user_repo = MongoUserRepository(database=get_database())
+    redis_client = get_redis_client()
+    if redis_client is not None:
+        return CachedUserRepository(inner=user_repo, redis=redis_client, ttl_seconds=config.REDIS_USER_CACHE_TTL_SECONDS)
+    return user_repo
+
+async def get_user_repo() -> UserRepositoryPort:
+    return build_user_repo()
 
-def get_jwt_service() -> JWTService:
+@lru_cache(maxsize=1)
+def build_jwt_service() -> JWTService:
+    # Single instance per process so its verified-token cache is shared across requests
     return JWTService()
 
+async def get_jwt_service() -> JWTService:
+    return build_jwt_service()
+
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    user_repo: MongoUserRepository = Depends(get_user_repo),
+    user_repo: UserRepositoryPort = Depends(get_user_repo),
     jwt_service: JWTService = Depends(get_jwt_service),
 ):
     """
@@ -46,8 +68,8 @@ async def get_current_user(
     return user
 
 
-def get_twitter_oauth2_service(
-    user_repo: MongoUserRepository = Depends(get_user_repo),
+async def get_twitter_oauth2_service(
+    user_repo: UserRepositoryPort = Depends(get_user_repo),
 ) -> TwitterOAuth2Service:
     """
     Provides an instance of TwitterOAuth2Service with injected UserRepository.
@@ -1,6 +1,5 @@
 # src/application/services/embeddings_pipeline_service.py
 
-import inspect
 import logging
 from datetime import datetime
 from typing import List, Optional
@@ -13,6 +12,7 @@ from domain.ports.outbound.mongodb.embedding_vector_repository_port import Embed
 from domain.ports.outbound.embedding_vector_port import EmbeddingVectorPort
 from domain.ports.outbound.mongodb.user_scheduler_runtime_status_repository_port import UserSchedulerRuntimeStatusRepositoryPort
 
+from domain.services.vector_similarity_service import VectorSimilarityService
 from domain.value_objects.embedding_vector import EmbeddingVector
 from domain.value_objects.embedding_type import EmbeddingType
 from domain.entities.tweet import Tweet
@@ -40,6 +40,7 @@ class EmbeddingsPipelineService(EmbeddingsPipelinePort):
         user_scheduler_runtime_repo: UserSchedulerRuntimeStatusRepositoryPort,
         embedding_model: str,
         tweet_max_days_back_calculate_embeddings: Optional[int] = None,
+        vector_similarity: Optional[VectorSimilarityService] = None,
     ):
         self.user_repo = user_repo
         self.tweet_repo = tweet_repo
@@ -49,97 +50,109 @@ class EmbeddingsPipelineService(EmbeddingsPipelinePort):
         self.user_scheduler_runtime_repo = user_scheduler_runtime_repo
         self.embedding_model = embedding_model
         self.tweet_max_days_back_calculate_embeddings = tweet_max_days_back_calculate_embeddings
+        self.vector_similarity = vector_similarity
 
     async def run_for_user(self, user_id: str) -> None:
         try:
             # 0. Starting pipeline
             try:
                 await self.user_scheduler_runtime_repo.mark_embeddings_started(user_id, datetime.utcnow())
-                logger.info("Starting...", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                logger.info("Starting...", extra={"class": self.__class__.__name__})
             except Exception:
-                logger.exception("Failed to mark embeddings pipeline started", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                logger.exception("Failed to mark embeddings pipeline started", extra={"class": self.__class__.__name__})
                 raise
 
-            # 1. Validate user exists
-            user = await self.user_repo.find_by_id(user_id)
+            # 1. Validate user exists (projected document: only the fields used here, no User entity / credentials decryption)
+            user = await self.user_repo.find_by_id(user_id, fields=["_id", "username"])
             if user is None:
                 raise LookupError(f"User '{user_id}' not found")
-            logger.info("User found (username: %s)", user.username, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+            logger.info("User found (username: %s)", user.get("username"), extra={"class": self.__class__.__name__})
 
             # 2. Fetch tweets of the user
             tweets: List[Tweet] = await self.tweet_repo.find_by_user(
-                user_id=user.id,
+                user_id=str(user["_id"]),
                 max_days_back=self.tweet_max_days_back_calculate_embeddings
             )
-            logger.info("Fetched %s tweets for embeddings", len(tweets), extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+            logger.info("Fetched %s tweets for embeddings", len(tweets), extra={"class": self.__class__.__name__})
 
-            # 3. Process each tweet
+            # 3. Fetch (in batch) the source videos of the tweets still missing a transcript embedding
+            video_ids = list(dict.fromkeys(
+                tweet.video_id for tweet in tweets
+                if tweet.video_id and not (tweet.embedding_refs and tweet.embedding_refs.video_transcript_id)
+            ))
+            videos_by_id = {video.id: video for video in await self.video_repo.find_by_ids(video_ids)}
+            logger.info("Fetched %s source videos for transcript embeddings", len(videos_by_id), extra={"class": self.__class__.__name__})
+
+            # 4. Process each tweet
             for index, tweet in enumerate(tweets, start=1):
-                logger.info("Processing tweet %s/%s (_id: %s)", index, len(tweets), tweet.id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                logger.info("Processing tweet %s/%s (_id: %s)", index, len(tweets), tweet.id, extra={"class": self.__class__.__name__})
 
                 # Ensure embedding_refs attribute exists
                 if tweet.embedding_refs is None:
                     tweet.embedding_refs = tweet.embedding_refs.__class__()  # TweetEmbeddingRefs()
 
-                # 3.a. Calculate embedding for tweet text
+                # 4.a. Calculate embedding for tweet text
                 if tweet.text and not tweet.embedding_refs.tweet_text_id:
                     try:
-                        logger.info("Generating embedding for tweet text...", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                        logger.info("Generating embedding for tweet text...", extra={"class": self.__class__.__name__})
                         vector = await self.embeddings_client.get_embedding(tweet.text, self.embedding_model)
 
-                        embedding = EmbeddingVector(
-                            id=None,
+                        embedding = EmbeddingVector.from_fp32(
+                            vector,
                             tweet_id=tweet.id,
                             type=EmbeddingType.TWEET_TEXT,
-                            vector=vector,
                             created_at=datetime.utcnow())
                         
                         embedding_id = await self.embeddings_repo.save(embedding)
                         tweet.embedding_refs.tweet_text_id = embedding_id
+
+                        # Keep the in-memory similarity matrices in sync (used by the growth score calculator)
+                        if self.vector_similarity is not None:
+                            self.vector_similarity.add(EmbeddingType.TWEET_TEXT.to_str(), [embedding_id], [vector])
                     except Exception:
-                        logger.exception("Failed generating embedding for tweet text (_id: %s)", tweet.id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                        logger.exception("Failed generating embedding for tweet text (_id: %s)", tweet.id, extra={"class": self.__class__.__name__})
 
-                # 3.b. Calculate embedding for video transcript
+                # 4.b. Calculate embedding for video transcript
                 if tweet.video_id and not tweet.embedding_refs.video_transcript_id:
                     try:
-                        video = await self.video_repo.find_by_id(tweet.video_id)
+                        video = videos_by_id.get(tweet.video_id)
                         if video and video.transcript:
-                            logger.info("Generating embedding for video transcript...", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                            logger.info("Generating embedding for video transcript...", extra={"class": self.__class__.__name__})
                             vector = await self.embeddings_client.get_embedding(video.transcript, self.embedding_model)
 
-                            embedding = EmbeddingVector(
-                                id=None,
+                            embedding = EmbeddingVector.from_fp32(
+                                vector,
                                 tweet_id=tweet.id,
                                 type=EmbeddingType.VIDEO_TRANSCRIPT,
-                                vector=vector,
                                 created_at=datetime.utcnow())
                             
                             embedding_id = await self.embeddings_repo.save(embedding)
                             tweet.embedding_refs.video_transcript_id = embedding_id
+
+                            if self.vector_similarity is not None:
+                                self.vector_similarity.add(EmbeddingType.VIDEO_TRANSCRIPT.to_str(), [embedding_id], [vector])
                         else:
-                            logger.info("No transcript found for video_id %s, skipping transcript embedding", tweet.video_id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                            logger.info("No transcript found for video_id %s, skipping transcript embedding", tweet.video_id, extra={"class": self.__class__.__name__})
                     except Exception:
-                        logger.exception("Failed generating embedding for video transcript (_id: %s)", tweet.id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                        logger.exception("Failed generating embedding for video transcript (_id: %s)", tweet.id, extra={"class": self.__class__.__name__})
 
-                # 3.c. Persist updated tweet
+                # 4.c. Persist updated tweet
                 try:
                     await self.tweet_repo.update(tweet)
-                    logger.info("Updated tweet embedding refs (_id: %s)", tweet.id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                    logger.info("Updated tweet embedding refs (_id: %s)", tweet.id, extra={"class": self.__class__.__name__})
                 except Exception:
-                    logger.exception("Failed updating tweet after embeddings (_id: %s)", tweet.id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                    logger.exception("Failed updating tweet after embeddings (_id: %s)", tweet.id, extra={"class": self.__class__.__name__})
 
-            # 4-a. Finishing pipeline OK
+            # 5-a. Finishing pipeline OK
             await self.user_scheduler_runtime_repo.mark_embeddings_finished(user_id, datetime.utcnow(), success=True)
-            await self.user_scheduler_runtime_repo.reset_embeddings_failures(user_id)
-            logger.info("Finished OK", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+            logger.info("Finished OK", extra={"class": self.__class__.__name__})
 
-        # 4-b. Finishing pipeline KO
+        # 5-b. Finishing pipeline KO
         except Exception:
             try:
-                await self.user_scheduler_runtime_repo.increment_embeddings_failures(user_id, by=1)
                 await self.user_scheduler_runtime_repo.mark_embeddings_finished(user_id, datetime.utcnow(), success=False)
             except Exception:
-                logger.exception("Failed updating user runtime status after embeddings pipeline error", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                logger.exception("Failed updating user runtime status after embeddings pipeline error", extra={"class": self.__class__.__name__})
 
-            logger.exception("Embeddings pipeline failed", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+            logger.exception("Embeddings pipeline failed", extra={"class": self.__class__.__name__})
             raise
@@ -5,7 +5,6 @@ from datetime import datetime
 from typing import List, Optional
 
 # logging
-import inspect
 import logging
 
 from domain.ports.inbound.ingestion_pipeline_port import IngestionPipelinePort
@@ -22,12 +21,15 @@ from domain.ports.outbound.mongodb.tweet_repository_port import TweetRepositoryP
 from domain.ports.outbound.transcription_port import TranscriptionPort
 from domain.ports.outbound.mongodb.user_scheduler_runtime_status_repository_port import UserSchedulerRuntimeStatusRepositoryPort
 
+from domain.entities.user import User
 from domain.entities.video import Video
 from domain.entities.channel import Channel
 from domain.entities.user_prompt import UserPrompt
 from domain.entities.user_prompt import PromptContent
 from domain.entities.tweet import Tweet
 from domain.entities.tweet_generation import TweetGeneration, OpenAIRequest
+from domain.value_objects.tweet_generation_response import TweetGenerationResponse
+from domain.utils.text_tokens import tokenize
 
 from application.services.channel_service import ChannelService
 
@@ -53,8 +55,6 @@ class IngestionPipelineService(IngestionPipelinePort):
         video_source: VideoSourcePort,
         video_repo: VideoRepositoryPort,
         transcription_client: TranscriptionPort,
-        transcription_client_fallback: Optional[TranscriptionPort],
-        transcription_client_fallback_2: Optional[TranscriptionPort],
         openai_client: LLMPort,
         tweet_output_guardrail_service: TweetOutputGuardrailPort,
         tweet_generation_repo: TweetGenerationRepositoryPort,
@@ -68,9 +68,7 @@ class IngestionPipelineService(IngestionPipelinePort):
         self.channel_repo = channel_repo
         self.video_source = video_source
         self.video_repo = video_repo
-        self.transcription_client = transcription_client
-        self.transcription_client_fallback: Optional[TranscriptionPort] = transcription_client_fallback
-        self.transcription_client_fallback_2: Optional[TranscriptionPort] = transcription_client_fallback_2
+        self.transcription_client = transcription_client     # primary + fallbacks chained by CompositeTranscriptionClient (composition root)
         self.openai_client = openai_client
         self.tweet_output_guardrail_service = tweet_output_guardrail_service
         self.tweet_generation_repo = tweet_generation_repo
@@ -79,48 +77,57 @@ class IngestionPipelineService(IngestionPipelinePort):
         self.channel_service = channel_service
         self.prompt_composer_service = prompt_composer_service
 
-    async def run_for_user(self, user_id: str) -> None:
+    async def run_for_user(self, user_id: str, user: Optional[User] = None, channels: Optional[List[Channel]] = None) -> None:
+        """
+        `user` / `channels` may be passed already loaded (e.g. by the scheduler's batched users → channels read),
+        in which case the per-user lookups below are skipped.
+        """
         try:
             # 0. Starting pipeline
             try:
                 await self.user_scheduler_runtime_repo.mark_ingestion_started(user_id, datetime.utcnow())
-                logger.info("Starting...", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                logger.info("Starting...", extra={"class": self.__class__.__name__})
             except Exception:
-                logger.exception("Failed to mark ingestion pipeline started", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                logger.exception("Failed to mark ingestion pipeline started", extra={"class": self.__class__.__name__})
                 raise
 
             # 1. Validate that user actually exists on the repo
-            user = await self.user_repo.find_by_id(user_id)
+            if user is None:
+                user = await self.user_repo.find_by_id(user_id)
             if user is None:
                 raise LookupError(f"User {user_id} not found")
-            logger.info("User found (username: %s)", user.username, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+            logger.info("User found (username: %s)", user.username, extra={"class": self.__class__.__name__})
 
             # 2. Fetch all channels the user is subscribed to
-            channels: List[Channel] = await self.channel_repo.find_by_user_id(user_id)
-            logger.info("%s channel/s retrieved from 'channels'", len(channels), extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+            if channels is None:
+                channels = await self.channel_repo.find_by_user_id(user_id)
+            logger.info("%s channel/s retrieved from 'channels'", len(channels), extra={"class": self.__class__.__name__})
 
             # 3. Process each channel independently
             for index, channel in enumerate(channels, start=1):
 
                 # 4. Fetch new videos for this channel
-                logger.info("Channel %s/%s - Process starting...", index, len(channels), extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
-                logger.info("Channel ID: %s / Channel name: %s", channel.id, channel.title, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
-                logger.info("Fetching max %s videos from channel %s", channel.max_videos_to_fetch_from_channel, channel.title, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                logger.info("Channel %s/%s - Process starting...", index, len(channels), extra={"class": self.__class__.__name__})
+                logger.info("Channel ID: %s / Channel name: %s", channel.id, channel.title, extra={"class": self.__class__.__name__})
+                logger.info("Fetching max %s videos from channel %s", channel.max_videos_to_fetch_from_channel, channel.title, extra={"class": self.__class__.__name__})
                 videos_meta: List[VideoMetadata] = await self.video_source.fetch_new_videos(channel.youtube_channel_id, channel.max_videos_to_fetch_from_channel)
                 
                 # extract video IDs (limit if there are a lot)
                 video_ids = [v.videoId for v in videos_meta]
                 max_videos_to_process = 20
                 video_ids_to_process = video_ids if len(video_ids) <= max_videos_to_process else video_ids[:max_videos_to_process] + ["...(+%d)" % (len(video_ids) - max_videos_to_process)]
-                logger.info("%s videos retrieved (youtubeVideoId: %s)", len(videos_meta), video_ids_to_process, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
-
-                # 5. Process each video independently
-                for index2, video_meta in enumerate(videos_meta, start=1):
-                    
-                    logger.info("Video %s/%s - Process starting...", index2, len(videos_meta), extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
-                    logger.info("Video ID: %s / Video title: %s", video_meta.videoId, video_meta.title, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                logger.info("%s videos retrieved (youtubeVideoId: %s)", len(videos_meta), video_ids_to_process, extra={"class": self.__class__.__name__})
+
+                # 5. Map DTO VideoMetadata → to domain entity Video, and persist new ones (in batch)
+                videos: List[Video] = []
+                new_videos: List[Video] = []
+                seen_youtube_video_ids = set()
+                for video_meta in videos_meta:
+                    # the source may list the same video twice: insert (and process) it only once
+                    if video_meta.videoId in seen_youtube_video_ids:
+                        continue
+                    seen_youtube_video_ids.add(video_meta.videoId)
 
-                    # 6. Map DTO VideoMetadata → to domain entity Video, and persist
                     video = await self.video_repo.find_by_youtube_video_id_and_user_id(video_meta.videoId, user_id=user_id)
                     if not video:
                         video = Video(
@@ -135,52 +142,46 @@ class IngestionPipelineService(IngestionPipelinePort):
                             created_at=datetime.utcnow(),
                             updated_at=datetime.utcnow()
                         )
-                        saved_id = await self.video_repo.save(video)
+                        new_videos.append(video)
+                    videos.append(video)
+
+                if new_videos:
+                    saved_ids = await self.video_repo.save_many(new_videos)
+                    for video, saved_id in zip(new_videos, saved_ids):
                         video.id = saved_id
-                        logger.info("Video %s saved in 'videos' (title: '%s')", video.id, video.title, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                    # videos the bulk insert rejected (e.g. duplicate key) have no id: skip them this run
+                    videos = [video for video in videos if video.id is not None]
+                    logger.info("%s new videos saved in 'videos'", sum(saved_id is not None for saved_id in saved_ids), extra={"class": self.__class__.__name__})
+
+                # 6. Process each video independently
+                for index2, video in enumerate(videos, start=1):
+                    
+                    logger.info("Video %s/%s - Process starting...", index2, len(videos), extra={"class": self.__class__.__name__})
+                    logger.info("Video ID: %s / Video title: %s", video.youtube_video_id, video.title, extra={"class": self.__class__.__name__})
 
                     # 7. If video has no transcription yet, fetch it and update the record
                     if not video.transcript_fetched_at:
                         transcript = None
 
-                        # Try primary transcription client (YouTube Captions API -timedtext-)
+                        # Transcription client chain (primary, then fallbacks in order; stops at the first non-empty transcript)
                         try:
-                            logger.info("Attempting primary transcription client for video %s", video.id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},)
                             transcript = await self.transcription_client.transcribe(video.youtube_video_id, language=['en','es'])
                         except Exception as e:
-                            logger.warning("Primary transcription client failed for video %s: %s", video.id, str(e), extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},)
-
-                        # If primary didn't return a usable transcript try first fallback, but only if client exists
-                        if self.transcription_client_fallback:
-                            if not transcript:
-                                logger.info("Primary transcription unavailable, attempting 1st fallback client for video %s", video.id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},)
-                                try:
-                                    transcript = await self.transcription_client_fallback.transcribe(video.youtube_video_id, language=['en','es'])
-                                except Exception as e:
-                                    logger.warning("First fallback transcription client failed for video %s: %s", video.id, str(e), extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},)
-
-                        # If secondary didn't return a usable transcript (or client didn't even exist), try second fallback, but only if client exists
-                        if self.transcription_client_fallback_2:                    
-                            if not transcript:
-                                logger.info("First fallback transcription client failed, attempting 2nd fallback for video %s", video.id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},)
-                                try:
-                                    transcript = await self.transcription_client_fallback_2.transcribe(video.youtube_video_id, language=['en','es'])
-                                except Exception as e:
-                                    logger.warning("Second fallback transcription client failed for video %s: %s", video.id, str(e), extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},)
+                            logger.warning("Transcription client failed for video %s: %s", video.id, str(e), extra={"class": self.__class__.__name__},)
 
                         if not transcript:
-                            logger.info("No transcription obtained for video %s after primary and 2 fallback attempts; skipping transcript persistence", video.id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},)
+                            logger.info("No transcription obtained for video %s from any transcription client; skipping transcript persistence", video.id, extra={"class": self.__class__.__name__},)
                         else:
-                            logger.info("Transcription received (%s chars) (video: %s)", len(transcript), video.id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name},)
+                            logger.info("Transcription received (%s chars) (video: %s)", len(transcript), video.id, extra={"class": self.__class__.__name__},)
                             video.transcript = transcript
                             video.transcript_fetched_at = datetime.utcnow()
                             video.updated_at = datetime.utcnow()
                         
                             # persist the updated video entity
                             await self.video_repo.update(video)
-                            logger.info("Transcription saved for video %s in 'videos'", video.id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                            logger.info("Transcription saved for video %s in 'videos'", video.id, extra={"class": self.__class__.__name__})
                     else:
-                        logger.info("Skipping transcript generation - Video already has a transcript (%s chars) (video title: %s) ", len(video.transcript), video.title, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                        logger.info("Skipping transcript generation - Video already has a transcript (%s chars) (video title: %s) ", len(video.transcript), video.title, extra={"class": self.__class__.__name__})
 
                     # 8. If video has not been used for tweet generation yet, and video has a valid transcript, then generate tweets from the video and update the record
                     if (not video.tweets_generated) and video.transcript:
@@ -189,24 +190,24 @@ class IngestionPipelineService(IngestionPipelinePort):
                         try:
                             prompt = await self.channel_service.get_channel_prompt(channel=channel, user_id=user_id)
                         except Exception as exc:
-                            logger.exception("Error resolving prompt for channel %s and user %s: %s", channel.id, user_id, exc, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                            logger.exception("Error resolving prompt for channel %s and user %s: %s", channel.id, user_id, exc, extra={"class": self.__class__.__name__})
                             continue
                         if not prompt:
-                            logger.info("No suitable prompt resolved for channel %s and user %s, skipping video %s", channel.id, user_id, video.id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                            logger.info("No suitable prompt resolved for channel %s and user %s, skipping video %s", channel.id, user_id, video.id, extra={"class": self.__class__.__name__})
                             continue
-                        logger.info("Prompt %s successfully retrieved", getattr(prompt, "id", None), extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                        logger.info("Prompt %s successfully retrieved", getattr(prompt, "id", None), extra={"class": self.__class__.__name__})
 
                         # 10. Load and prepare user and system messages for the PROMPT
                         # user message
                         prompt_user_message_with_language = self.prompt_composer_service.add_output_language(message=prompt.prompt_content.user_message, output_language=prompt.language_to_generate_tweets, position=InstructionPosition.AFTER)
                         prompt_user_message_with_objective = self.prompt_composer_service.add_objective(message=prompt_user_message_with_language, sentences=channel.tweets_to_generate_per_video, position=InstructionPosition.AFTER)
                         prompt_user_message = self.prompt_composer_service.add_transcript(message=prompt_user_message_with_objective, transcript=video.transcript, position=InstructionPosition.AFTER)
-                        logger.info("Prompt user_message loaded (+output_language +objective +transcript)", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                        logger.info("Prompt user_message loaded (+output_language +objective +transcript)", extra={"class": self.__class__.__name__})
                         # system message
                         prompt_system_message_with_objective = self.prompt_composer_service.add_objective(message="", sentences=channel.tweets_to_generate_per_video, position=InstructionPosition.BEFORE)
                         prompt_system_message_with_objective_and_length = prompt_system_message_with_objective + self.prompt_composer_service.add_output_length(message=prompt.prompt_content.system_message, tweet_length_policy=prompt.tweet_length_policy, position=InstructionPosition.BEFORE)
                         prompt_system_message = self.prompt_composer_service.add_output_language(message=prompt_system_message_with_objective_and_length, output_language=prompt.language_to_generate_tweets, position=InstructionPosition.AFTER)
-                        logger.info("Prompt system_message loaded (+objective +output_length +output_language)", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                        logger.info("Prompt system_message loaded (+objective +output_length +output_language)", extra={"class": self.__class__.__name__})
 
                         # 11. Generate raw texts (tweets) for the video
                         model = "gpt-4o"
@@ -216,29 +217,31 @@ class IngestionPipelineService(IngestionPipelinePort):
                                 prompt_system_message=prompt_system_message,
                                 model=model)
                         except Exception as e:
-                            logger.error("OpenAI tweet generation failed for video %s: %s", video.id, str(e), extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                            logger.error("OpenAI tweet generation failed for video %s: %s", video.id, str(e), extra={"class": self.__class__.__name__})
                             continue  # skip this video and move to the next one
 
                         # 12. Validate tweet output using guardrails
                         try:
+                            # map raw JSON → to structured value object (fixed schema, slotted attribute access)
+                            tweet_generation_response = TweetGenerationResponse.from_dict(json_response)
                             expected_count = channel.tweets_to_generate_per_video
                             # validate tweet count
-                            if not self.tweet_output_guardrail_service.is_count_valid(json_response, expected_count):
-                                logger.error("Tweet count validation failed for video %s", video.id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                            if not self.tweet_output_guardrail_service.is_count_valid(tweet_generation_response, expected_count):
+                                logger.error("Tweet count validation failed for video %s", video.id, extra={"class": self.__class__.__name__})
                                 continue  # skip this video and move to the next one
                             # validate tweet length policy
-                            if not self.tweet_output_guardrail_service.is_length_valid(json_response, prompt.tweet_length_policy):
-                                logger.error("Tweet length validation failed for video %s", video.id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                            if not self.tweet_output_guardrail_service.is_length_valid(tweet_generation_response, prompt.tweet_length_policy):
+                                logger.error("Tweet length validation failed for video %s", video.id, extra={"class": self.__class__.__name__})
                                 continue  # skip this video and move to the next one
                         except Exception as e:
                             # any unexpected error in guardrails should also skip the video
-                            logger.error("Tweet guardrail validation error for video %s: %s", video.id, str(e), extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                            logger.error("Tweet guardrail validation error for video %s: %s", video.id, str(e), extra={"class": self.__class__.__name__})
                             continue
 
-                        # 13. Extract tweets from JSON
-                        raw_tweets_text: List[str] = [t["text"].strip() for t in json_response.get("tweets", []) if "text" in t]
+                        # 13. Extract tweets from response
+                        raw_tweets_text: List[str] = [t.text.strip() for t in tweet_generation_response.tweets if t.text]
                         tweet_generation_ts = datetime.utcnow()
-                        logger.info("%s tweets generated for video %s", len(raw_tweets_text), video.id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                        logger.info("%s tweets generated for video %s", len(raw_tweets_text), video.id, extra={"class": self.__class__.__name__})
 
                         # 14. Persist tweet generation metadata
                         openai_req = OpenAIRequest(
@@ -258,9 +261,9 @@ class IngestionPipelineService(IngestionPipelinePort):
                             generated_at = tweet_generation_ts
                         )
                         generation_id = await self.tweet_generation_repo.save(tweet_generation)
-                        logger.info("Tweet generation %s saved in 'tweet_generations'", generation_id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                        logger.info("Tweet generation %s saved in 'tweet_generations'", generation_id, extra={"class": self.__class__.__name__})
 
-                        # 15. Map DTO raw_tweets_text List[str] → to domain entity Tweet
+                        # 15. Map DTO raw_tweets_text List[str] → to domain entity Tweet (text token sets computed once here for topic relevance)
                         tweets: List[Tweet] = [
                             Tweet(
                                 id=None,
@@ -268,6 +271,7 @@ class IngestionPipelineService(IngestionPipelinePort):
                                 video_id=video.id,
                                 generation_id=generation_id,
                                 text=text,
+                                text_tokens=tokenize(text),
                                 index_in_generation=index,
                                 published=False,
                                 created_at=tweet_generation_ts,
@@ -278,37 +282,35 @@ class IngestionPipelineService(IngestionPipelinePort):
 
                         # 16. Save Tweet entities (in batch)
                         await self.tweet_repo.save_all(tweets)
-                        logger.info("%s tweets saved in 'tweets'", len(tweets), extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})                    
+                        logger.info("%s tweets saved in 'tweets'", len(tweets), extra={"class": self.__class__.__name__})                    
 
                         # 17. Update video entity
                         video.tweets_generated = True
                         video.updated_at = datetime.utcnow()
                         await self.video_repo.update(video)
                     else:
-                        logger.info("Skipping tweet generation - Video %s already has tweets generated, or video has no transcript available", video.id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                        logger.info("Skipping tweet generation - Video %s already has tweets generated, or video has no transcript available", video.id, extra={"class": self.__class__.__name__})
 
-                    logger.info("Video %s/%s - Process finished", index2, len(videos_meta), extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                    logger.info("Video %s/%s - Process finished", index2, len(videos), extra={"class": self.__class__.__name__})
 
                 channel.last_polled_at = datetime.utcnow()
                 channel.updated_at = datetime.utcnow()
                 await self.channel_repo.update(channel)
-                logger.info("Channel %s last_polled_at updated to %s", channel.youtube_channel_id, channel.last_polled_at, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                logger.info("Channel %s last_polled_at updated to %s", channel.youtube_channel_id, channel.last_polled_at, extra={"class": self.__class__.__name__})
 
-                logger.info("Channel %s/%s - Process finished", index, len(channels), extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                logger.info("Channel %s/%s - Process finished", index, len(channels), extra={"class": self.__class__.__name__})
 
             # 18-a. Finishing pipeline OK
             await self.user_scheduler_runtime_repo.mark_ingestion_finished(user_id, datetime.utcnow(), success=True)
-            await self.user_scheduler_runtime_repo.reset_ingestion_failures(user_id)
-            logger.info("Finished OK", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+            logger.info("Finished OK", extra={"class": self.__class__.__name__})
         
         # 18-b. Finishing pipeline KO
         except Exception:
             # increment failure counter and mark as finished with failure
             try:
-                await self.user_scheduler_runtime_repo.increment_ingestion_failures(user_id, by=1)
                 await self.user_scheduler_runtime_repo.mark_ingestion_finished(user_id, datetime.utcnow(), success=False)
             except Exception:
-                logger.exception("Failed updating user runtime status after ingestion pipeline error", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
-            logger.exception("Ingestion pipeline failed", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                logger.exception("Failed updating user runtime status after ingestion pipeline error", extra={"class": self.__class__.__name__})
+            logger.exception("Ingestion pipeline failed", extra={"class": self.__class__.__name__})
             raise
 
@@ -0,0 +1,66 @@
+# src/application/services/pipeline_transition_buffer.py
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from domain.ports.outbound.mongodb.user_scheduler_runtime_status_repository_port import UserSchedulerRuntimeStatusRepositoryPort
+from domain.value_objects.pipeline_transition import PipelineTransition
+
+logger = logging.getLogger(__name__)
+
+
+class PipelineTransitionBuffer:
+    """
+    Write-behind buffer of runtime status transitions that nobody needs to read back right away
+    (e.g. "schedule_next" after a pipeline run), flushed with ONE bulk write every `flush_interval_seconds`.
+
+    - A newer transition for the same (user, pipeline, action) replaces the buffered one.
+    - A failed flush keeps its transitions for the next one (unless newer ones arrived meanwhile).
+    - stop() flushes whatever is still buffered.
+    """
+
+    def __init__(self, runtime_repo: UserSchedulerRuntimeStatusRepositoryPort, flush_interval_seconds: float = 5):
+        self._runtime_repo = runtime_repo
+        self._flush_interval_seconds = flush_interval_seconds
+        self._pending: Dict[Tuple[str, str, str], PipelineTransition] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def add(self, user_id: str, transition: PipelineTransition) -> None:
+        self._pending[(str(user_id), transition.pipeline, transition.action)] = transition
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+
+        transitions_by_user: Dict[str, List[PipelineTransition]] = {}
+        for (user_id, _, _), transition in batch.items():
+            transitions_by_user.setdefault(user_id, []).append(transition)
+
+        try:
+            await self._runtime_repo.bulk_transition(transitions_by_user)
+        except Exception as e:
+            # keep them for the next flush; transitions added meanwhile are newer and win
+            for key, transition in batch.items():
+                self._pending.setdefault(key, transition)
+            logger.warning("Runtime status flush failed (%s transitions kept): %s", len(batch), str(e), extra={"class": self.__class__.__name__})
+
+    def start(self) -> None:
+        """
+        Spawn the periodic flush task (must be called with the event loop running, e.g. from the FastAPI lifespan).
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_loop(), name="pipeline-transition-flush")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval_seconds)
+            await self.flush()
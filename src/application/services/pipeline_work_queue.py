@@ -0,0 +1,65 @@
+# src/application/services/pipeline_work_queue.py
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+PipelineRun = Callable[[], Awaitable[None]]
+
+
+class PipelineWorkQueue:
+    """
+    Bounded queue of per-user pipeline runs, drained by a fixed pool of worker tasks.
+
+    The scheduler job only decides who is due and submits the run; it doesn't wait for it.
+    - `workers` bounds how many runs of this pipeline execute concurrently.
+    - `maxsize` bounds the backlog: submit() waits when the queue is full (back-pressure on the job tick).
+    - A user already queued or running is not submitted again (in-flight set keyed by user_id).
+    """
+
+    def __init__(self, name: str, workers: int, maxsize: int = 10_000):
+        self.name = name
+        self.workers = max(workers, 1)
+        self._queue: asyncio.Queue[Tuple[str, PipelineRun]] = asyncio.Queue(maxsize=maxsize)
+        self._in_flight: Set[str] = set()
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        """
+        Spawn the worker tasks (must be called with the event loop running, e.g. from the FastAPI lifespan).
+        """
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._worker(), name=f"{self.name}-worker-{i}") for i in range(self.workers)]
+
+    async def stop(self) -> None:
+        """
+        Cancel the workers; runs still queued are dropped (their users are due again on the next tick).
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(self, user_id: str, run: PipelineRun) -> bool:
+        """
+        Enqueue `run` for `user_id`. Returns False if that user already has a run queued or in progress.
+        """
+        key = str(user_id)
+        if key in self._in_flight:
+            return False
+        self._in_flight.add(key)
+        await self._queue.put((key, run))
+        return True
+
+    async def _worker(self) -> None:
+        while True:
+            key, run = await self._queue.get()
+            try:
+                await run()
+            except Exception:
+                logger.exception("%s run failed (user_id: %s)", self.name, key, extra={"class": self.__class__.__name__})
+            finally:
+                self._in_flight.discard(key)
+                self._queue.task_done()
@@ -5,7 +5,6 @@ from datetime import datetime
 from typing import List
 
 # logging
-import inspect
 import logging
 
 from domain.ports.inbound.publishing_pipeline_port import PublishingPipelinePort
@@ -45,16 +44,16 @@ class PublishingPipelineService(PublishingPipelinePort):
             # 0. Starting pipeline
             try:
                 await self.user_scheduler_runtime_repo.mark_publishing_started(user_id, datetime.utcnow())
-                logger.info("Starting...", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                logger.info("Starting...", extra={"class": self.__class__.__name__})
             except Exception:
-                logger.exception("Failed to mark publishing pipeline started", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                logger.exception("Failed to mark publishing pipeline started", extra={"class": self.__class__.__name__})
                 raise
 
             # 1. Validate that user actually exists on the repo
             user = await self.user_repo.find_by_id(user_id)
             if user is None:
                 raise LookupError(f"User '{user_id}' not found")
-            logger.info("User found (username: %s)", user.username, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+            logger.info("User found (username: %s)", user.username, extra={"class": self.__class__.__name__})
 
             # 2. Fetch unpublished tweets of the user
             tweets: List[Tweet] = await self.tweet_repo.find_unpublished_by_user(
@@ -62,20 +61,20 @@ class PublishingPipelineService(PublishingPipelinePort):
                 limit=user.max_tweets_to_fetch_from_db,
                 order=user.tweet_fetch_sort_order
             )
-            logger.info("Fetched %s unpublished tweets (out of max %s)", len(tweets), user.max_tweets_to_fetch_from_db, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+            logger.info("Fetched %s unpublished tweets (out of max %s)", len(tweets), user.max_tweets_to_fetch_from_db, extra={"class": self.__class__.__name__})
 
             # 3. Determine how many tweets to publish
             max_tweets_to_publish = user.max_tweets_to_publish
             tweets_to_publish = tweets[:max_tweets_to_publish]
 
             # 4. Publish and update only selected tweets
-            logger.info("Starting to publish %s tweets (out of max %s)", len(tweets_to_publish), max_tweets_to_publish, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+            logger.info("Starting to publish %s tweets (out of max %s)", len(tweets_to_publish), max_tweets_to_publish, extra={"class": self.__class__.__name__})
             for index, tweet in enumerate(tweets_to_publish, start=1):
 
                 # Retrieve X user credentials
                 creds = user.twitter_credentials
                 if not creds or not creds.oauth1_access_token or not creds.oauth1_access_token_secret:
-                    logger.error("User %s has no valid OAuth1 credentials, skipping tweet publication", user.username, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name,},)
+                    logger.error("User %s has no valid OAuth1 credentials, skipping tweet publication", user.username, extra={"class": self.__class__.__name__},)
                     continue
                 
                 # Validate user's oauth1 twitter credentials
@@ -84,7 +83,7 @@ class PublishingPipelineService(PublishingPipelinePort):
                 if is_creds_valid:
                     # Publish tweet with user credentials
                     tweet_id = await self.twitter_publication_client.publish(tweet.text, oauth1_access_token=creds.oauth1_access_token, oauth1_access_token_secret=creds.oauth1_access_token_secret,)
-                    logger.info("Tweet %s/%s published successfully with tweet_id %s", index, len(tweets_to_publish), tweet_id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name,},)
+                    logger.info("Tweet %s/%s published successfully with tweet_id %s", index, len(tweets_to_publish), tweet_id, extra={"class": self.__class__.__name__},)
 
                     now = datetime.utcnow()
                     tweet.published = True
@@ -93,23 +92,21 @@ class PublishingPipelineService(PublishingPipelinePort):
                     tweet.updated_at = now
 
                     await self.tweet_repo.update(tweet)
-                    logger.info("Tweet_id %s updated in collection 'tweets' (_id: %s)", tweet_id, tweet.id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                    logger.info("Tweet_id %s updated in collection 'tweets' (_id: %s)", tweet_id, tweet.id, extra={"class": self.__class__.__name__})
                 else:
-                    logger.info("Skipped publication - twitter oauth1 user creds not valid", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                    logger.info("Skipped publication - twitter oauth1 user creds not valid", extra={"class": self.__class__.__name__})
                     continue
 
             # 5-a. Finishing pipeline OK
             await self.user_scheduler_runtime_repo.mark_publishing_finished(user_id, datetime.utcnow(), success=True)
-            await self.user_scheduler_runtime_repo.reset_publishing_failures(user_id)
-            logger.info("Finished OK", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+            logger.info("Finished OK", extra={"class": self.__class__.__name__})
         
         # 5-b. Finishing pipeline KO
         except Exception:
             # increment failure counter and mark as finished with failure
             try:
-                await self.user_scheduler_runtime_repo.increment_publishing_failures(user_id, by=1)
                 await self.user_scheduler_runtime_repo.mark_publishing_finished(user_id, datetime.utcnow(), success=False)
             except Exception:
-                logger.exception("Failed updating user runtime status after publishing pipeline error", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
-            logger.exception("Publishing pipeline failed", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                logger.exception("Failed updating user runtime status after publishing pipeline error", extra={"class": self.__class__.__name__})
+            logger.exception("Publishing pipeline failed", extra={"class": self.__class__.__name__})
             raise
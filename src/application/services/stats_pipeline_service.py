@@ -1,18 +1,19 @@
 # src/application/services/stats_pipeline_service.py
 
-import inspect
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, FrozenSet, List, Optional
 
 from domain.ports.inbound.stats_pipeline_port import StatsPipelinePort
 from domain.ports.outbound.mongodb.user_repository_port import UserRepositoryPort
 from domain.ports.outbound.mongodb.tweet_repository_port import TweetRepositoryPort
+from domain.ports.outbound.mongodb.video_repository_port import VideoRepositoryPort
 from domain.ports.outbound.twitter_stats.twitter_stats_port import TwitterStatsPort
 from domain.ports.inbound.growth_score_calculator_port import GrowthScoreCalculatorPort
 from domain.ports.outbound.mongodb.user_scheduler_runtime_status_repository_port import UserSchedulerRuntimeStatusRepositoryPort
 from domain.entities.tweet import Tweet, TwitterStats, MetricValue
 from domain.entities.user import TweetFetchSortOrder
+from domain.utils.text_tokens import tokenize
 
 from config import STATS_MAX_DAYS_BACK_FETCH_TWEETS, STATS_MIN_TWEET_AGE_MINUTES, STATS_MAX_TWEET_AGE_MINUTES, STATS_MIN_STATS_FRESHNESS_MINUTES 
 
@@ -32,12 +33,14 @@ class StatsPipelineService(StatsPipelinePort):
         self,
         user_repo: UserRepositoryPort,
         tweet_repo: TweetRepositoryPort,
+        video_repo: VideoRepositoryPort,
         stats_provider: TwitterStatsPort,
         growth_score_calculator: GrowthScoreCalculatorPort,
         user_scheduler_runtime_repo: UserSchedulerRuntimeStatusRepositoryPort,
     ):
         self.user_repo = user_repo
         self.tweet_repo = tweet_repo
+        self.video_repo = video_repo
         self.stats_provider = stats_provider
         self.growth_score_calculator = growth_score_calculator
         self.user_scheduler_runtime_repo = user_scheduler_runtime_repo
@@ -58,31 +61,44 @@ class StatsPipelineService(StatsPipelinePort):
 
         return max(timestamps) if timestamps else None
 
+    async def _get_transcript_tokens(self, video_id: str, cache: Dict[str, FrozenSet[str]]) -> Optional[FrozenSet[str]]:
+        """
+        Token set of the transcript of the given video, tokenized once per video and run (tweets of the same video share it).
+        """
+        if video_id not in cache:
+            video = await self.video_repo.find_by_id(video_id, fields=["transcript"])
+            if video is None:
+                return None
+            cache[video_id] = tokenize(video.get("transcript"))
+        return cache[video_id]
+
 
     async def run_for_user(self, user_id: str) -> None:
         try:
             # 0. Starting pipeline
             try:
                 await self.user_scheduler_runtime_repo.mark_stats_started(user_id, datetime.utcnow())
-                logger.info("Starting...", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                logger.info("Starting...", extra={"class": self.__class__.__name__})
             except Exception:
-                logger.exception("Failed to mark stats pipeline started", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                logger.exception("Failed to mark stats pipeline started", extra={"class": self.__class__.__name__})
                 raise
 
-            # 1. Validate user exists
-            user = await self.user_repo.find_by_id(user_id)
+            # 1. Validate user exists (projected document: only the fields used here, no User entity / credentials decryption)
+            user = await self.user_repo.find_by_id(user_id, fields=["_id", "username", "tweetFetchSortOrder"])
             if user is None:
                 raise LookupError(f"User '{user_id}' not found")
-            logger.info("User found (username: %s)", user.username, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+            logger.info("User found (username: %s)", user.get("username"), extra={"class": self.__class__.__name__})
 
             # 2. Fetch published tweets of the user
             tweets: List[Tweet] = await self.tweet_repo.find_published_by_user(
-                user_id=user.id,
-                order=user.tweet_fetch_sort_order or TweetFetchSortOrder.newest_first,
+                user_id=str(user["_id"]),
+                order=TweetFetchSortOrder(user["tweetFetchSortOrder"]) if user.get("tweetFetchSortOrder") else TweetFetchSortOrder.newest_first,
                 max_days_back=STATS_MAX_DAYS_BACK_FETCH_TWEETS)
             logger.info("Fetched %s published tweets (max days back: %s)", len(tweets), STATS_MAX_DAYS_BACK_FETCH_TWEETS)
 
-            # 3. Process each tweet
+            # 3. Refresh the stats of each tweet
+            transcript_tokens_by_video: Dict[str, FrozenSet[str]] = {}
+            refreshed: List[Tweet] = []
             for index, tweet in enumerate(tweets, start=1):
 
                 logger.info("Stats tweet %s/%s - Starting... (tweet_id=%s)", index, len(tweets), tweet.twitter_id)
@@ -132,44 +148,53 @@ class StatsPipelineService(StatsPipelinePort):
 
                 # Skip if stats is None
                 if stats is None:
-                    logger.warning("Stats is None for tweet_id %s, skipping update and growth score", tweet.twitter_id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                    logger.warning("Stats is None for tweet_id %s, skipping update and growth score", tweet.twitter_id, extra={"class": self.__class__.__name__})
                     continue
 
                 # Update tweet stats
                 now = datetime.utcnow()
                 tweet.twitter_stats = stats
                 tweet.updated_at = now
-                logger.info("Updated tweet stats in DB 'tweets' (twitter_id: %s)", tweet.twitter_id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                logger.info("Updated tweet stats in DB 'tweets' (twitter_id: %s)", tweet.twitter_id, extra={"class": self.__class__.__name__})
 
-                # Compute growth score
-                try:
-                    growth_score = await self.growth_score_calculator.compute_growth_score(tweet)
-                    if growth_score:
-                        tweet.growth_score = growth_score
-                    logger.info("Computed growth score for tweet %s/%s: %s", index, len(tweets), tweet.growth_score, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
-                except Exception:
-                    logger.exception("Failed to compute growth score for tweet_id %s", tweet.twitter_id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                # Transcript tokens of its video (topic relevance compares them with the tweet tokens)
+                if tweet.embedding_refs is not None and tweet.text_tokens is not None:
+                    try:
+                        tweet.transcript_tokens = await self._get_transcript_tokens(tweet.video_id, transcript_tokens_by_video)
+                    except Exception:
+                        logger.exception("Failed to load transcript tokens for tweet_id %s", tweet.twitter_id, extra={"class": self.__class__.__name__})
 
-                # Persist updated tweet
+                refreshed.append(tweet)
+                logger.info("Stats tweet %s/%s - Finished", index, len(tweets), extra={"class": self.__class__.__name__})
+
+            # 4. Compute the growth scores of the refreshed tweets in one batch (scored concurrently, so their
+            #    similarity lookups share the micro-batches of the vector similarity service)
+            try:
+                growth_scores = await self.growth_score_calculator.compute_growth_scores(refreshed)
+                logger.info("Computed growth scores for %s tweets", len(refreshed), extra={"class": self.__class__.__name__})
+            except Exception:
+                logger.exception("Failed to compute growth scores (stats are persisted without them)", extra={"class": self.__class__.__name__})
+                growth_scores = [None] * len(refreshed)
+
+            # 5. Persist updated tweets
+            for tweet, growth_score in zip(refreshed, growth_scores):
+                if growth_score:
+                    tweet.growth_score = growth_score
                 try:
                     await self.tweet_repo.update(tweet)
-                    logger.info("Updated tweet stats in DB 'tweets' (tweet_id: %s, _id: %s)", tweet.twitter_id, tweet.id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                    logger.info("Updated tweet stats in DB 'tweets' (tweet_id: %s, _id: %s, growth score: %s)", tweet.twitter_id, tweet.id, tweet.growth_score, extra={"class": self.__class__.__name__})
                 except Exception:
-                    logger.exception("Failed to update tweet in DB (tweet_id: %s)", tweet.twitter_id, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
-
-                logger.info("Stats tweet %s/%s - Finished", index, len(tweets), extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                    logger.exception("Failed to update tweet in DB (tweet_id: %s)", tweet.twitter_id, extra={"class": self.__class__.__name__})
 
-            # 4-a. Finishing pipeline OK
+            # 6-a. Finishing pipeline OK
             await self.user_scheduler_runtime_repo.mark_stats_finished(user_id, datetime.utcnow(), success=True)
-            await self.user_scheduler_runtime_repo.reset_stats_failures(user_id)
-            logger.info("Finished OK", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+            logger.info("Finished OK", extra={"class": self.__class__.__name__})
 
-        # 4-b. Finishing pipeline KO
+        # 6-b. Finishing pipeline KO
         except Exception:
             try:
-                await self.user_scheduler_runtime_repo.increment_stats_failures(user_id, by=1)
                 await self.user_scheduler_runtime_repo.mark_stats_finished(user_id, datetime.utcnow(), success=False)
             except Exception:
-                logger.exception("Failed updating user runtime status after stats pipeline error", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
-            logger.exception("Stats pipeline failed", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                logger.exception("Failed updating user runtime status after stats pipeline error", extra={"class": self.__class__.__name__})
+            logger.exception("Stats pipeline failed", extra={"class": self.__class__.__name__})
             raise
@@ -58,20 +58,56 @@ MONGO_USER     = os.getenv("MONGO_USER")
 MONGO_PASSWORD = os.getenv("MONGO_PASSWORD")
 MONGO_HOST     = os.getenv("MONGO_HOST")
 MONGO_DB       = os.getenv("MONGO_DB")
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "50"))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "5"))
+MONGO_MAX_IDLE_TIME_MS              = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "60000"))          # idle pooled sockets are closed after this
+MONGO_WAIT_QUEUE_TIMEOUT_MS         = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "5000"))      # fail fast instead of queueing forever when the pool is exhausted
+MONGO_SERVER_SELECTION_TIMEOUT_MS   = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "3000")) # default is 30s
+
+# --- Redis (optional read-aside cache for repositories; disabled when REDIS_URL is empty) ---
+REDIS_URL                       = os.getenv("REDIS_URL")
+REDIS_USER_CACHE_TTL_SECONDS    = int(os.getenv("REDIS_USER_CACHE_TTL_SECONDS", "60"))       # short: users carry credentials
+REDIS_VIDEO_CACHE_TTL_SECONDS   = int(os.getenv("REDIS_VIDEO_CACHE_TTL_SECONDS", "3600"))
+
+# --- Outbound HTTP (shared aiohttp session: OpenAI embeddings, Twitter/X API, Twitter OAuth2) ---
+HTTP_MAX_CONNECTIONS            = int(os.getenv("HTTP_MAX_CONNECTIONS", "50"))
+HTTP_MAX_CONNECTIONS_PER_HOST   = int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", "20"))
+HTTP_KEEPALIVE_TIMEOUT_SECONDS  = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT_SECONDS", "30"))   # idle keep-alive connections are closed after this
 
 # --- Encryption (used to encrypt user-level X credentials) ---
 DB_ENCRIPTION_SECRET_KEY = os.getenv("DB_ENCRIPTION_SECRET_KEY")
 
 # --- JWT Authentication --- 
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY") 
+# HMAC only (HS256/HS384/HS512): verification is one HMAC call. An asymmetric algorithm (RS256/EdDSA) would multiply
+# verify cost; moving to one means revisiting the JWTService verification cache (size/TTL) and the key handling there.
 JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256") 
 JWT_ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
 
+# --- Password hashing (bcrypt cost = log2 of Blowfish rounds; tune per hardware, allowed range 10..15) ---
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# --- Scheduler ---
+PIPELINE_CONCURRENCY = int(os.getenv("PIPELINE_CONCURRENCY", "4"))     # queue workers per pipeline (and concurrent due checks per tick)
+PIPELINE_QUEUE_MAXSIZE = int(os.getenv("PIPELINE_QUEUE_MAXSIZE", "10000"))     # queued runs per pipeline before job ticks wait
+APP_CONFIG_CACHE_TTL_SECONDS = int(os.getenv("APP_CONFIG_CACHE_TTL_SECONDS", "30"))     # app config read by every job tick (0 = always read)
+RUNTIME_STATUS_FLUSH_SECONDS = float(os.getenv("RUNTIME_STATUS_FLUSH_SECONDS", "5"))     # buffered "schedule_next" runtime writes are bulk-flushed this often
+PIPELINE_MIN_RUN_LEASE_MINUTES = float(os.getenv("PIPELINE_MIN_RUN_LEASE_MINUTES", "60"))     # a claimed run is only treated as stuck after max(frequency, this)
+SCHEDULER_LOCK_TTL_SECONDS = int(os.getenv("SCHEDULER_LOCK_TTL_SECONDS", "90"))     # leader lease; renewed every TTL/3 by the holder
+RUN_SCHEDULER = os.getenv("RUN_SCHEDULER", "1") == "1"     # 0 = web-only process; with several scheduler processes only the leader-lock holder runs the jobs
+
+# --- Web server ---
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))     # uvicorn worker processes (the uvicorn CLI reads the same env var)
+UVICORN_ACCESS_LOG = os.getenv("UVICORN_ACCESS_LOG", "1") == "1"     # 0 = no per-request access log line (saves a logging call per request)
+UVICORN_BACKLOG = int(os.getenv("UVICORN_BACKLOG", "2048"))     # pending TCP connections queued by the listening socket
+UVICORN_RELOAD = os.getenv("UVICORN_RELOAD", "0") == "1"     # local dev only: file watcher that re-imports the app on every change (single process, WEB_CONCURRENCY ignored); leave unset in PRO
+
 # --- Stats Pipeline ---
 STATS_MAX_DAYS_BACK_FETCH_TWEETS = int(os.getenv("STATS_MAX_DAYS_BACK_FETCH_TWEETS", "60"))
 STATS_MIN_TWEET_AGE_MINUTES = int(os.getenv("STATS_MIN_TWEET_AGE_MINUTES", "1440"))
 STATS_MAX_TWEET_AGE_MINUTES = int(os.getenv("STATS_MAX_TWEET_AGE_MINUTES", "43200"))
 STATS_MIN_STATS_FRESHNESS_MINUTES = int(os.getenv("STATS_MIN_STATS_FRESHNESS_MINUTES", "1440"))
+SIMILARITY_MAX_ROWS_PER_KIND = int(os.getenv("SIMILARITY_MAX_ROWS_PER_KIND", "50000"))     # in-memory embeddings per kind for growth scores (~6 KB each at 1536 dims); the oldest are evicted first
  
 # --- Validations (only secrets) ---
 required_vars = {
@@ -154,6 +190,9 @@ class EmitJsonHandler(logging.StreamHandler):
                     except Exception:
                         payload[k] = str(v)
 
+            # calling function comes from the LogRecord (funcName), not from inspect.currentframe() at every call site
+            payload.setdefault("method", record.funcName)
+
             self.stream.write(json.dumps(payload, ensure_ascii=False) + "\n")
             self.flush()
         except Exception:
@@ -180,7 +219,7 @@ if ENVIRONMENT == "DEV":
     # Easy format to read in console
     console_handler = logging.StreamHandler(sys.stdout)
     formatter = ColoredFormatter(
-    "%(log_color)s%(levelname)-5s%(reset)s | %(asctime)s | user: %(user_id)s | %(module)s | %(message)s",
+    "%(log_color)s%(levelname)-5s%(reset)s | %(asctime)s | user: %(user_id)s | %(module)s.%(funcName)s | %(message)s",
     log_colors={
         "DEBUG": "cyan",
         "INFO": "green",
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Union, FrozenSet
 
 
 @dataclass(kw_only=True)
@@ -93,6 +93,8 @@ class Tweet:
     video_id: str
     generation_id: str                          # FK → tweet_generations._id
     text: str                                   # The tweet itself
+    text_tokens: Optional[FrozenSet[str]] = None        # Token set of text (computed at ingestion, used for topic relevance)
+    transcript_tokens: Optional[FrozenSet[str]] = None  # Token set of the source video transcript (not persisted: filled by the stats pipeline, once per video)
     index_in_generation: Optional[int] = None   # Position inside the generation
     published: bool = False                     # True if already published in X
     published_at: Optional[datetime] = None     # Publication timestamp in X
@@ -14,7 +14,7 @@ class TweetFetchSortOrder(str, Enum):
     random = "random"
 
 
-@dataclass
+@dataclass(slots=True)
 class UserTwitterCredentials:
     """
     Credentials related to the user's Twitter account.
@@ -29,7 +29,7 @@ class UserTwitterCredentials:
     screen_name: Optional[str] = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class User:
     """
     Domain entity representing an application user.
@@ -16,7 +16,7 @@ class TweetLengthUnit(str, Enum):
     TOKENS = "tokens"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PromptContent:
     """
     Nested content for the Prompt entity holding the system and user messages.
@@ -25,7 +25,7 @@ class PromptContent:
     user_message: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TweetLengthPolicy:
     """
     Minimal, extensible policy for tweet length.
@@ -43,7 +43,7 @@ class TweetLengthPolicy:
     unit: TweetLengthUnit = TweetLengthUnit.CHARS
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class UserPrompt:
     """
     Domain entity representing a prompt configuration for tweet generation.
@@ -5,7 +5,7 @@ from typing import Optional
 from bson import ObjectId
 
 
-@dataclass
+@dataclass(slots=True)
 class UserSchedulerRuntimeStatus:
     """
     Entity that represents the runtime status of the scheduler for a given user.
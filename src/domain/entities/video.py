@@ -4,13 +4,13 @@ from dataclasses import dataclass, field
 from typing import Optional, List
 from datetime import datetime
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptSegment:
     start: float
     duration: float
     text: str
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Video:
     id: Optional[str] = None
     user_id: Optional[str] = None       # Redundante, pero útil para consultas
@@ -1,7 +1,7 @@
 # src/domain/ports/inbound/growth_score_calculator_port.py
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from domain.entities.tweet import Tweet
 
@@ -32,6 +32,14 @@ class GrowthScoreCalculatorPort(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def compute_growth_scores(self, tweets: List[Tweet]) -> List[Optional[Dict[str, float]]]:
+        """
+        Compute the full growth score of many tweets at once (same shape as compute_growth_score, input order kept).
+        Implementations may score them concurrently.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def compute_subscores(self, tweet: Tweet) -> Dict[str, float]:
         """
@@ -46,10 +54,11 @@ class GrowthScoreCalculatorPort(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def combine_subscores(self, subscores: Dict[str, float]) -> float:
+    def combine_subscores(self, subscores: Dict[str, float]) -> float:
         """
         Combine the sub-scores into a single final 'overall' score.
         Allows different weighting strategies or formula versions.
+        Synchronous: pure arithmetic, no I/O.
         """
         raise NotImplementedError
 
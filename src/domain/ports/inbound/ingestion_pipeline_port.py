@@ -1,6 +1,10 @@
 # src/domain/ports/inbound/ingestion_pipeline_port.py
 
 from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from domain.entities.user import User
+from domain.entities.channel import Channel
 
 class IngestionPipelinePort(ABC):
     """
@@ -9,10 +13,10 @@ class IngestionPipelinePort(ABC):
     """
 
     @abstractmethod
-    async def run_for_user(self, user_id: str) -> None:
+    async def run_for_user(self, user_id: str, user: Optional[User] = None, channels: Optional[List[Channel]] = None) -> None:
         """
         Execute the ingestion pipeline for the given user_id:
-          1) retrieve channels linked to user_id
+          1) retrieve channels linked to user_id (unless `user`/`channels` are passed already loaded)
           2) fetch and transcribe new videos
           3) generate tweets via OpenAI
           4) save generated tweets to the database
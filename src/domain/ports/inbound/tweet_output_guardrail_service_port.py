@@ -1,8 +1,8 @@
 # src/domain/ports/inbound/tweet_output_guardrail_port.py
 
 from abc import ABC, abstractmethod
-from typing import Dict
 from domain.entities.user_prompt import TweetLengthPolicy
+from domain.value_objects.tweet_generation_response import TweetGenerationResponse
 
 
 class TweetOutputGuardrailPort(ABC):
@@ -11,21 +11,21 @@ class TweetOutputGuardrailPort(ABC):
     """
 
     @abstractmethod
-    def is_count_valid(self, json_response: Dict, expected_count: int) -> bool:
+    def is_count_valid(self, response: TweetGenerationResponse, expected_count: int) -> bool:
         """
-        Returns True if the number of tweets in the JSON matches the expected count.
+        Returns True if the number of tweets in the response matches the expected count.
         """
         raise NotImplementedError
 
     @abstractmethod
-    def is_length_valid(self, json_response: Dict, policy: TweetLengthPolicy) -> bool:
+    def is_length_valid(self, response: TweetGenerationResponse, policy: TweetLengthPolicy) -> bool:
         """
         Returns True if all tweets satisfy the length constraints defined by the policy.
         """
         raise NotImplementedError
 
     @abstractmethod
-    def is_semantically_valid(self, json_response: Dict) -> bool:
+    def is_semantically_valid(self, response: TweetGenerationResponse) -> bool:
         """
         Placeholder for future semantic validation using an LLM.
         Always returns True for now.
@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 from domain.entities.app_config import AppConfig
 
 class AppConfigRepositoryPort(ABC):
+    __slots__ = ()
+
     @abstractmethod
     async def get_config(self) -> AppConfig:
         raise NotImplementedError
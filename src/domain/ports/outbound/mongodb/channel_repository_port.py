@@ -11,6 +11,8 @@ class ChannelRepositoryPort(ABC):
     Outbound port: defines CRUD operations and queries for the Channel aggregate in the persistence layer.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def save(self, channel: Channel) -> str:
         """
@@ -85,4 +87,12 @@ class ChannelRepositoryPort(ABC):
         """
         Delete all documents in channels collection. Returns number deleted.
         """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def ensure_indexes(self) -> None:
+        """
+        Create the indexes required by the query contracts of this port (idempotent).
+        Called once at application startup.
+        """
         raise NotImplementedError
\ No newline at end of file
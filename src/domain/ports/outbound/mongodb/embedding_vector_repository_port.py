@@ -1,8 +1,9 @@
 # src/domain/ports/outbound/mongodb/embedding_vector_repository_port.py
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 from domain.value_objects.embedding_vector import EmbeddingVector
+from domain.value_objects.embedding_matrix import EmbeddingMatrix
 from domain.value_objects.embedding_type import EmbeddingType
 
 
@@ -11,6 +12,8 @@ class EmbeddingVectorRepositoryPort(ABC):
     Port that abstracts persistence operations for embedding vectors.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def save(self, embedding: EmbeddingVector) -> str:
         """
@@ -31,3 +34,19 @@ class EmbeddingVectorRepositoryPort(ABC):
         Delete all embeddings associated with a given tweet.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    async def find_matrix(self, tweet_ids: Optional[List[str]] = None, type: Optional[EmbeddingType] = None) -> EmbeddingMatrix:
+        """
+        Load embeddings (optionally filtered by tweets and/or type) as a single SoA EmbeddingMatrix,
+        ready for bulk (sgemm) similarity instead of iterating EmbeddingVector objects.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_newest_matrices(self, type: EmbeddingType, limit: int, batch_size: int = 1000) -> AsyncIterator[EmbeddingMatrix]:
+        """
+        Stream the `limit` newest embeddings of the given type (async generator), oldest first,
+        as EmbeddingMatrix batches of up to `batch_size` rows, so memory stays bounded by the batch.
+        """
+        raise NotImplementedError
@@ -14,6 +14,8 @@ class MasterPromptRepositoryPort(ABC):
     while infrastructure (Mongo, etc.) implements it.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def find_by_id(self, master_prompt_id: ObjectId) -> Optional[MasterPrompt]:
         """
@@ -0,0 +1,28 @@
+# src/domain/ports/outbound/mongodb/scheduler_lock_repository_port.py
+
+from abc import ABC, abstractmethod
+
+
+class SchedulerLockRepositoryPort(ABC):
+    """
+    Outbound port for a named, lease-based lock shared by every process running the scheduler.
+    Only the current holder runs the pipeline jobs; the lease expires if the holder stops renewing it.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    async def try_acquire(self, name: str, owner: str, ttl_seconds: int) -> bool:
+        """
+        Acquire the lock `name` for `owner`, or renew it if `owner` already holds it.
+        Succeeds only if the lock is free, expired, or already held by `owner`; the lease then lasts `ttl_seconds`.
+        Returns True if `owner` holds the lock after the call.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def release(self, name: str, owner: str) -> None:
+        """
+        Release the lock `name` if (and only if) it is held by `owner`.
+        """
+        raise NotImplementedError
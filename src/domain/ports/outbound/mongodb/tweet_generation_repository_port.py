@@ -5,6 +5,8 @@ from typing import Optional, List
 from domain.entities.tweet_generation import TweetGeneration
 
 class TweetGenerationRepositoryPort(ABC):
+    __slots__ = ()
+
     @abstractmethod
     async def save(self, tweet_generation: TweetGeneration) -> str:
         """
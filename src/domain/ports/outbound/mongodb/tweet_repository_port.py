@@ -7,6 +7,8 @@ from domain.entities.user import TweetFetchSortOrder
 
 
 class TweetRepositoryPort(ABC):
+    __slots__ = ()
+
     @abstractmethod
     async def save(self, tweet: Tweet) -> str:
         """
@@ -7,8 +7,14 @@ from domain.entities.user_prompt import UserPrompt
 class UserPromptRepositoryPort(ABC):
     """
     Outbound port: defines CRUD operations for the User Prompt entity in the persistence layer.
+
+    Write semantics: user prompts are append-mostly and tolerate eventual consistency, so the
+    composition root wires this collection with write concern w=1, j=False.
+    Bulk operations (save_many / update_many) must be unordered (ordered=False).
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def save(self, prompt: UserPrompt) -> str:
         """
@@ -16,6 +22,14 @@ class UserPromptRepositoryPort(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def save_many(self, prompts: List[UserPrompt], batch_size: int = 500) -> List[str]:
+        """
+        Persist several new UserPrompt entities using bulk inserts (one round trip per batch).
+        Returns the generated document IDs as strings, in the same order as the input.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def find_by_id(self, prompt_id: str) -> Optional[UserPrompt]:
         """
@@ -37,12 +51,27 @@ class UserPromptRepositoryPort(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def update_many(self, prompts: List[UserPrompt], batch_size: int = 500) -> int:
+        """
+        Update several existing UserPrompt documents using bulk writes (one round trip per batch).
+        Returns the number of documents modified.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def delete(self, prompt_id: str) -> None:
         """
         Delete a UserPrompt by its ID.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    async def delete_many(self, prompt_ids: List[str]) -> int:
+        """
+        Delete several UserPrompts by their IDs in a single operation. Returns number deleted.
+        """
+        raise NotImplementedError
     
     @abstractmethod
     async def delete_all(self) -> int:
@@ -50,3 +79,11 @@ class UserPromptRepositoryPort(ABC):
         Delete all documents in user_prompts collection. Returns number deleted.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    async def truncate(self) -> None:
+        """
+        Empty the user_prompts collection by dropping it (no per-document deletes/journaling)
+        and re-creating its indexes. Intended for test fixtures and cold resets.
+        """
+        raise NotImplementedError
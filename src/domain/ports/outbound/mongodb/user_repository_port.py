@@ -1,9 +1,19 @@
 # domain/ports/outbound/mongodb/user_repository_port.py
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from datetime import datetime
+from typing import AsyncIterator, Optional, List, Dict, Any, Tuple, Union
+
+from bson import ObjectId
 
 from domain.entities.user import User, UserTwitterCredentials
+from domain.entities.channel import Channel
+from domain.value_objects.pipeline_transition import PipelineName
+
+__all__ = ["UserRepositoryPort", "UserId"]
+
+# ids may be passed already parsed (ObjectId) to skip the hex parse in adapters
+UserId = Union[str, ObjectId]
 
 
 class UserRepositoryPort(ABC):
@@ -12,6 +22,8 @@ class UserRepositoryPort(ABC):
     Defines all required operations for reading and writing User entities.
     """
 
+    __slots__ = ()
+
     # -------------------------
     # Basic CRUD operations
     # -------------------------
@@ -31,7 +43,15 @@ class UserRepositoryPort(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def delete(self, user_id: str) -> None:
+    async def update_and_return(self, user: User) -> Optional[User]:
+        """
+        Update all fields of an existing User and return its post-update state in the same
+        round trip (findOneAndUpdate). Returns None if the User does not exist.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, user_id: UserId) -> None:
         """
         Delete a User by its _id.
         """
@@ -44,21 +64,68 @@ class UserRepositoryPort(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def truncate(self) -> None:
+        """
+        Empty the users collection by dropping it (no per-document deletes/journaling)
+        and re-creating its indexes. Intended for test fixtures and cold resets.
+        """
+        raise NotImplementedError
+
     # -------------------------
     # Retrieval operations
     # -------------------------
 
     @abstractmethod
-    async def find_by_id(self, user_id: str) -> Optional[User]:
+    async def find_by_id(self, user_id: UserId, fields: Optional[List[str]] = None) -> Optional[Union[User, Dict[str, Any]]]:
         """
         Retrieve a User by its _id.
+        If `fields` is given, only those (camelCase) document fields are fetched and the raw
+        projected document is returned as a dict (credentials are NOT decrypted).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_ids(self, user_ids: List[UserId]) -> List[User]:
+        """
+        Retrieve several Users by their _id in a single query.
+        Results keep the order of the input IDs; IDs not found are omitted.
         """
         raise NotImplementedError
 
     @abstractmethod
-    async def find_all(self) -> List[User]:
+    async def find_all(self, fields: Optional[List[str]] = None) -> List[Union[User, Dict[str, Any]]]:
         """
         Retrieve all Users.
+        If `fields` is given, returns projected dicts instead of User entities.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_all(self, batch_size: int = 500, fields: Optional[List[str]] = None) -> AsyncIterator[Union[User, Dict[str, Any]]]:
+        """
+        Stream all Users (async generator), fetching `batch_size` documents per round trip,
+        so memory stays bounded by the batch instead of the collection size.
+        If `fields` is given, yields raw projected dicts instead of User entities.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_scheduler_users(self, batch_size: int = 500, due_pipeline: Optional[PipelineName] = None, now: Optional[datetime] = None) -> AsyncIterator[User]:
+        """
+        Stream all Users for the scheduler jobs: partial User entities carrying only
+        id, username and scheduler_config (credentials are neither fetched nor decrypted).
+        If `due_pipeline` is given, users for which that pipeline cannot be due at `now` (disabled by the user,
+        or last started less than one frequency ago) are filtered out in the database. This is a pre-filter:
+        it never drops a user the job would run, and the job still applies its own decision.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_scheduler_users_with_channels(self, batch_size: int = 500, due_pipeline: Optional[PipelineName] = None, now: Optional[datetime] = None) -> AsyncIterator[Tuple[User, List[Channel]]]:
+        """
+        Same partial Users as iter_scheduler_users (same `due_pipeline` pre-filter), each paired with the channels
+        it is subscribed to, co-fetched in the same round trips (no per-user channel query).
         """
         raise NotImplementedError
 
@@ -82,7 +149,7 @@ class UserRepositoryPort(ABC):
     # -------------------------
 
     @abstractmethod
-    async def update_password(self, user_id: str, hashed_password: str) -> None:
+    async def update_password(self, user_id: UserId, hashed_password: str) -> None:
         """
         Update the hashed password of a User.
         The repository NEVER hashes passwords; it only stores the hashed value.
@@ -94,7 +161,7 @@ class UserRepositoryPort(ABC):
     # -------------------------
 
     @abstractmethod
-    async def update_twitter_credentials(self, user_id: str, creds: UserTwitterCredentials) -> None:
+    async def update_twitter_credentials(self, user_id: UserId, creds: UserTwitterCredentials) -> None:
         """
         Update the Twitter credentials of a User.
         """
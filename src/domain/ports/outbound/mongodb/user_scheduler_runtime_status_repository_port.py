@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional, List, Dict, Any, Union
 
 from bson import ObjectId
 
 from domain.entities.user_scheduler_runtime_status import UserSchedulerRuntimeStatus
+from domain.value_objects.pipeline_transition import PipelineTransition, PipelineName
 
 
 UserId = Union[str, ObjectId]
@@ -22,6 +24,16 @@ class UserSchedulerRuntimeStatusRepositoryPort(ABC):
     appropriate to avoid race conditions.
     """
 
+    __slots__ = ()
+
+    @abstractmethod
+    async def ensure_indexes(self) -> None:
+        """
+        Create the indexes required by the query contracts of this port (idempotent).
+        Called once at application startup.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def get_by_user_id(self, user_id: UserId) -> Optional[UserSchedulerRuntimeStatus]:
         """
@@ -30,6 +42,14 @@ class UserSchedulerRuntimeStatusRepositoryPort(ABC):
         """
         raise NotImplementedError
     
+    @abstractmethod
+    async def get_many_by_user_ids(self, user_ids: List[UserId]) -> Dict[str, UserSchedulerRuntimeStatus]:
+        """
+        Retrieve the runtime status entities of several users in one query.
+        Returns a dict keyed by str(user_id); users without a document are absent from it.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def update_by_user_id(self, user_id: str, update: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -54,6 +74,24 @@ class UserSchedulerRuntimeStatusRepositoryPort(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def upsert_many(self, statuses: List[UserSchedulerRuntimeStatus]) -> None:
+        """
+        Ensure a runtime status document exists for every given status (by user_id) with ONE
+        unordered bulk write. Existing documents are left untouched except for `updated_at`
+        ($setOnInsert), so it is safe to call at scheduler cold-start.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_and_return(self, status: UserSchedulerRuntimeStatus) -> Optional[UserSchedulerRuntimeStatus]:
+        """
+        $set all fields of the given status (matched by user_id) and return the post-update
+        entity in the same round trip (findOneAndUpdate). Returns None if no document matched.
+        Should update `updated_at` automatically.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def update_fields(self, user_id: UserId, fields: Dict[str, Any]) -> None:
         """
@@ -71,9 +109,52 @@ class UserSchedulerRuntimeStatusRepositoryPort(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def list_all(self, limit: Optional[int] = None) -> List[UserSchedulerRuntimeStatus]:
+    async def list_all(self, limit: Optional[int] = None, fields: Optional[List[str]] = None) -> List[Union[UserSchedulerRuntimeStatus, Dict[str, Any]]]:
         """
         Return all runtime status documents, optionally limited.
+        If `fields` is given, only those (camelCase) fields are fetched and raw dicts are returned.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def atomic_update(
+        self,
+        user_id: UserId,
+        set_fields: Dict[str, Any],
+        inc_fields: Optional[Dict[str, int]] = None,
+        upsert: bool = True,
+    ) -> None:
+        """
+        Apply `set_fields` ($set) and `inc_fields` ($inc) to the user's runtime status
+        document in ONE update document (single round trip). `updatedAt` is always set to now.
+        Keys are the stored camelCase field names.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def atomic_transition(self, user_id: UserId, transitions: List[PipelineTransition]) -> UserSchedulerRuntimeStatus:
+        """
+        Merge all `transitions` into one {$set, $inc} update document and apply it with a single
+        findAndModify (upsert), returning the post-image of the runtime status.
+        Raises ValueError if two transitions touch the same field in conflicting ways.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def bulk_transition(self, transitions_by_user: Dict[UserId, List[PipelineTransition]]) -> None:
+        """
+        Apply atomic_transition semantics for several users (user_id -> transitions, merged per user)
+        in ONE unordered bulk write (upsert), without returning the post-images.
+        Raises ValueError if two transitions of the same user touch the same field in conflicting ways.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def try_claim_pipeline(self, user_id: UserId, pipeline: PipelineName, now: datetime, lease_minutes: float) -> bool:
+        """
+        Atomically mark `pipeline` as running for the user (running flag + last started at = `now`) if it is not
+        running, or if its last start is more than `lease_minutes` old (stuck run). Single findAndModify, no upsert.
+        Returns True if this call claimed the run; False if another run holds it or the document does not exist.
         """
         raise NotImplementedError
 
@@ -85,6 +166,7 @@ class UserSchedulerRuntimeStatusRepositoryPort(ABC):
     async def mark_ingestion_started(self, user_id: UserId, started_at: Any) -> None:
         """
         Atomically mark ingestion pipeline as running and set last started timestamp.
+        Must be a single $set (running flag + timestamp + updatedAt).
         """
         raise NotImplementedError
 
@@ -92,7 +174,8 @@ class UserSchedulerRuntimeStatusRepositoryPort(ABC):
     async def mark_ingestion_finished(self, user_id: UserId, finished_at: Any, success: bool) -> None:
         """
         Atomically mark ingestion pipeline as finished.
-        Reset or increment consecutiveFailuresIngestionPipeline accordingly.
+        Reset or increment consecutiveFailuresIngestionPipeline accordingly, in the SAME update
+        document ($set + $inc), so callers must not call reset/increment_ingestion_failures as well.
         """
         raise NotImplementedError
 
@@ -118,6 +201,7 @@ class UserSchedulerRuntimeStatusRepositoryPort(ABC):
     async def mark_publishing_started(self, user_id: UserId, started_at: Any) -> None:
         """
         Atomically mark publishing pipeline as running and set last started timestamp.
+        Must be a single $set (running flag + timestamp + updatedAt).
         """
         raise NotImplementedError
 
@@ -125,7 +209,8 @@ class UserSchedulerRuntimeStatusRepositoryPort(ABC):
     async def mark_publishing_finished(self, user_id: UserId, finished_at: Any, success: bool) -> None:
         """
         Atomically mark publishing pipeline as finished.
-        Reset or increment consecutiveFailuresPublishingPipeline accordingly.
+        Reset or increment consecutiveFailuresPublishingPipeline accordingly, in the SAME update
+        document ($set + $inc), so callers must not call reset/increment_publishing_failures as well.
         """
         raise NotImplementedError
 
@@ -151,7 +236,7 @@ class UserSchedulerRuntimeStatusRepositoryPort(ABC):
     async def mark_stats_started(self, user_id: UserId, started_at: Any) -> None:
         """
         Atomically mark stats pipeline as running and set last started timestamp.
-        Should set isStatsPipelineRunning = True and update updated_at.
+        Should set isStatsPipelineRunning = True and update updated_at in a single $set.
         """
         raise NotImplementedError
 
@@ -162,6 +247,8 @@ class UserSchedulerRuntimeStatusRepositoryPort(ABC):
         If success=True: reset consecutiveFailuresStatsPipeline.
         If success=False: increment consecutiveFailuresStatsPipeline.
         Always update updated_at.
+        All of it in ONE update document ($set + $inc), so callers must not call
+        reset/increment_stats_failures as well.
         """
         raise NotImplementedError
 
@@ -187,7 +274,7 @@ class UserSchedulerRuntimeStatusRepositoryPort(ABC):
     async def mark_embeddings_started(self, user_id: UserId, started_at: Any) -> None:
         """
         Atomically mark embeddings pipeline as running and set last started timestamp.
-        Should set isEmbeddingsPipelineRunning = True and update updated_at.
+        Should set isEmbeddingsPipelineRunning = True and update updated_at in a single $set.
         """
         raise NotImplementedError
 
@@ -198,6 +285,8 @@ class UserSchedulerRuntimeStatusRepositoryPort(ABC):
         If success=True: reset consecutiveFailuresEmbeddingsPipeline.
         If success=False: increment consecutiveFailuresEmbeddingsPipeline.
         Always update updated_at.
+        All of it in ONE update document ($set + $inc), so callers must not call
+        reset/increment_embeddings_failures as well.
         """
         raise NotImplementedError
 
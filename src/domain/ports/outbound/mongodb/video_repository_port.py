@@ -1,11 +1,28 @@
 # domain/ports/outbound/mongodb/video_repository_port.py
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Dict, Any, Union
+from bson import ObjectId
+
 from domain.entities.video import Video
+from domain.ports.outbound.mongodb.user_repository_port import UserId
+
+# ids may be passed already parsed (ObjectId) to skip the hex parse in adapters
+VideoId = Union[str, ObjectId]
 
 
 class VideoRepositoryPort(ABC):
+    """
+    Outbound port for Video persistence.
+
+    Write semantics: videos are append-mostly and re-derivable from YouTube, so the composition root
+    wires this collection with an acknowledged-but-not-journaled write concern (w=1, j=False).
+    Bulk operations (save_many / update_many) must be unordered (ordered=False) so one bad document
+    does not abort the rest of the batch and the server can apply the writes in parallel.
+    """
+
+    __slots__ = ()
+
     @abstractmethod
     async def save(self, video: Video) -> str:
         """
@@ -15,9 +32,28 @@ class VideoRepositoryPort(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def find_by_id(self, video_id: str) -> Optional[Video]:
+    async def save_many(self, videos: List[Video], batch_size: int = 500) -> List[Optional[str]]:
+        """
+        Persist several new videos using bulk inserts (one round trip per batch).
+        Returns the generated video IDs, in the same order as the input (None for a video that could not be
+        inserted, e.g. a duplicate key; the rest of the batch is still inserted).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_id(self, video_id: VideoId, fields: Optional[List[str]] = None) -> Optional[Union[Video, Dict[str, Any]]]:
         """
         Retrieve a single video by its ID.
+        If `fields` is given, only those (camelCase) document fields are fetched and the raw
+        projected document is returned as a dict instead of a Video entity.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_ids(self, video_ids: List[VideoId]) -> List[Video]:
+        """
+        Retrieve several videos by their IDs in a single query.
+        Results keep the order of the input IDs; IDs not found are omitted.
         """
         raise NotImplementedError
 
@@ -29,7 +65,7 @@ class VideoRepositoryPort(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def find_by_youtube_video_id_and_user_id(self, youtube_video_id: str, user_id: str) -> Optional[Video]:
+    async def find_by_youtube_video_id_and_user_id(self, youtube_video_id: str, user_id: UserId) -> Optional[Video]:
         """
         Fetch one video by its YouTube video ID and user ID.
         """
@@ -40,20 +76,37 @@ class VideoRepositoryPort(ABC):
         self,
         channel_id: str,
         limit: int = 50,
-        offset: int = 0
-    ) -> List[Video]:
+        offset: int = 0,
+        fields: Optional[List[str]] = None
+    ) -> List[Union[Video, Dict[str, Any]]]:
         """
         List videos for a given channel, with optional pagination.
+        If `fields` is given, returns projected dicts instead of Video entities.
         """
         raise NotImplementedError
 
     @abstractmethod
     async def find_videos_pending_tweets(
         self,
-        limit: int = 50
-    ) -> List[Video]:
+        limit: int = 50,
+        fields: Optional[List[str]] = None
+    ) -> List[Union[Video, Dict[str, Any]]]:
         """
-        List videos that haven't had tweets generated yet.
+        List videos that haven't had tweets generated yet, newest first.
+        If `fields` is given, returns projected dicts instead of Video entities.
+
+        Index contract: this query is served by the partial compound index
+        {"tweetsGenerated": 1, "createdAt": -1} with partialFilterExpression {"tweetsGenerated": False}
+        (created by `ensure_indexes`). Implementations must hint that index so the plan never
+        degrades to a collection scan.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def ensure_indexes(self) -> None:
+        """
+        Create the indexes required by the query contracts of this port (idempotent).
+        Called once at application startup.
         """
         raise NotImplementedError
 
@@ -65,8 +118,32 @@ class VideoRepositoryPort(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def delete(self, video_id: str) -> None:
+    async def update_and_return(self, video: Video) -> Optional[Video]:
+        """
+        Update an existing video and return its post-update state in the same round trip
+        (findOneAndUpdate). Returns None if the video does not exist.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_many(self, videos: List[Video], batch_size: int = 500) -> int:
+        """
+        Update several existing videos using bulk writes (one round trip per batch).
+        Returns the number of videos modified.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, video_id: VideoId) -> None:
         """
         Delete a video by its ID.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    async def delete_many(self, video_ids: List[VideoId]) -> int:
+        """
+        Delete several videos by their IDs in a single operation.
+        Returns the number of videos deleted.
+        """
+        raise NotImplementedError
@@ -25,10 +25,32 @@
 # Si esos métodos se limitan a validaciones de reglas de negocio (p. ej. guardrails de salida del tweet), colócalos en src/domain/services/ o en src/domain/utils/ como funciones puras.
 
 
-from typing import Optional, Dict
+import asyncio
+from functools import lru_cache
+from typing import Optional, Dict, List, Tuple
+
+import numpy as np
 
 from domain.entities.tweet import Tweet, GrowthScore
 from domain.ports.inbound.growth_score_calculator_port import GrowthScoreCalculatorPort
+from domain.services.vector_similarity_service import VectorSimilarityService
+from domain.value_objects.embedding_type import EmbeddingType
+from domain.utils.text_tokens import containment
+
+
+# Engagement weights, aligned with the metric columns (likes, retweets, replies, quotes, bookmarks)
+_ENGAGEMENT_WEIGHTS = (1.0, 2.0, 1.0, 1.0, 0.5)
+
+
+@lru_cache(maxsize=65536)
+def _engagement_from_tuple(likes, retweets, replies, quotes, bookmarks, followers) -> float:
+    """
+    Engagement score for a single set of metrics (pure function of the 6 numbers → safe to memoize).
+    Plain Python arithmetic: same formula as GrowthScoreCalculatorService._compute_engagement_scores_batch
+    (see the engagement curve there), without building numpy arrays for one tweet.
+    """
+    raw_engagement = sum(weight * value for weight, value in zip(_ENGAGEMENT_WEIGHTS, (likes, retweets, replies, quotes, bookmarks)))
+    return min(raw_engagement / max(followers, 1.0) * 10.0, 1.0)
 
 
 class GrowthScoreCalculatorService(GrowthScoreCalculatorPort):
@@ -43,65 +65,54 @@ class GrowthScoreCalculatorService(GrowthScoreCalculatorPort):
 
     SCORING_VERSION = "v1"
 
+    # Fixed sub-score layout; WEIGHTS is aligned with it (equal weights == simple average)
+    SUBSCORE_KEYS = ("engagement", "style_alignment", "topic_relevance")
+    WEIGHTS = np.array([1.0, 1.0, 1.0], dtype=np.float32)
+
+    # Engagement weights, aligned with the metric columns (likes, retweets, replies, quotes, bookmarks)
+    ENGAGEMENT_WEIGHTS = np.array(_ENGAGEMENT_WEIGHTS, dtype=np.float32)
+
+    _EMPTY_SCORES = np.zeros(3, dtype=np.float32)
+    _EMPTY_MASK = np.zeros(3, dtype=bool)
+    _ENGAGEMENT_ONLY_MASK = np.array([True, False, False], dtype=bool)
+
+    # Max tweets scored concurrently by compute_growth_scores (stats pipeline runs, backfills)
+    BACKFILL_MAX_CONCURRENCY = 32
+
+    # Placeholder sub-scores used while the embeddings needed for the real similarity are not loaded in memory
+    STYLE_ALIGNMENT_PLACEHOLDER = 0.8
+    TOPIC_RELEVANCE_PLACEHOLDER = 0.85
+
+    def __init__(self, vector_similarity: Optional[VectorSimilarityService] = None):
+        # When no similarity service is injected, style/topic scores keep their placeholder values
+        self.vector_similarity = vector_similarity
+
     async def compute_growth_score(self, tweet: Tweet) -> Optional[GrowthScore]:
         """
         Compute the full growth score (sub-scores + overall).
         Returns a GrowthScore object or None.
         """
-        subscores = await self.compute_subscores(tweet)
-        if not subscores:
-            return None
-
-        overall = await self.combine_subscores(subscores)
-
-        return GrowthScore(
-            engagement=subscores.get("engagement"),
-            style_alignment=subscores.get("style_alignment"),
-            topic_relevance=subscores.get("topic_relevance"),
-            overall=overall,
-            version=self.SCORING_VERSION,
-        )
+        return await self._compute_growth_score(tweet, self._compute_engagement_score(tweet))
 
     async def compute_subscores(self, tweet: Tweet) -> Dict[str, float]:
         """
         Compute individual sub-scores.
-        This implementation is intentionally simple and can be expanded later.
+        Dict view (port contract) over the fixed-shape vector from _compute_subscore_vector.
         """
+        scores, mask = await self._compute_subscore_vector(tweet, self._compute_engagement_score(tweet))
+        return {key: float(score) for key, score, present in zip(self.SUBSCORE_KEYS, scores, mask) if present}
 
-        subscores: Dict[str, float] = {}
-
-        # -------------------------
-        # 1. Engagement score
-        # -------------------------
-        engagement_score = self._compute_engagement_score(tweet)
-        if engagement_score is not None:
-            subscores["engagement"] = engagement_score
-
-        # -------------------------
-        # 2. Style alignment score
-        # -------------------------
-        style_score = await self._compute_style_alignment_score(tweet)
-        if style_score is not None:
-            subscores["style_alignment"] = style_score
-
-        # -------------------------
-        # 3. Topic relevance score
-        # -------------------------
-        topic_score = await self._compute_topic_relevance_score(tweet)
-        if topic_score is not None:
-            subscores["topic_relevance"] = topic_score
-
-        return subscores
-
-    async def combine_subscores(self, subscores: Dict[str, float]) -> float:
+    def combine_subscores(self, subscores: Dict[str, float]) -> float:
         """
         Combine sub-scores into a final score.
-        Default strategy: simple average.
+        Default strategy: weighted average (WEIGHTS) over the sub-scores present.
         """
         if not subscores:
             return 0.0
 
-        return sum(subscores.values()) / len(subscores)
+        scores = np.array([subscores.get(key, 0.0) for key in self.SUBSCORE_KEYS], dtype=np.float32)
+        mask = np.array([key in subscores for key in self.SUBSCORE_KEYS], dtype=bool)
+        return self._combine_vector(scores, mask)
 
     def scoring_version(self) -> str:
         """
@@ -112,48 +123,119 @@ class GrowthScoreCalculatorService(GrowthScoreCalculatorPort):
     async def recompute_for_historical_tweets(self, user_id: str) -> None:
         """
         Optional: Recompute scores for all tweets of a user.
-        Implementation left empty intentionally.
+        Implementation left empty intentionally: this is a domain service and cannot read tweets
+        from the repository. Callers that load historical tweets should use compute_growth_scores()
+        (bounded concurrency).
         """
         return None
 
+    async def compute_growth_scores(self, tweets: List[Tweet]) -> List[Optional[GrowthScore]]:
+        """
+        Compute the growth score of many tweets concurrently (stats pipeline runs, historical backfills),
+        with at most BACKFILL_MAX_CONCURRENCY tweets in flight. Results keep the input order.
+        The engagement sub-scores of all tweets are computed up front in one vectorized pass.
+        """
+        semaphore = asyncio.Semaphore(self.BACKFILL_MAX_CONCURRENCY)
+
+        async def _bounded(tweet: Tweet, engagement_score: Optional[float]) -> Optional[GrowthScore]:
+            async with semaphore:
+                return await self._compute_growth_score(tweet, engagement_score)
+
+        engagement_scores = self._compute_engagement_scores(tweets)
+        return await asyncio.gather(*(_bounded(tweet, score) for tweet, score in zip(tweets, engagement_scores)))
+
     # ---------------------------------------------------------
     # INTERNAL HELPERS
     # ---------------------------------------------------------
 
-    def _compute_engagement_score(self, tweet: Tweet) -> Optional[float]:
+    async def _compute_growth_score(self, tweet: Tweet, engagement_score: Optional[float]) -> Optional[GrowthScore]:
         """
-        Compute engagement score from twitter_stats.
-        Updated heuristic:
-        - combine engagement metrics (likes, retweets, replies, quotes, bookmarks)
-        - normalize by author followers to get a relative engagement rate
-        - scale to 0–1 range using a realistic engagement curve
+        Full growth score of a tweet whose engagement sub-score is already computed (scalar or batch path).
         """
-        stats = tweet.twitter_stats
-        if not stats:
+        scores, mask = await self._compute_subscore_vector(tweet, engagement_score)
+        if not mask.any():
             return None
 
-        # Basic engagement metrics
-        likes = stats.likes.value if stats.likes else 0
-        retweets = stats.retweets.value if stats.retweets else 0
-        replies = stats.replies.value if stats.replies else 0
-        quotes = stats.quotes.value if stats.quotes else 0
-        bookmarks = stats.bookmarks.value if stats.bookmarks else 0
-
-        # Followers of the author (critical for normalization)
-        followers = stats.author_followers.value if stats.author_followers else 0
-        followers = max(followers, 1)  # avoid division by zero
-
-        # Weighted engagement formula
-        raw_engagement = (
-            likes +
-            (2 * retweets) +
-            replies +
-            quotes +
-            (0.5 * bookmarks)
+        overall = self._combine_vector(scores, mask)
+        engagement, style_alignment, topic_relevance = (
+            float(score) if present else None for score, present in zip(scores, mask)
         )
 
-        # Engagement rate relative to audience size
-        engagement_rate = raw_engagement / followers
+        return GrowthScore(
+            engagement=engagement,
+            style_alignment=style_alignment,
+            topic_relevance=topic_relevance,
+            overall=overall,
+            version=self.SCORING_VERSION,
+        )
+
+    async def _compute_subscore_vector(self, tweet: Tweet, engagement_score: Optional[float]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the sub-scores as a fixed-shape float32 vector [engagement, style, topic]
+        plus a boolean mask of which ones are present (engagement is computed by the caller: scalar or batch).
+        """
+        # Fast path: no embeddings yet (most freshly ingested tweets) → style/topic would be None anyway
+        if tweet.embedding_refs is None:
+            if engagement_score is None:
+                return self._EMPTY_SCORES, self._EMPTY_MASK
+            return np.array([engagement_score, 0.0, 0.0], dtype=np.float32), self._ENGAGEMENT_ONLY_MASK
+
+        # Style and topic are independent vector-store lookups → run them concurrently
+        style_score, topic_score = await asyncio.gather(
+            self._compute_style_alignment_score(tweet),
+            self._compute_topic_relevance_score(tweet),
+        )
+
+        values = (engagement_score, style_score, topic_score)
+        scores = np.array([0.0 if v is None else v for v in values], dtype=np.float32)
+        mask = np.array([v is not None for v in values], dtype=bool)
+        return scores, mask
+
+    def _combine_vector(self, scores: np.ndarray, mask: np.ndarray) -> float:
+        weights = self.WEIGHTS * mask
+        total_weight = weights.sum()
+        if total_weight == 0:
+            return 0.0
+        return float((scores * weights).sum() / total_weight)
+
+    @staticmethod
+    def _metric(metric) -> float:
+        return metric.value if metric and metric.value is not None else 0
+
+    @classmethod
+    def _stats_to_matrix(cls, stats_list) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build the float32 [N, 5] metrics matrix (likes, retweets, replies, quotes, bookmarks)
+        and the [N] followers vector expected by _compute_engagement_scores_batch.
+        """
+        n = len(stats_list)
+        metrics = np.empty((n, 5), dtype=np.float32)
+        followers = np.empty(n, dtype=np.float32)
+        for i, stats in enumerate(stats_list):
+            metrics[i] = (
+                cls._metric(stats.likes),
+                cls._metric(stats.retweets),
+                cls._metric(stats.replies),
+                cls._metric(stats.quotes),
+                cls._metric(stats.bookmarks),
+            )
+            followers[i] = cls._metric(stats.author_followers)
+        return metrics, followers
+
+    @classmethod
+    def _compute_engagement_scores_batch(cls, metrics: np.ndarray, followers: np.ndarray) -> np.ndarray:
+        """
+        Vectorized engagement kernel: [N, 5] metrics matrix + [N] followers vector (dtype float32).
+        Heuristic:
+        - combine engagement metrics (likes, retweets, replies, quotes, bookmarks) → single M @ W
+        - normalize by author followers to get a relative engagement rate
+        - scale to 0–1 range using a realistic engagement curve
+        """
+        # Weighted engagement formula (likes + 2*retweets + replies + quotes + 0.5*bookmarks)
+        raw_engagement = metrics @ cls.ENGAGEMENT_WEIGHTS
+
+        # Engagement rate relative to audience size (avoid division by zero)
+        engagement_rate = raw_engagement / np.maximum(followers, 1.0)
 
         # ---------------------------------------------------------
         # Scale to 0–1 range using a realistic engagement curve (relative to the number of followers of the account).
@@ -170,14 +252,45 @@ class GrowthScoreCalculatorService(GrowthScoreCalculatorPort):
         #
         # This curve avoids saturating too early and differentiates between normal, good, and exceptional tweets.
         # ---------------------------------------------------------
-        engagement_score = min(engagement_rate * 10, 1.0)
+        return np.minimum(engagement_rate * 10.0, 1.0)
+
+    def _compute_engagement_scores(self, tweets: List[Tweet]) -> List[Optional[float]]:
+        """
+        Engagement sub-scores of many tweets: one [N, 5] metrics matrix through _compute_engagement_scores_batch.
+        Tweets without twitter_stats get None (same as the scalar path).
+        """
+        with_stats = [i for i, t in enumerate(tweets) if t.twitter_stats]
+        scores: List[Optional[float]] = [None] * len(tweets)
+        if not with_stats:
+            return scores
 
-        return engagement_score
+        metrics, followers = self._stats_to_matrix([tweets[i].twitter_stats for i in with_stats])
+        for i, score in zip(with_stats, self._compute_engagement_scores_batch(metrics, followers).tolist()):
+            scores[i] = score
+        return scores
+
+    def _compute_engagement_score(self, tweet: Tweet) -> Optional[float]:
+        """
+        Compute engagement score from twitter_stats.
+        Extracts the metric values once and looks them up in the memoized _engagement_from_tuple.
+        """
+        stats = tweet.twitter_stats
+        if not stats:
+            return None
+
+        return _engagement_from_tuple(
+            self._metric(stats.likes),
+            self._metric(stats.retweets),
+            self._metric(stats.replies),
+            self._metric(stats.quotes),
+            self._metric(stats.bookmarks),
+            self._metric(stats.author_followers),
+        )
 
 
     async def _compute_style_alignment_score(self, tweet: Tweet) -> Optional[float]:
         """
-        Placeholder: compute similarity between tweet_text_embedding and creator_style_embedding.
+        Cosine similarity between tweet_text_embedding and creator_style_embedding (clamped to 0–1).
         """
         refs = tweet.embedding_refs
         if not refs:
@@ -186,13 +299,20 @@ class GrowthScoreCalculatorService(GrowthScoreCalculatorPort):
         if not refs.tweet_text_id or not refs.creator_style_id:
             return None
 
-        # TODO: call vector store to compute cosine similarity
-        return 0.8
+        # no creator_style source is loaded yet (nothing fills that kind so far) → placeholder
+        if self.vector_similarity is None or not self.vector_similarity.has_kind(VectorSimilarityService.CREATOR_STYLE_KIND):
+            return self.STYLE_ALIGNMENT_PLACEHOLDER
+
+        similarity = await self.vector_similarity.similarity(
+            refs.tweet_text_id, VectorSimilarityService.CREATOR_STYLE_KIND, refs.creator_style_id)
+        return self.STYLE_ALIGNMENT_PLACEHOLDER if similarity is None else self._clamp_similarity(similarity)
 
 
     async def _compute_topic_relevance_score(self, tweet: Tweet) -> Optional[float]:
         """
-        Placeholder: compute similarity between tweet_text_embedding and video_transcript_embedding.
+        Hybrid topic relevance: max(cosine similarity between tweet_text_embedding and
+        video_transcript_embedding, share of the tweet tokens found in the transcript tokens).
+        Never lower than pure cosine; the keyword signal catches entity-specific matches.
         """
         refs = tweet.embedding_refs
         if not refs:
@@ -201,5 +321,27 @@ class GrowthScoreCalculatorService(GrowthScoreCalculatorPort):
         if not refs.tweet_text_id or not refs.video_transcript_id:
             return None
 
-        # TODO: call vector store to compute cosine similarity
-        return 0.85
+        similarity = None
+        if self.vector_similarity is not None:
+            similarity = await self.vector_similarity.similarity(
+                refs.tweet_text_id, EmbeddingType.VIDEO_TRANSCRIPT.to_str(), refs.video_transcript_id)
+
+        # Tweet token sets are precomputed at ingestion time (older tweets may not have them); transcript ones by the caller
+        keyword_overlap = None
+        if tweet.text_tokens is not None and tweet.transcript_tokens is not None:
+            keyword_overlap = containment(tweet.text_tokens, tweet.transcript_tokens)
+
+        # embeddings not in memory (not loaded yet, or evicted) → keyword overlap alone, or the placeholder without tokens
+        if similarity is None:
+            return self.TOPIC_RELEVANCE_PLACEHOLDER if keyword_overlap is None else keyword_overlap
+
+        cosine = self._clamp_similarity(similarity)
+        return cosine if keyword_overlap is None else max(cosine, keyword_overlap)
+
+
+    @staticmethod
+    def _clamp_similarity(similarity: Optional[float]) -> Optional[float]:
+        # Cosine similarity is in [-1, 1]; sub-scores are in [0, 1]
+        if similarity is None:
+            return None
+        return min(max(similarity, 0.0), 1.0)
@@ -3,10 +3,9 @@
 # valorar moverlo a domain/services
 
 import logging
-import inspect
-from typing import Dict
 from domain.ports.inbound.tweet_output_guardrail_service_port import TweetOutputGuardrailPort
 from domain.entities.user_prompt import TweetLengthPolicy, TweetLengthMode, TweetLengthUnit
+from domain.value_objects.tweet_generation_response import TweetGenerationResponse
 
 logger = logging.getLogger(__name__)
 
@@ -16,30 +15,30 @@ class TweetOutputGuardrailService(TweetOutputGuardrailPort):
     Concrete implementation of tweet guardrail validation logic.
     """
 
-    def is_count_valid(self, json_response: Dict, expected_count: int) -> bool:
-        # Extract tweets array
-        tweets = json_response.get("tweets", [])
+    def is_count_valid(self, response: TweetGenerationResponse, expected_count: int) -> bool:
+        # Extract tweets tuple
+        tweets = response.tweets
 
         # Validate count
         is_valid = len(tweets) == expected_count
 
         # Logging
-        logger.info("Count validation result: %s (expected=%s, actual=%s)", is_valid, expected_count, len(tweets), extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+        logger.info("Count validation result: %s (expected=%s, actual=%s)", is_valid, expected_count, len(tweets), extra={"class": self.__class__.__name__})
 
         return is_valid
 
-    def is_length_valid(self, json_response: Dict, policy: TweetLengthPolicy) -> bool:
+    def is_length_valid(self, response: TweetGenerationResponse, policy: TweetLengthPolicy) -> bool:
         # Extract tweets
-        tweets = json_response.get("tweets", [])
+        tweets = response.tweets
 
         # Only character-based validation supported for now
         if policy.unit != TweetLengthUnit.CHARS:
-            logger.info("Length validation skipped: unsupported unit '%s'", policy.unit, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+            logger.info("Length validation skipped: unsupported unit '%s'", policy.unit, extra={"class": self.__class__.__name__})
             return True
 
         # Validate each tweet according to the policy
         for t in tweets:
-            text = t.get("text", "")
+            text = t.text
             length = len(text)
 
             if policy.mode == TweetLengthMode.FIXED:
@@ -58,20 +57,20 @@ class TweetOutputGuardrailService(TweetOutputGuardrailPort):
                 max_len = int(policy.max_length * 1.25) if policy.max_length else 9999  # added 25% margin in max length
 
             else:
-                logger.error("Unknown TweetLengthMode '%s'", policy.mode, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                logger.error("Unknown TweetLengthMode '%s'", policy.mode, extra={"class": self.__class__.__name__})
                 return False
 
             # Check length boundaries
             if not (min_len <= length <= max_len):
-                logger.info("Length validation failed for tweet='%s' (len=%s, min=%s, max=%s)", text, length, min_len, max_len, extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+                logger.info("Length validation failed for tweet='%s' (len=%s, min=%s, max=%s)", text, length, min_len, max_len, extra={"class": self.__class__.__name__})
                 return False
 
         # All tweets passed
-        logger.info("Length validation result: True", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+        logger.info("Length validation result: True", extra={"class": self.__class__.__name__})
         return True
 
-    def is_semantically_valid(self, json_response: Dict) -> bool:
+    def is_semantically_valid(self, response: TweetGenerationResponse) -> bool:
         # Placeholder for future LLM-based semantic validation
-        logger.info("Semantic validation skipped (stub)", extra={"class": self.__class__.__name__, "method": inspect.currentframe().f_code.co_name})
+        logger.info("Semantic validation skipped (stub)", extra={"class": self.__class__.__name__})
         return True
 
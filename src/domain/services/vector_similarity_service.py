@@ -0,0 +1,203 @@
+# src/domain/services/vector_similarity_service.py
+
+# === Domain Service ===
+# Cálculo puro de similitud coseno entre embeddings ya cargados en memoria.
+# No toca repositorios: quien tenga acceso a la vectorDB (pipelines) es quien carga las matrices con load()/add().
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from domain.value_objects.embedding_type import EmbeddingType
+
+logger = logging.getLogger(__name__)
+
+
+class VectorSimilarityService:
+    """
+    Batched cosine similarity over in-memory embedding matrices.
+
+    Embeddings are grouped by kind (EmbeddingType values plus "creator_style").
+    Each kind is stored as a contiguous float32 matrix with L2-normalized rows, so cosine
+    similarity is a plain dot product and a whole batch is a single matrix product (sgemm).
+    The matrix of a kind grows with spare capacity (amortized doubling) up to `max_rows_per_kind`;
+    once full, new rows overwrite the oldest ones (ring buffer), so memory stays bounded.
+
+    Single-pair queries (similarity()) are not computed one by one: they are pushed to an
+    asyncio.Queue and a micro-batcher flushes the queue every `flush_interval_seconds`,
+    computing all pending queries against the same reference kind with one `Q @ R.T`.
+    """
+
+    QUERY_KIND = EmbeddingType.TWEET_TEXT.to_str()
+    CREATOR_STYLE_KIND = "creator_style"     # not an EmbeddingType yet (see TweetEmbeddingRefs.creator_style_id)
+
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self, flush_interval_seconds: float = 0.005, max_rows_per_kind: int = 200_000):
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_rows_per_kind = max_rows_per_kind
+        self._matrices: Dict[str, np.ndarray] = {}      # capacity-sized buffers: only rows [0, _sizes[kind]) are valid
+        self._sizes: Dict[str, int] = {}
+        self._row_index: Dict[str, Dict[str, int]] = {}     # embedding id -> row
+        self._row_ids: Dict[str, List[str]] = {}            # row -> embedding id (to evict the overwritten row)
+        self._next_evicted_row: Dict[str, int] = {}         # ring cursor once the kind is full (oldest row)
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    # ---------------------------------------------------------
+    # MATRIX LOADING
+    # ---------------------------------------------------------
+
+    def load(self, kind: str, ids: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        """
+        Replace the matrix of the given kind with the given vectors (one row per id).
+        """
+        for state in (self._matrices, self._sizes, self._row_index, self._row_ids, self._next_evicted_row):
+            state.pop(kind, None)
+        self.add(kind, ids, vectors)
+
+    def add(self, kind: str, ids: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        """
+        Add vectors to the matrix of the given kind (ids already present are overwritten in place).
+        No full-matrix copy per call: rows go into spare capacity, or replace the oldest rows once the kind is full.
+        """
+        normalized = self._normalize(vectors)
+        index = self._row_index.setdefault(kind, {})
+
+        for embedding_id, vector in zip(ids, normalized):
+            embedding_id = str(embedding_id)
+            row = index.get(embedding_id)
+            if row is None:
+                row = self._allocate_row(kind, embedding_id, normalized.shape[1])
+            self._matrices[kind][row] = vector
+
+    def has(self, kind: str, embedding_id: str) -> bool:
+        return str(embedding_id) in self._row_index.get(kind, {})
+
+    def has_kind(self, kind: str) -> bool:
+        """
+        Whether any embedding of the given kind is loaded.
+        """
+        return self._sizes.get(kind, 0) > 0
+
+    # ---------------------------------------------------------
+    # SIMILARITY
+    # ---------------------------------------------------------
+
+    def similarity_matrix(self, reference_kind: str, query_kind: str = QUERY_KIND) -> np.ndarray:
+        """
+        Full similarity matrix between all query rows and all reference rows: Q @ R.T -> [N, M].
+        """
+        return self._rows(query_kind) @ self._rows(reference_kind).T
+
+    async def similarity(self, query_id: str, reference_kind: str, reference_id: str) -> Optional[float]:
+        """
+        Cosine similarity between a tweet text embedding and a reference embedding of the given kind.
+        The query is micro-batched with any other query submitted in the same flush window.
+        Returns None if any of the two vectors is not loaded.
+        """
+        if not self.has(self.QUERY_KIND, query_id) or not self.has(reference_kind, reference_id):
+            return None
+
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((str(query_id), reference_kind, str(reference_id), future))
+        return await future
+
+    # ---------------------------------------------------------
+    # INTERNAL HELPERS
+    # ---------------------------------------------------------
+
+    def _rows(self, kind: str) -> np.ndarray:
+        return self._matrices[kind][:self._sizes[kind]]
+
+    def _allocate_row(self, kind: str, embedding_id: str, dim: int) -> int:
+        size = self._sizes.get(kind, 0)
+        row_ids = self._row_ids.setdefault(kind, [])
+
+        if size < self.max_rows_per_kind:
+            matrix = self._matrices.get(kind)
+            if matrix is None or size == matrix.shape[0]:
+                # grow with spare capacity (amortized O(1) per row), never past the cap
+                capacity = min(max(2 * size, self.INITIAL_CAPACITY), self.max_rows_per_kind)
+                grown = np.empty((capacity, dim), dtype=np.float32)
+                if size:
+                    grown[:size] = matrix[:size]
+                self._matrices[kind] = grown
+            row = size
+            self._sizes[kind] = size + 1
+            row_ids.append(embedding_id)
+        else:
+            # full: overwrite the oldest row
+            row = self._next_evicted_row.get(kind, 0)
+            del self._row_index[kind][row_ids[row]]
+            row_ids[row] = embedding_id
+            self._next_evicted_row[kind] = (row + 1) % self.max_rows_per_kind
+
+        self._row_index[kind][embedding_id] = row
+        return row
+
+    @staticmethod
+    def _normalize(vectors: Sequence[Sequence[float]]) -> np.ndarray:
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1) if matrix.size else matrix.reshape(0, 0)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return np.ascontiguousarray(matrix / np.maximum(norms, 1e-12))
+
+    def _ensure_worker(self) -> None:
+        # Lazily bound to the running event loop (the service is instantiated at import time in main.py)
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        while True:
+            first = await self._queue.get()
+            await asyncio.sleep(self.flush_interval_seconds)
+
+            pending = [first]
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+
+            try:
+                self._flush(pending)
+            except Exception as exc:
+                logger.exception("Similarity batch failed (%s queries)", len(pending), extra={"class": self.__class__.__name__})
+                for *_, future in pending:
+                    if not future.done():
+                        future.set_exception(exc)
+
+    def _flush(self, pending: List[Tuple[str, str, str, asyncio.Future]]) -> None:
+        # Group by reference kind: one sgemm per reference matrix
+        by_kind: Dict[str, List[Tuple[str, str, asyncio.Future]]] = {}
+        for query_id, reference_kind, reference_id, future in pending:
+            by_kind.setdefault(reference_kind, []).append((query_id, reference_id, future))
+
+        query_matrix = self._matrices[self.QUERY_KIND]
+        query_index = self._row_index[self.QUERY_KIND]
+
+        for reference_kind, items in by_kind.items():
+            reference_matrix = self._matrices[reference_kind]
+            reference_index = self._row_index[reference_kind]
+
+            # rows evicted (overwritten) since the query was submitted: no similarity
+            evicted = [item for item in items if item[0] not in query_index or item[1] not in reference_index]
+            for *_, future in evicted:
+                if not future.done():
+                    future.set_result(None)
+            items = [item for item in items if item[0] in query_index and item[1] in reference_index]
+            if not items:
+                continue
+
+            query_rows = [query_index[query_id] for query_id, _, _ in items]
+            reference_rows = list(dict.fromkeys(reference_index[reference_id] for _, reference_id, _ in items))
+            reference_pos = {row: pos for pos, row in enumerate(reference_rows)}
+
+            sims = query_matrix[query_rows] @ reference_matrix[reference_rows].T
+
+            for i, (_, reference_id, future) in enumerate(items):
+                if not future.done():
+                    future.set_result(float(sims[i, reference_pos[reference_index[reference_id]]]))
@@ -0,0 +1,29 @@
+# src/domain/utils/text_tokens.py
+
+# Funciones puras de tokenización (sin repos ni clientes) usadas por el scoring de relevancia.
+
+import re
+from typing import FrozenSet, Optional
+
+_TOKEN_RE = re.compile(r"[#@]?\w+", re.UNICODE)
+_MIN_TOKEN_LENGTH = 3
+
+
+def tokenize(text: Optional[str]) -> FrozenSet[str]:
+    """
+    Lower-cased word/hashtag/mention tokens of the text (short tokens dropped).
+    Computed once per text (tweets at ingestion time, transcripts once per video and stats run); never per score call.
+    """
+    if not text:
+        return frozenset()
+    return frozenset(t for t in _TOKEN_RE.findall(text.lower()) if len(t) >= _MIN_TOKEN_LENGTH)
+
+
+def containment(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """
+    Share of the tokens of a that are also in b: |a ∩ b| / |a| (0.0 when a is empty).
+    Unlike Jaccard, a short text fully covered by a long one scores 1.0 (the size of b does not dilute it).
+    """
+    if not a:
+        return 0.0
+    return len(a & b) / len(a)
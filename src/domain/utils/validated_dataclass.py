@@ -0,0 +1,50 @@
+# src/domain/utils/validated_dataclass.py
+
+# Genera el __post_init__ de validación de un value object una sola vez, al definir la clase.
+
+from typing import Iterable
+
+_TYPE_NAMES = {int: "an integer", bool: "a boolean", float: "a float", str: "a string"}
+
+
+def validated_dataclass(non_negative: Iterable[str] = ()):
+    """
+    Class decorator (apply it *below* @dataclass so the dataclass __init__ calls the generated hook)
+    that builds an unrolled __post_init__ from the class annotations:
+      - exact `type(self.x) is T` checks for fields annotated int / bool / float / str
+      - one combined `< 0` check for the fields listed in `non_negative` (only when it fails are the
+        offending fields worked out, so the error names them)
+    The validator source is compiled once with exec(). Unknown names in `non_negative`
+    (e.g. typos) raise at class definition instead of at first instantiation.
+    """
+    non_negative = tuple(non_negative)
+
+    def decorator(cls):
+        annotations = cls.__dict__.get("__annotations__", {})
+
+        unknown = [name for name in non_negative if name not in annotations]
+        if unknown:
+            raise TypeError(f"{cls.__name__}: non_negative references unknown fields {unknown}")
+
+        lines = ["def __post_init__(self):"]
+        for name, typ in annotations.items():
+            if typ in _TYPE_NAMES:
+                lines.append(f"    if type(self.{name}) is not {typ.__name__}:")
+                lines.append(f"        raise TypeError({name + ' must be ' + _TYPE_NAMES[typ]!r})")
+        if non_negative:
+            condition = " or ".join(f"self.{name} < 0" for name in non_negative)
+            pairs = ", ".join(f"({name!r}, self.{name})" for name in non_negative)
+            lines.append(f"    if {condition}:")
+            lines.append(f"        negative = [name for name, value in ({pairs},) if value < 0]")
+            lines.append("        raise ValueError(', '.join(negative) + ' cannot be negative')")
+        if len(lines) == 1:
+            lines.append("    pass")
+
+        namespace: dict = {}
+        exec("\n".join(lines), {}, namespace)
+        post_init = namespace["__post_init__"]
+        post_init.__qualname__ = f"{cls.__qualname__}.__post_init__"
+        cls.__post_init__ = post_init
+        return cls
+
+    return decorator
@@ -0,0 +1,98 @@
+# src/domain/value_objects/embedding_matrix.py
+
+from dataclasses import dataclass
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+from domain.value_objects.embedding_type import EmbeddingType
+from domain.value_objects.embedding_vector import EmbeddingVector
+
+
+@dataclass(frozen=True, slots=True)
+class EmbeddingMatrix:
+    """
+    Structure-of-arrays view over many embeddings, for bulk similarity work.
+    Row i of every column describes the same embedding:
+      - ids:        (N,)   object  → embedding _id
+      - tweet_ids:  (N,)   object  → tweet _id
+      - types:      (N,)   int8    → EmbeddingType codes (IntEnum values; masks like matrix.types == 0)
+      - vectors:    (N, D) float32 → dequantized vectors (contiguous)
+      - norms:      (N,)   float32 → L2 norms of the rows of vectors
+    """
+    ids: np.ndarray
+    tweet_ids: np.ndarray
+    types: np.ndarray
+    vectors: np.ndarray
+    norms: np.ndarray
+
+    def __len__(self) -> int:
+        return self.ids.shape[0]
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Tuple[str, str, EmbeddingType, np.ndarray, float]],
+        count: int,
+        dim: Optional[int] = None,
+    ) -> "EmbeddingMatrix":
+        """
+        Build the matrix streaming (id, tweet_id, type, int8_vector, scale) rows into preallocated arrays.
+        `count` is the number of rows; `dim` defaults to the length of the first vector.
+        """
+        ids = np.empty(count, dtype=object)
+        tweet_ids = np.empty(count, dtype=object)
+        types = np.empty(count, dtype=np.int8)
+        vectors: Optional[np.ndarray] = None if dim is None else np.empty((count, dim), dtype=np.float32)
+
+        filled = 0
+        for i, (embedding_id, tweet_id, embedding_type, vector, scale) in enumerate(rows):
+            if vectors is None:
+                vectors = np.empty((count, len(vector)), dtype=np.float32)
+            ids[i] = embedding_id
+            tweet_ids[i] = tweet_id
+            types[i] = embedding_type
+            np.multiply(vector, scale, out=vectors[i], casting="unsafe")
+            filled = i + 1
+
+        if vectors is None:
+            vectors = np.empty((0, 0), dtype=np.float32)
+
+        vectors = vectors[:filled]
+        return cls(
+            ids=ids[:filled],
+            tweet_ids=tweet_ids[:filled],
+            types=types[:filled],
+            vectors=vectors,
+            norms=np.linalg.norm(vectors, axis=1).astype(np.float32),
+        )
+
+    @classmethod
+    def from_embeddings(cls, embeddings: Iterable[EmbeddingVector]) -> "EmbeddingMatrix":
+        embeddings = list(embeddings)
+        return cls.from_rows(
+            ((e.id, e.tweet_id, e.type, e.vector, e.scale) for e in embeddings),
+            count=len(embeddings),
+        )
+
+    def of_type(self, embedding_type: EmbeddingType) -> "EmbeddingMatrix":
+        """
+        Rows of the given type (branchless boolean mask over the int8 types column).
+        """
+        mask = self.types == embedding_type
+        return EmbeddingMatrix(
+            ids=self.ids[mask],
+            tweet_ids=self.tweet_ids[mask],
+            types=self.types[mask],
+            vectors=self.vectors[mask],
+            norms=self.norms[mask],
+        )
+
+    def cosine_similarity(self, queries: np.ndarray) -> np.ndarray:
+        """
+        Cosine similarity of each query row against every row of the matrix: one sgemm → (Q, N).
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        query_norms = np.linalg.norm(queries, axis=1)
+        sims = queries @ self.vectors.T
+        return sims / np.maximum(np.outer(query_norms, self.norms), 1e-12)
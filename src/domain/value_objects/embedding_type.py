@@ -1,7 +1,18 @@
 # src/domain/value_objects/embedding_type.py
 
-from enum import Enum
+from enum import IntEnum
 
-class EmbeddingType(str, Enum):
-    TWEET_TEXT = "tweet_text"
-    VIDEO_TRANSCRIPT = "video_transcript"
+class EmbeddingType(IntEnum):
+    """
+    Integer-coded embedding type (cheap comparisons, usable directly as an int8 column code).
+    Persisted as its lower-case name ("tweet_text" | "video_transcript") via to_str()/from_str().
+    """
+    TWEET_TEXT = 0
+    VIDEO_TRANSCRIPT = 1
+
+    def to_str(self) -> str:
+        return self.name.lower()
+
+    @classmethod
+    def from_str(cls, value: str) -> "EmbeddingType":
+        return cls[value.upper()]
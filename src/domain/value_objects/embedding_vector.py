@@ -2,20 +2,86 @@
 
 # TODO: valorar convertir este VO en un Entity xq finalmente tiene id y se persiste en una indexed vectorDB ("embeddings")
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional
+
+import numpy as np
+
 from domain.value_objects.embedding_type import EmbeddingType
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EmbeddingVector:
     """
     Value object representing a stored embedding vector in the vector database.
+    The vector is stored int8-quantized (symmetric, per-vector scale): fp32 ≈ int8 * scale.
     """
     id: Optional[str]           # MongoDB document ID
     tweet_id: str               # Tweet this embedding belongs to (is the mongo/entity _id, NOT the ID of the tweet in X)
     
     type: EmbeddingType         # "tweet_text" | "video_transcript"
-    vector: List[float]         # The embedding vector itself
-    
+    vector: np.ndarray          # The embedding vector itself (int8 quantized, contiguous 1-D array)
+    scale: float                # Dequantization scale (max(abs(v)) / 127)
+
     created_at: datetime        # Timestamp of creation
+
+    norm: Optional[float] = field(default=None)    # L2 norm of the int8 vector (computed once; persisted alongside the vector)
+    normalized: bool = field(default=False)         # True if the fp32 vector was L2-normalized before quantization
+
+    def __post_init__(self):
+        # Accept raw bytes (as read from BSON Binary) or any array-like; always keep a contiguous int8 buffer
+        # (frozen → object.__setattr__ for the one-time normalization at construction)
+        if isinstance(self.vector, (bytes, bytearray, memoryview)):
+            object.__setattr__(self, "vector", np.frombuffer(self.vector, dtype=np.int8))
+        else:
+            object.__setattr__(self, "vector", np.ascontiguousarray(self.vector, dtype=np.int8).reshape(-1))
+
+        if self.norm is None:
+            as_int32 = self.vector.astype(np.int32)
+            object.__setattr__(self, "norm", float(np.sqrt(np.dot(as_int32, as_int32))))
+
+    @classmethod
+    def from_fp32(
+        cls,
+        v: np.ndarray,
+        *,
+        id: Optional[str] = None,
+        tweet_id: str,
+        type: EmbeddingType,
+        created_at: datetime,
+    ) -> "EmbeddingVector":
+        """
+        Build an EmbeddingVector L2-normalizing the given fp32 vector and then quantizing it to int8,
+        so downstream similarity is a plain dot product (see cosine_similarity).
+        """
+        v = np.asarray(v, dtype=np.float32)
+        v = v / (float(np.linalg.norm(v)) or 1.0)
+        max_abs = float(np.max(np.abs(v))) if v.size else 0.0
+        scale = max_abs / 127 if max_abs > 0 else 1.0
+        q = np.round(v / scale).astype(np.int8)
+        return cls(id=id, tweet_id=tweet_id, type=type, vector=q, scale=scale, created_at=created_at, normalized=True)
+
+    def to_int8(self) -> np.ndarray:
+        return self.vector
+
+    def to_fp32(self) -> np.ndarray:
+        """
+        Dequantize the vector back to fp32.
+        """
+        return self.to_int8().astype(np.float32) * self.scale
+
+    def cosine_similarity(self, other: "EmbeddingVector") -> float:
+        """
+        Cosine similarity computed directly on the int8 values (no dequantization).
+        Integer dot product accumulated in int32.
+        - both normalized at ingestion: cosine == dequantized dot == dot * scale_a * scale_b (no divides)
+        - otherwise (older embeddings): divide by the precomputed norms; the scales cancel out
+          (dot * scale_a * scale_b / (norm_a * scale_a * norm_b * scale_b)).
+        """
+        dot = np.dot(self.vector.astype(np.int32), other.vector.astype(np.int32))
+        if self.normalized and other.normalized:
+            return float(dot * self.scale * other.scale)
+
+        if self.norm == 0 or other.norm == 0:
+            return 0.0
+        return float(dot / (self.norm * other.norm))
@@ -6,7 +6,7 @@ from typing import Optional
 from domain.entities.user_prompt import PromptContent, TweetLengthPolicy
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FinalPrompt:
     """
     Value object representing the fully resolved prompt used for tweet generation.
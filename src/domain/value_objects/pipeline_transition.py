@@ -0,0 +1,24 @@
+# src/domain/value_objects/pipeline_transition.py
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Literal
+
+PipelineName = Literal["ingestion", "publishing", "stats", "embeddings"]
+PipelineAction = Literal["start", "finish_success", "finish_fail", "schedule_next"]
+
+
+@dataclass(frozen=True)     # value object = inmutable = frozen
+class PipelineTransition:
+    """
+    Value Object describing one state change of a user's pipeline runtime status.
+    Several transitions are merged by the repository into a single atomic update.
+
+    Fields:
+      - pipeline: "ingestion" | "publishing" | "stats" | "embeddings"
+      - action: "start" | "finish_success" | "finish_fail" | "schedule_next"
+      - at: timestamp of the transition (started/finished at, or next scheduled start for "schedule_next")
+    """
+    pipeline: PipelineName
+    action: PipelineAction
+    at: datetime
@@ -2,11 +2,19 @@
 
 from dataclasses import dataclass, field
 
-@dataclass(frozen=True)     # value object = inmutable = frozen
+from domain.utils.validated_dataclass import validated_dataclass
+
+@dataclass(frozen=True, slots=True)     # value object = inmutable = frozen
+@validated_dataclass(non_negative=(
+    "ingestion_pipeline_frequency_minutes",
+    "publishing_pipeline_frequency_minutes",
+    "stats_pipeline_frequency_minutes",
+    "embeddings_pipeline_frequency_minutes",
+))
 class SchedulerConfig:
     """
     Value Object representing scheduler configuration.
-    Immutable and validated at construction.
+    Immutable and validated at construction (validator generated once by @validated_dataclass).
 
     Fields:
       - ingestion_pipeline_frequency_minutes: int >= 0
@@ -24,29 +32,3 @@ class SchedulerConfig:
     is_publishing_pipeline_enabled: bool        = field(default=True)
     is_stats_pipeline_enabled: bool             = field(default=True)
     is_embeddings_pipeline_enabled: bool             = field(default=True)
-
-    def __post_init__(self):
-        if not isinstance(self.ingestion_pipeline_frequency_minutes, int):
-            raise TypeError("ingestion_pipeline_frequency_minutes must be an integer")
-        if not isinstance(self.publishing_pipeline_frequency_minutes, int):
-            raise TypeError("publishing_pipeline_frequency_minutes must be an integer")
-        if not isinstance(self.stats_pipeline_frequency_minutes, int):
-            raise TypeError("stats_pipeline_frequency_minutes must be an integer")
-        if not isinstance(self.embeddings_pipeline_frequency_minutes, int):
-            raise TypeError("embeddings_pipeline_frequency_minutes must be an integer")
-        if self.ingestion_pipeline_frequency_minutes < 0:
-            raise ValueError("ingestion_pipeline_frequency_minutes cannot be negative")
-        if self.publishing_pipeline_frequency_minutes < 0:
-            raise ValueError("publishing_pipeline_frequency_minutes cannot be negative")
-        if self.stats_pipeline_frequency_minutes < 0:
-            raise ValueError("stats_pipeline_frequency_minutes cannot be negative")
-        if self.embeddings_pipeline_frequency_minutes < 0:
-            raise ValueError("embeddings_pipeline_frequency_minutes cannot be negative")    
-        if not isinstance(self.is_ingestion_pipeline_enabled, bool):
-            raise TypeError("is_ingestion_pipeline_enabled must be a boolean")
-        if not isinstance(self.is_publishing_pipeline_enabled, bool):
-            raise TypeError("is_publishing_pipeline_enabled must be a boolean")
-        if not isinstance(self.is_stats_pipeline_enabled, bool):
-            raise TypeError("is_stats_pipeline_enabled must be a boolean")
-        if not isinstance(self.is_embeddings_pipeline_enabled, bool):
-            raise TypeError("is_embeddings_pipeline_enabled must be a boolean")
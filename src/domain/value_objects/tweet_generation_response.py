@@ -0,0 +1,34 @@
+# src/domain/value_objects/tweet_generation_response.py
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+@dataclass(slots=True, frozen=True)
+class TweetItem:
+    """
+    Value object representing a single tweet returned by the LLM.
+    """
+    text: str
+    language: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class TweetGenerationResponse:
+    """
+    Value object representing the structured LLM output for tweet generation.
+    Expected JSON schema: {"tweets": [{"text": "...", "language": "..."}, ...]}
+    Slotted and immutable so guardrails read attributes instead of hashing dict keys.
+    """
+    tweets: tuple[TweetItem, ...]
+
+    @classmethod
+    def from_dict(cls, json_response: Dict[str, Any]) -> "TweetGenerationResponse":
+        raw_tweets = json_response.get("tweets", []) if isinstance(json_response, dict) else []
+        return cls(
+            tweets=tuple(
+                TweetItem(text=t.get("text", "") or "", language=t.get("language"))
+                for t in raw_tweets
+                if isinstance(t, dict)
+            )
+        )
@@ -7,6 +7,7 @@ from typing import Optional
 
 from domain.entities.user import UserTwitterCredentials
 from domain.ports.outbound.mongodb.user_repository_port import UserRepositoryPort
+from infrastructure.http_client import get_http_session
 
 from config import (
     X_OAUTH2_CLIENT_ID,
@@ -120,25 +121,24 @@ class TwitterOAuth2Service:
         }
 
         # Call Twitter token endpoint
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.TOKEN_URL,
-                data=data,
-                auth=aiohttp.BasicAuth(
-                    X_OAUTH2_CLIENT_ID,
-                    X_OAUTH2_CLIENT_SECRET
-                )
-            ) as resp:
+        async with get_http_session().post(
+            self.TOKEN_URL,
+            data=data,
+            auth=aiohttp.BasicAuth(
+                X_OAUTH2_CLIENT_ID,
+                X_OAUTH2_CLIENT_SECRET
+            )
+        ) as resp:
 
-                if resp.status != 200:
-                    body = await resp.text()
-                    logger.error(
-                        f"Failed to exchange code for tokens: {resp.status} - {body}",
-                        extra={"user_id": user_id, "module_name": __name__, "method": "exchange_code_for_tokens"},
-                    )
-                    raise RuntimeError(f"Twitter OAuth2 token exchange failed: {resp.status}")
+            if resp.status != 200:
+                body = await resp.text()
+                logger.error(
+                    f"Failed to exchange code for tokens: {resp.status} - {body}",
+                    extra={"user_id": user_id, "module_name": __name__, "method": "exchange_code_for_tokens"},
+                )
+                raise RuntimeError(f"Twitter OAuth2 token exchange failed: {resp.status}")
 
-                payload = await resp.json()
+            payload = await resp.json()
 
         # Extract tokens
         access_token = payload["access_token"]
@@ -184,21 +184,20 @@ class TwitterOAuth2Service:
             "client_id": X_OAUTH2_CLIENT_ID,
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(self.TOKEN_URL, data=data, auth=aiohttp.BasicAuth(
-                X_OAUTH2_CLIENT_ID,
-                X_OAUTH2_CLIENT_SECRET
-            )) as resp:
+        async with get_http_session().post(self.TOKEN_URL, data=data, auth=aiohttp.BasicAuth(
+            X_OAUTH2_CLIENT_ID,
+            X_OAUTH2_CLIENT_SECRET
+        )) as resp:
 
-                if resp.status != 200:
-                    body = await resp.text()
-                    logger.error(
-                        f"Failed to refresh tokens: {resp.status} - {body}",
-                        extra={"user_id": user_id, "module_name": __name__, "method": "refresh_tokens"},
-                    )
-                    raise RuntimeError(f"Twitter OAuth2 refresh failed: {resp.status}")
+            if resp.status != 200:
+                body = await resp.text()
+                logger.error(
+                    f"Failed to refresh tokens: {resp.status} - {body}",
+                    extra={"user_id": user_id, "module_name": __name__, "method": "refresh_tokens"},
+                )
+                raise RuntimeError(f"Twitter OAuth2 refresh failed: {resp.status}")
 
-                payload = await resp.json()
+            payload = await resp.json()
 
         new_access_token = payload["access_token"]
         new_refresh_token = payload.get("refresh_token", refresh_token)
@@ -0,0 +1,53 @@
+# src/infrastructure/http_client.py
+
+"""
+Lazily built aiohttp ClientSession shared by the outbound HTTP adapters (OpenAI embeddings, Twitter/X API, Twitter OAuth2).
+
+Public API:
+- get_http_session() -> aiohttp.ClientSession
+- close_http_session() -> None
+
+One session (and one connection pool) per process: keep-alive connections are reused across calls, so the TCP + TLS
+handshake to each host is paid once instead of on every request. Must be called with the event loop running.
+"""
+
+import logging
+from typing import Optional
+
+import aiohttp
+
+import config
+
+# Specific logger for this module
+logger = logging.getLogger(__name__)
+
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """
+    Return the process-wide aiohttp ClientSession, creating it on first call (or again after it was closed).
+    """
+    global _http_session
+
+    if _http_session is None or _http_session.closed:
+        connector = aiohttp.TCPConnector(
+            limit                   = config.HTTP_MAX_CONNECTIONS,
+            limit_per_host          = config.HTTP_MAX_CONNECTIONS_PER_HOST,
+            keepalive_timeout       = config.HTTP_KEEPALIVE_TIMEOUT_SECONDS,
+        )
+        _http_session = aiohttp.ClientSession(connector=connector)
+        logger.info("HTTP client session created (max connections: %s)", config.HTTP_MAX_CONNECTIONS, extra={"mod": __name__})
+
+    return _http_session
+
+
+async def close_http_session() -> None:
+    """
+    Close the shared ClientSession (and its connection pool). Called once on application shutdown.
+    """
+    global _http_session
+
+    if _http_session is not None:
+        await _http_session.close()
+        _http_session = None
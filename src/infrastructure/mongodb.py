@@ -2,10 +2,10 @@
 
 import os
 from datetime import datetime, timezone
+from typing import Optional
 import config
 
 # logging
-import inspect
 import logging
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
@@ -20,12 +20,61 @@ _BASE = f"mongodb+srv://{config.MONGO_USER}:{config.MONGO_PASSWORD}@{config.MONG
 URI_ASYNC = _BASE + "?retryWrites=true&w=majority"
 URI_SYNC  = _BASE + "?retryWrites=true&w=majority"
 
-# Async client (Motor)
-_motor_client: AsyncIOMotorClient = AsyncIOMotorClient(URI_ASYNC)
-db: AsyncIOMotorDatabase = _motor_client[config.MONGO_DB]
+# Async client (Motor): ONE client (and connection pool) per process, shared by every repository adapter
+_motor_client: Optional[AsyncIOMotorClient] = None
+
+
+def get_mongo_client() -> AsyncIOMotorClient:
+    """
+    Return the process-wide AsyncIOMotorClient, creating it on first call.
+    Repository adapters must receive a database handle from this client instead of building their own.
+    """
+    global _motor_client
+    if _motor_client is None:
+        _motor_client = AsyncIOMotorClient(
+            URI_ASYNC,
+            maxPoolSize                 = config.MONGO_MAX_POOL_SIZE,
+            minPoolSize                 = config.MONGO_MIN_POOL_SIZE,
+            maxIdleTimeMS               = config.MONGO_MAX_IDLE_TIME_MS,
+            waitQueueTimeoutMS          = config.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+            serverSelectionTimeoutMS    = config.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        )
+    return _motor_client
+
+
+def close_mongo_client() -> None:
+    """
+    Close the shared Motor client (and its connection pool). Called once on application shutdown.
+    """
+    global _motor_client
+    if _motor_client is not None:
+        _motor_client.close()
+        _motor_client = None
+
+
+def get_database() -> AsyncIOMotorDatabase:
+    """
+    Return the application database bound to the shared Motor client.
+    """
+    return get_mongo_client()[config.MONGO_DB]
+
+
+db: AsyncIOMotorDatabase = get_database()
+
+# Sync client for ping testing (PyMongo): created on first use, not at import (MongoClient resolves the SRV record
+# and starts its monitor threads as soon as it is built)
+_sync_client: Optional[MongoClient] = None
+
+
+def get_sync_client() -> MongoClient:
+    """
+    Return the process-wide PyMongo client used by the standalone ping/diagnostic scripts, creating it on first call.
+    """
+    global _sync_client
+    if _sync_client is None:
+        _sync_client = MongoClient(URI_SYNC, tz_aware=True, tzinfo=timezone.utc, server_api=ServerApi("1"))
+    return _sync_client
 
-# Sync client for ping testing (PyMongo)
-_sync_client = MongoClient(URI_SYNC, tz_aware=True, tzinfo=timezone.utc, server_api=ServerApi("1"))
 
 def ping_mongo() -> None:
     """
@@ -33,20 +82,29 @@ def ping_mongo() -> None:
     Exception thrown if failure.
     """
     try:
-        _sync_client.admin.command("ping")
-        logger.info("✅ Successfull ping to MongoDB Atlas", extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+        get_sync_client().admin.command("ping")
+        logger.info("✅ Successfull ping to MongoDB Atlas")
     except errors.PyMongoError as e:
-        logger.info("❌ Ping failed: %s", e, extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+        logger.info("❌ Ping failed: %s", e)
         raise
 
-# Uncomment following line to test ping when importing module:
-ping_mongo()
-
-# Log database name and existing collections (synchronous call via pymongo client)
-try:
-    _sync_db = _sync_client[config.MONGO_DB]
-    collections = _sync_db.list_collection_names()
-    logger.info("Database name: %s", config.MONGO_DB, extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
-    logger.info("Collections found (%s): %s", len(collections), ", ".join(collections) if collections else "(none)", extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
-except Exception as e:
-    logger.warning("Could not list collections: %s", e, extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+
+async def ping_database() -> None:
+    """
+    Async startup check on the shared Motor client (called from the FastAPI lifespan, not at import):
+    ping, then log database name and existing collections. Exception thrown if the ping fails.
+    """
+    try:
+        await get_database().command("ping")
+        logger.info("✅ Successfull ping to MongoDB Atlas")
+    except errors.PyMongoError as e:
+        logger.info("❌ Ping failed: %s", e)
+        raise
+
+    # Log database name and existing collections
+    try:
+        collections = await get_database().list_collection_names()
+        logger.info("Database name: %s", config.MONGO_DB)
+        logger.info("Collections found (%s): %s", len(collections), ", ".join(collections) if collections else "(none)")
+    except Exception as e:
+        logger.warning("Could not list collections: %s", e)
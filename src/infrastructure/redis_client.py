@@ -0,0 +1,38 @@
+# src/infrastructure/redis_client.py
+
+"""
+Lazily built async Redis client used by the read-aside repository caches.
+
+Public API:
+- get_redis_client() -> Optional[redis.asyncio.Redis]
+
+Returns None when REDIS_URL is not configured, so the composition root can skip the cache decorators.
+"""
+
+import logging
+from typing import Optional, Any
+
+import config
+
+# Specific logger for this module
+logger = logging.getLogger(__name__)
+
+_redis_client: Optional[Any] = None
+
+
+def get_redis_client() -> Optional[Any]:
+    """
+    Return the process-wide async Redis client, creating it on first call.
+    Returns None if Redis is not configured.
+    """
+    global _redis_client
+
+    if not config.REDIS_URL:
+        return None
+
+    if _redis_client is None:
+        from redis.asyncio import Redis     # imported lazily: redis is only needed when the cache is enabled
+        _redis_client = Redis.from_url(config.REDIS_URL)
+        logger.info("Redis client created for repository cache", extra={"mod": __name__})
+
+    return _redis_client
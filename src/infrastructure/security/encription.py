@@ -1,29 +1,87 @@
 # src/infrastructure/security/encription.py
 
-from cryptography.fernet import Fernet
+import base64
+import hmac
+import os
+import struct
+import time
+
+from cryptography.fernet import InvalidToken
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 import config
 
-# Initialize Fernet with the DB_ENCRIPTION_SECRET_KEY defined in .env (and loaded in config.py).
+# Initialize the cipher with the DB_ENCRIPTION_SECRET_KEY defined in .env (and loaded in config.py).
 # This key must be a valid Fernet key (base64-encoded 32-byte string).
 # To generate one: Fernet.generate_key().decode()
+#
+# Tokens are produced/consumed in the exact Fernet format (so existing encrypted values stay readable):
+#   base64url( 0x80 | timestamp (8 bytes BE) | IV (16) | AES-128-CBC(PKCS7(plaintext)) | HMAC-SHA256 (32) )
+# Fernet itself is not used: the key halves and the AES algorithm object are derived once here,
+# and each call only does the AES + HMAC work (no per-call Fernet object/validation overhead).
 
 DB_ENCRIPTION_SECRET_KEY = config.DB_ENCRIPTION_SECRET_KEY
 
 if not DB_ENCRIPTION_SECRET_KEY:
     raise ValueError("DB_ENCRIPTION_SECRET_KEY is not set in environment variables")
 
-fernet = Fernet(DB_ENCRIPTION_SECRET_KEY.encode())
+_key = base64.urlsafe_b64decode(DB_ENCRIPTION_SECRET_KEY.encode())
+if len(_key) != 32:
+    raise ValueError("DB_ENCRIPTION_SECRET_KEY must be 32 url-safe base64-encoded bytes")
+
+_SIGNING_KEY = _key[:16]
+_AES = algorithms.AES(_key[16:])
+
+_VERSION = b"\x80"
+_HEADER_LEN = 1 + 8 + 16      # version + timestamp + IV
+_HMAC_LEN = 32
+
+
+def _sign(data: bytes) -> bytes:
+    return hmac.digest(_SIGNING_KEY, data, "sha256")
+
 
 def encrypt_value(value: str) -> str:
     """
-    Encrypt a plain text string using Fernet symmetric encryption.
+    Encrypt a plain text string (AES-128-CBC + HMAC-SHA256, Fernet token format).
     Returns the encrypted value as a base64-encoded string.
     """
-    return fernet.encrypt(value.encode()).decode()
+    iv = os.urandom(16)
+    padder = padding.PKCS7(algorithms.AES.block_size).padder()
+    padded = padder.update(value.encode()) + padder.finalize()
+
+    encryptor = Cipher(_AES, modes.CBC(iv)).encryptor()
+    ciphertext = encryptor.update(padded) + encryptor.finalize()
+
+    basic_parts = _VERSION + struct.pack(">Q", int(time.time())) + iv + ciphertext
+    return base64.urlsafe_b64encode(basic_parts + _sign(basic_parts)).decode()
+
 
 def decrypt_value(value: str) -> str:
     """
-    Decrypt a previously encrypted string using Fernet symmetric encryption.
-    Returns the original plain text value.
+    Decrypt a previously encrypted string (Fernet token format).
+    Returns the original plain text value. Raises cryptography.fernet.InvalidToken on a bad token.
     """
-    return fernet.decrypt(value.encode()).decode()
\ No newline at end of file
+    try:
+        data = base64.urlsafe_b64decode(value.encode())
+    except (TypeError, ValueError):
+        raise InvalidToken
+
+    if len(data) < _HEADER_LEN + _HMAC_LEN or data[:1] != _VERSION:
+        raise InvalidToken
+
+    basic_parts, signature = data[:-_HMAC_LEN], data[-_HMAC_LEN:]
+    if not hmac.compare_digest(_sign(basic_parts), signature):
+        raise InvalidToken
+
+    iv = data[9:_HEADER_LEN]
+    ciphertext = basic_parts[_HEADER_LEN:]
+    try:
+        decryptor = Cipher(_AES, modes.CBC(iv)).decryptor()
+        padded = decryptor.update(ciphertext) + decryptor.finalize()
+        unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()
+        plaintext = unpadder.update(padded) + unpadder.finalize()
+    except ValueError:
+        raise InvalidToken
+
+    return plaintext.decode()
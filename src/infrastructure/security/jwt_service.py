@@ -2,16 +2,47 @@
 
 # generar un JWT_SECRET_KEY --> bash terminal --> python -c "import secrets; print(secrets.token_hex(32))"
 
-from datetime import datetime, timedelta
-from typing import Optional
+import base64
+import hashlib
+import hmac
+import time
+from threading import Lock
+from typing import Optional, Tuple
 
-from jose import jwt, JWTError
+from cachetools import TTLCache
+import jwt
+from jwt import DecodeError, InvalidTokenError
+import orjson
 import config as config
 
 
+class _OrjsonPyJWT(jwt.PyJWT):
+    """
+    PyJWT with the claims deserialized by orjson instead of stdlib json.
+    Only used to verify tokens outside the fast path (tokens are always issued by JWTService._fast_encode).
+    """
+
+    def _decode_payload(self, decoded):
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise DecodeError(f"Invalid payload string: {e}")
+        if not isinstance(payload, dict):
+            raise DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
 class JWTService:
     """
-    Handles creation and validation of JWT access tokens.
+    Handles creation and validation of JWT access tokens (PyJWT backend).
     Reads configuration from src.config.
     """
 
@@ -19,28 +50,107 @@ class JWTService:
         self.secret_key = config.JWT_SECRET_KEY
         self.algorithm = config.JWT_ALGORITHM
         self.expire_minutes = config.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
+        if not self.algorithm.startswith("HS"):
+            raise ValueError(f"JWT_ALGORITHM must be an HMAC algorithm (HS256/HS384/HS512), got {self.algorithm!r}")
+        self._key = self.secret_key.encode("utf-8")     # encoded once, not on every encode/decode
+        self._algorithm = self.algorithm
+        self._algorithms = [self._algorithm]     # built once, not on every decode; the only accepted alg (no 'none', no header-driven substitution)
+        self._jwt = _OrjsonPyJWT()
+        self._expire_seconds = self.expire_minutes * 60
+
+        # Encode fast path: the JOSE header is constant per instance, so it is serialized + base64url-encoded once here
+        self._digest = f"sha{self.algorithm[2:]}"     # HS256 → sha256, HS384 → sha384, HS512 → sha512
+        self._signing_prefix = _b64url(orjson.dumps({"alg": self.algorithm, "typ": "JWT"})) + b"."
+
+        # Verified tokens: blake2b(token) → (sub, exp). Repeat presentations of the same bearer token skip
+        # the HMAC + JSON decode. Entries live at most the token lifetime and are re-checked against exp on hit.
+        self._cache = TTLCache(maxsize=10_000, ttl=self._expire_seconds)
+        self._lock = Lock()
 
     def create_access_token(self, subject: str) -> str:
         """
         Create a signed JWT containing the user ID as the subject.
         """
-        expire = datetime.utcnow() + timedelta(minutes=self.expire_minutes)
+        now = int(time.time())
 
         payload = {
             "sub": subject,
-            "exp": expire,
-            "iat": datetime.utcnow(),
+            "exp": now + self._expire_seconds,
+            "iat": now,
         }
 
-        return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+        return self._fast_encode(payload)
+
+    def _fast_encode(self, payload: dict) -> str:
+        """
+        header.payload.signature with the precomputed header: one orjson dump, two base64url encodes and one HMAC.
+        Produces the same compact JWS as PyJWT (claims must already be JSON-native, e.g. NumericDate ints).
+        """
+        signing_input = self._signing_prefix + _b64url(orjson.dumps(payload))
+        signature = hmac.digest(self._key, signing_input, self._digest)
+        return (signing_input + b"." + _b64url(signature)).decode("ascii")
 
     def verify_access_token(self, token: str) -> Optional[str]:
         """
         Validate a JWT and return the subject (user_id) if valid.
         Returns None if token is invalid or expired.
         """
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()     # don't retain full tokens in memory
+
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            sub, exp = cached
+            if exp > time.time():
+                return sub
+            with self._lock:
+                self._cache.pop(key, None)
+
+        try:
+            verified = self._fast_verify(token)
+        except (ValueError, KeyError, TypeError):
+            # outside the fast path (foreign header, malformed segments or claims): PyJWT gives the verdict
+            verified = self._library_verify(token)
+
+        if verified is None:
+            with self._lock:
+                self._cache.pop(key, None)
+            return None
+
+        sub, exp = verified
+        with self._lock:
+            self._cache[key] = (sub, exp)
+        return sub
+
+    def _fast_verify(self, token: str) -> Optional[Tuple[str, float]]:
+        """
+        Direct HMAC + orjson verification of tokens carrying this service's own header (the ones _fast_encode issues).
+        Returns (sub, exp), or None if the signature or time claims are invalid.
+        Raises ValueError/KeyError/TypeError for anything outside that narrow shape, so the caller falls back to PyJWT.
+        """
+        header_b64, payload_b64, signature_b64 = token.encode("ascii").split(b".")
+        signing_input = header_b64 + b"." + payload_b64
+        if not signing_input.startswith(self._signing_prefix):
+            raise ValueError("non-standard JOSE header")
+
+        expected = hmac.digest(self._key, signing_input, self._digest)
+        if not hmac.compare_digest(expected, _b64url_decode(signature_b64)):     # constant-time
+            return None
+
+        payload = orjson.loads(_b64url_decode(payload_b64))
+        sub, exp = payload["sub"], payload["exp"]
+        iat, nbf = payload.get("iat", 0), payload.get("nbf", 0)
+        if not isinstance(sub, str) or not all(type(claim) in (int, float) for claim in (exp, iat, nbf)):
+            raise TypeError("unexpected claim types")
+
+        now = time.time()
+        if exp <= now or iat > now or nbf > now:
+            return None
+        return sub, exp
+
+    def _library_verify(self, token: str) -> Optional[Tuple[str, float]]:
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            return payload.get("sub")
-        except JWTError:
+            payload = self._jwt.decode(token, self._key, algorithms=self._algorithms, options={"require": ["exp", "sub"]})
+        except InvalidTokenError:
             return None
+        return payload.get("sub"), payload["exp"]
@@ -1,24 +1,62 @@
 # src/infrastructure/security/password_hasher.py
 
-from passlib.context import CryptContext
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+import bcrypt
+import config
+
+# Explicit bcrypt cost (config.BCRYPT_ROUNDS, clamped to 10..15); existing hashes keep verifying
+# whatever cost they were created with (the cost is encoded in the hash itself).
+BCRYPT_ROUNDS = min(max(config.BCRYPT_ROUNDS, 10), 15)
+
+# bcrypt only uses the first 72 bytes of the password (bcrypt>=5 raises instead of truncating silently,
+# passlib used to truncate) → truncate explicitly so existing hashes keep verifying.
+_BCRYPT_MAX_PASSWORD_BYTES = 72
+
+
+# Dedicated pool for bcrypt work: keeps the event loop free during hashing and doesn't starve the
+# default executor (used by other blocking I/O). bcrypt releases the GIL, so threads run in parallel.
+_bcrypt_executor = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="bcrypt")
+
+
+def _password_bytes(password: str) -> bytes:
+    return password.encode("utf-8")[:_BCRYPT_MAX_PASSWORD_BYTES]
 
 
 class PasswordHasher:
     """
     Interface-like class for hashing and verifying passwords.
+    Calls the bcrypt C extension directly (no passlib CryptContext dispatch per call).
     """
 
     def hash(self, password: str) -> str:
-        return pwd_context.hash(password)
+        return bcrypt.hashpw(_password_bytes(password), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode("ascii")
 
     def verify(self, plain_password: str, hashed_password: str) -> bool:
-        return pwd_context.verify(plain_password, hashed_password)
+        try:
+            return bcrypt.checkpw(_password_bytes(plain_password), hashed_password.encode("ascii"))
+        except ValueError:
+            # malformed / non-bcrypt hash (passlib returned False / raised ValueError likewise)
+            return False
+
+    async def ahash(self, password: str) -> str:
+        return await asyncio.get_running_loop().run_in_executor(_bcrypt_executor, self.hash, password)
+
+    async def averify(self, plain_password: str, hashed_password: str) -> bool:
+        return await asyncio.get_running_loop().run_in_executor(_bcrypt_executor, self.verify, plain_password, hashed_password)
+
+    async def warm_up(self) -> None:
+        """
+        One hash + verify round at startup: loads the bcrypt C extension and spawns a pool thread,
+        so the first real login after a deploy doesn't pay that setup on top of the bcrypt cost.
+        """
+        await self.averify("warmup", await self.ahash("warmup"))
 
 
 class BcryptPasswordHasher(PasswordHasher):
     """
-    Concrete implementation using bcrypt via passlib.
+    Concrete implementation using the bcrypt package directly.
     """
     pass
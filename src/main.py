@@ -6,7 +6,6 @@
 # - change naming of entidad "Prompt" por "UserPrompt" (channel.selected_prompt_id)
 # - crear un nuevo campo en "user" para indicar que las credenciales OAuth1 están mal y hay que reconectar cuenta (x_oauth1_credentials_valid)
 
-# - en main, separar la condicion is_running de enough_time_passed
 # - en los routers para que el usuario asigne prompts a sus channels --> usar los metodos del prompt_service.py (ej. borrar prompt, update...)
 # - en los routers para que el usuario haga cambios en sus channels --> usar los metodos del channel_service.py (ej. update_channel_prompt()...)
 
@@ -19,9 +18,14 @@
 # - in GCP VM, convert./run.sh into a persistent service, so it runs in background all time, not foreground execution needed anymore
 # - create a new feature/flag on channel entity to request user approval for tweets generated by a channel --> channel.isUserApprovalNeededToPublish + tweet.isUserApprovalNeededToPublish + tweet.isPublishingApprovedByUser
 
-import os
 import asyncio
-import sys
+import gc
+from collections import namedtuple
+from operator import attrgetter
+from typing import Awaitable, Callable, Optional
+import os
+import socket
+import time
 
 # import config
 import config
@@ -31,48 +35,52 @@ from domain.entities.user import UserTwitterCredentials
 
 # logger
 import logging
-import inspect
 from infrastructure.logging.request_context import set_user_id
 
-# WebServer
-import uvicorn      # ASGI ligero y de alto rendimiento (Asynchronous Server Gateway Interface server)
-
 # Fast API framework
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 # Routes
 from api.routes.auth_routes import router as auth_router
 from api.routes.twitter_oauth2_routes import router as twitter_oauth2_router
 
 # Mongo DB
-from infrastructure.mongodb import db
+from infrastructure.mongodb import get_database, ping_database, close_mongo_client
+from infrastructure.http_client import close_http_session
+from pymongo.write_concern import WriteConcern
 
 # APScheduler
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.executors.asyncio import AsyncIOExecutor
+from apscheduler.jobstores.memory import MemoryJobStore
 from contextlib import asynccontextmanager
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 
 # Controllers
-# import pipeline_controller to later inject the IngestionPipelineService/PublishingPipelineService instances with all the created adapters into pipeline_controller.ingestion_pipeline_service/publishing_pipeline_service
+# pipeline_controller reads the IngestionPipelineService/PublishingPipelineService instances (with all the created adapters) from app.state (set below, after the app is created)
 import adapters.inbound.http.pipeline_controller as pipeline_controller 
 
 # Ingestion pipeline
 from application.services.ingestion_pipeline_service import IngestionPipelineService
 from adapters.outbound.mongodb.user_repository import MongoUserRepository
 from adapters.outbound.file_prompt_loader import FilePromptLoader
+from adapters.outbound.cached_prompt_loader import CachedPromptLoader
 from adapters.outbound.mongodb.channel_repository import MongoChannelRepository
 from adapters.outbound.youtube_video_client import YouTubeVideoClient
 from adapters.outbound.mongodb.video_repository import MongoVideoRepository
 from adapters.outbound.transcription_client_captions_api import YouTubeTranscriptionClientOfficialCaptionsAPI
 from adapters.outbound.transcription_client_data_api import YouTubeTranscriptionClientOfficialDataAPI
 from adapters.outbound.transcription_client_public_player_api_ASR import YouTubeTranscriptionClientOfficialPublicPlayerAPI_ASR
-from adapters.outbound.transcription_client_android_player_api_ASR import YouTubeTranscriptionClientAndroidPlayerAPI_ASR
+from adapters.outbound.composite_transcription_client import CompositeTranscriptionClient
 from adapters.outbound.mongodb.user_prompt_repository import MongoUserPromptRepository
 from domain.services.prompt_resolver_service import PromptResolverService
 from adapters.outbound.llm_openai_client import LLMOpenAIClient
 from adapters.outbound.mongodb.tweet_generation_repository import MongoTweetGenerationRepository
 from adapters.outbound.mongodb.tweet_repository import MongoTweetRepository
 from adapters.outbound.mongodb.user_scheduler_runtime_status_repository import MongoUserSchedulerRuntimeStatusRepository
+from domain.value_objects.pipeline_transition import PipelineTransition, PipelineName
+from domain.entities.user_scheduler_runtime_status import UserSchedulerRuntimeStatus
 
 # Publishing pipeline
 from application.services.publishing_pipeline_service import PublishingPipelineService
@@ -82,47 +90,58 @@ from adapters.outbound.twitter_publication_client_oauth1 import TwitterPublicati
 from application.services.stats_pipeline_service import StatsPipelineService
 from adapters.outbound.twitter_stats.twitter_stats_client_apify_apidojo_tweet_scraper import TwitterStatsClientApifyApidojoTweetScraper
 from domain.services.growth_score_calculator_service import GrowthScoreCalculatorService
+from domain.services.vector_similarity_service import VectorSimilarityService
+from domain.value_objects.embedding_type import EmbeddingType
 
 # Embeddings pipeline
 from application.services.embeddings_pipeline_service import EmbeddingsPipelineService
+
+# Pipeline runs dispatch (job ticks enqueue, workers run)
+from application.services.pipeline_work_queue import PipelineWorkQueue
+from application.services.pipeline_transition_buffer import PipelineTransitionBuffer
 from adapters.outbound.mongodb.embedding_vector_repository import MongoEmbeddingVectorRepository
 from adapters.outbound.embedding_vector_openai_client import EmbeddingVectorOpenAIClient
 
 # Repository adapters (for wiring with DB instance)
 from adapters.outbound.mongodb.app_config_repository import MongoAppConfigRepository
+from adapters.outbound.cached_app_config_repository import CachedAppConfigRepository
 from adapters.outbound.mongodb.master_prompt_repository import MongoMasterPromptRepository
+from adapters.outbound.mongodb.scheduler_lock_repository import MongoSchedulerLockRepository
 
 # Application Services ()
 from application.services.channel_service import ChannelService
 from domain.services.prompt_composer_service import PromptComposerService
 from domain.services.tweet_outpout_guardrail_service import TweetOutputGuardrailService
 
-# factory to get a youtube_client resource for consuming Youtube Data API (to retrieve video transcriptions) 
-from infrastructure.auth.youtube_credentials import get_youtube_client
+# Redis read-aside cache decorators (only wired when REDIS_URL is configured)
+from infrastructure.redis_client import get_redis_client
+from adapters.outbound.redis.cached_user_repository import CachedUserRepository
+from adapters.outbound.redis.cached_video_repository import CachedVideoRepository
+
+# Password hashing (warmed up at startup)
+from infrastructure.security.password_hasher import PasswordHasher
 
 # specific logger for this module
 logger = logging.getLogger(__name__)
 
-# create a youtube_client resource to inject as dependency into YouTubeTranscriptionClientOfficialDataAPI
-try:
-    youtube_client = get_youtube_client(client_id=config.YOUTUBE_OAUTH_CLIENT_ID, client_secret=config.YOUTUBE_OAUTH_CLIENT_SECRET, refresh_token=config.YOUTUBE_OAUTH_CLIENT_REFRESH_TOKEN)
-except RuntimeError as exc:
-    logger.error("YouTube client could not be constructed: %s", str(exc), extra={"mod": __name__})
-    youtube_client = None
-
 # --- Repo adapters & service instantiation ---
+# every repository shares the same Motor client (single connection pool): Mongo adapters take this database handle
+# (built on infrastructure.mongodb.get_mongo_client) and never construct a client of their own
+db = get_database()
+# append-mostly collections (videos, user_prompts) don't need majority/journaled acks
+fast_write_concern = WriteConcern(w=1, j=False)
 
 # Ingestion, Publishing, Stats, Embeddings pipelines 
 user_repo                                   = MongoUserRepository(database=db)
-prompt_loader                               = FilePromptLoader(prompts_dir="prompts")
+prompt_loader                               = CachedPromptLoader(inner=FilePromptLoader(prompts_dir="prompts"), prompts_dir="prompts")
 channel_repo                                = MongoChannelRepository(database=db)
 video_source                                = YouTubeVideoClient(api_key=config.YOUTUBE_API_KEY)
-video_repo                                  = MongoVideoRepository(database=db)
+video_repo                                  = MongoVideoRepository(database=db, write_concern=fast_write_concern)
 transcription_client_captions_api           = YouTubeTranscriptionClientOfficialCaptionsAPI(default_language="es")
-transcription_client_data_api               = YouTubeTranscriptionClientOfficialDataAPI(youtube_client=youtube_client) if youtube_client else None
 transcription_client_public_player_api_asr  = YouTubeTranscriptionClientOfficialPublicPlayerAPI_ASR(model_name="tiny", device="cpu")
-transcription_client_android_player_api_asr = YouTubeTranscriptionClientAndroidPlayerAPI_ASR(model_name="small", device="cpu")
-user_prompt_repo                            = MongoUserPromptRepository(database=db)
+# captions API first, then Whisper ASR; the Data API client is appended in lifespan (needs an OAuth refresh round-trip)
+transcription_client                        = CompositeTranscriptionClient([transcription_client_captions_api, transcription_client_public_player_api_asr])
+user_prompt_repo                            = MongoUserPromptRepository(database=db, write_concern=fast_write_concern)
 prompt_resolver_service                     = PromptResolverService()
 openai_client                               = LLMOpenAIClient(api_key=config.OPENAI_API_KEY)
 tweet_output_guardrail_service              = TweetOutputGuardrailService()
@@ -130,6 +149,14 @@ tweet_generation_repo                       = MongoTweetGenerationRepository(db=
 tweet_repo                                  = MongoTweetRepository(database=db)
 user_scheduler_runtime_repo                 = MongoUserSchedulerRuntimeStatusRepository(database=db)
 master_prompt_repo                          = MongoMasterPromptRepository(database=db) 
+
+# Wrap hot-read repositories with the Redis read-aside cache (ports unchanged, bound here in the composition root)
+redis_client = get_redis_client()
+if redis_client is not None:
+    user_repo   = CachedUserRepository(inner=user_repo, redis=redis_client, ttl_seconds=config.REDIS_USER_CACHE_TTL_SECONDS)
+    video_repo  = CachedVideoRepository(inner=video_repo, redis=redis_client, ttl_seconds=config.REDIS_VIDEO_CACHE_TTL_SECONDS)
+    logger.info("Redis read-aside cache enabled for user and video repositories", extra={"mod": __name__})
+
 channel_service                             = ChannelService(channel_repo, user_prompt_repo, master_prompt_repo, prompt_resolver_service)
 prompt_composer_service                     = PromptComposerService()
 
@@ -140,9 +167,7 @@ ingestion_pipeline_service_instance = IngestionPipelineService(
     channel_repo                    = channel_repo,
     video_source                    = video_source,
     video_repo                      = video_repo,
-    transcription_client            = transcription_client_captions_api,
-    transcription_client_fallback   = transcription_client_public_player_api_asr,
-    transcription_client_fallback_2 = transcription_client_data_api,
+    transcription_client            = transcription_client,
     openai_client                   = openai_client,
     tweet_output_guardrail_service  = tweet_output_guardrail_service,
     tweet_generation_repo           = tweet_generation_repo,
@@ -152,9 +177,6 @@ ingestion_pipeline_service_instance = IngestionPipelineService(
     prompt_composer_service         = prompt_composer_service
 )
 
-# Inject the instance of IngestionPipelineService (with all the Adapters) into the pipeline controller 
-pipeline_controller.ingestion_pipeline_service = ingestion_pipeline_service_instance
-
 
 # --- Publishing adapters & service instantiation ---
 twitter_publication_client  = TwitterPublicationClientOAuth1(
@@ -170,16 +192,15 @@ publishing_pipeline_service_instance = PublishingPipelineService(
     user_scheduler_runtime_repo     = user_scheduler_runtime_repo,
 )
 
-# Inject the instance of PublishingPipelineService (with all the Adapters) into the pipeline controller 
-pipeline_controller.publishing_pipeline_service = publishing_pipeline_service_instance
-
 # Stats pipeline
 stats_provider = TwitterStatsClientApifyApidojoTweetScraper(apify_token=config.APIFY_API_TOKEN_PERSONAL)
-growth_score_calculator = GrowthScoreCalculatorService()
+vector_similarity_service = VectorSimilarityService(max_rows_per_kind=config.SIMILARITY_MAX_ROWS_PER_KIND)
+growth_score_calculator = GrowthScoreCalculatorService(vector_similarity=vector_similarity_service)
 
 stats_pipeline_service = StatsPipelineService(
     user_repo                   = user_repo,
     tweet_repo                  = tweet_repo,
+    video_repo                  = video_repo,
     stats_provider              = stats_provider,
     growth_score_calculator     = growth_score_calculator,
     user_scheduler_runtime_repo = user_scheduler_runtime_repo,
@@ -198,19 +219,156 @@ embeddings_pipeline_servive = EmbeddingsPipelineService(
     user_scheduler_runtime_repo                 = user_scheduler_runtime_repo,
     embedding_model                             = "text-embedding-3-small",
     tweet_max_days_back_calculate_embeddings    = 60,
+    vector_similarity                           = vector_similarity_service,
 )
 
 # --- AppConfig adapter ---
-app_config_repo = MongoAppConfigRepository(database=db)
+# in-memory TTL cache: each job reads the config at the start and at the end of every tick
+app_config_repo = CachedAppConfigRepository(inner=MongoAppConfigRepository(database=db), ttl_seconds=config.APP_CONFIG_CACHE_TTL_SECONDS)
+
+# --- Scheduler leader lock ---
+# every process with RUN_SCHEDULER=1 runs an AsyncIOScheduler, but only the holder of this Mongo lease runs the pipeline jobs
+scheduler_lock_repo = MongoSchedulerLockRepository(database=db)
+SCHEDULER_LOCK_NAME = "pipelines_scheduler"
+SCHEDULER_OWNER_ID = f"{socket.gethostname()}:{os.getpid()}"
+SCHEDULER_LOCK_LOG_EXTRA = {"job": "scheduler_lock"}
+# job ticks trust a lease this process renewed less than this ago (at least 2/3 of the TTL left) instead of renewing it
+# themselves: pipeline ticks firing together cost no lock round trip; the heartbeat job keeps renewing every TTL/3
+SCHEDULER_LEADER_TRUST_SECONDS = config.SCHEDULER_LOCK_TTL_SECONDS / 3
+# monotonic time of the last successful lease acquisition/renewal by this process (None: not the leader)
+scheduler_leader_renewed_at: Optional[float] = None
+
+
+# Whisper warm-up of the ASR fallback: only the scheduler leader runs ingestion, so with several uvicorn
+# workers (WEB_CONCURRENCY) the other processes never load the model (see is_scheduler_leader)
+asr_warm_up_task: Optional[asyncio.Task] = None
+
+# in-memory similarity matrices of the growth score calculator: (re)loaded from the vector DB every time this process
+# becomes leader (only the leader runs the stats/embeddings pipelines, and keeps them in sync with add() while it leads)
+similarity_load_task: Optional[asyncio.Task] = None
+
+
+async def load_similarity_matrices() -> None:
+    """
+    Load the stored embeddings of every EmbeddingType into vector_similarity_service (merged with what is already in memory).
+    """
+    try:
+        for embedding_type in EmbeddingType:
+            loaded = 0
+            # only the newest rows that fit in memory: older ones would be evicted by the ring buffer anyway
+            async for matrix in embeddings_repo.iter_newest_matrices(type=embedding_type, limit=config.SIMILARITY_MAX_ROWS_PER_KIND):
+                vector_similarity_service.add(embedding_type.to_str(), matrix.ids.tolist(), matrix.vectors)
+                loaded += len(matrix)
+            logger.info("Similarity matrix loaded (%s: %s embeddings)", embedding_type.to_str(), loaded, extra={"mod": __name__})
+    except Exception as exc:
+        logger.warning("Similarity matrix load failed (growth scores use placeholders for missing embeddings): %s", str(exc), extra={"mod": __name__})
+
+
+async def is_scheduler_leader(trust_seconds: float = 0) -> bool:
+    """
+    Acquire or renew the scheduler lease for this process. Returns False (skip the tick) on any lock error.
+    With trust_seconds > 0, a lease this process renewed less than trust_seconds ago is trusted without a round trip.
+    The first time this process becomes leader it starts loading the Whisper model of the ASR fallback in the background,
+    and every time it becomes leader it (re)loads the similarity matrices in the background.
+    """
+    global asr_warm_up_task, scheduler_leader_renewed_at, similarity_load_task
+    attempted_at = time.monotonic()
+    if trust_seconds and scheduler_leader_renewed_at is not None and attempted_at - scheduler_leader_renewed_at < trust_seconds:
+        return True
+    try:
+        is_leader = await scheduler_lock_repo.try_acquire(SCHEDULER_LOCK_NAME, SCHEDULER_OWNER_ID, config.SCHEDULER_LOCK_TTL_SECONDS)
+    except Exception as exc:
+        scheduler_leader_renewed_at = None
+        logger.warning("Scheduler lock acquisition failed: %s", str(exc), extra=SCHEDULER_LOCK_LOG_EXTRA)
+        return False
+    became_leader = is_leader and scheduler_leader_renewed_at is None
+    scheduler_leader_renewed_at = attempted_at if is_leader else None
+    if is_leader and asr_warm_up_task is None:
+        asr_warm_up_task = asyncio.create_task(transcription_client_public_player_api_asr.warm_up())
+    if became_leader and (similarity_load_task is None or similarity_load_task.done()):
+        similarity_load_task = asyncio.create_task(load_similarity_matrices())
+    return is_leader
+
+
+# per-user pipeline frequency when the user has no scheduler config value for it (float: used as is in the due check)
+DEFAULT_USER_FREQUENCY_MINUTES = 1440.0
+
+# elapsed minutes as one timedelta division (float), e.g. (now - last_started_at) / ONE_MINUTE
+ONE_MINUTE = timedelta(minutes=1)
+
+# Per-user gating state of one pipeline, read once per user: user scheduler config + runtime status, already coerced
+# (the running flag is not part of it: runs are claimed atomically, see try_claim_pipeline)
+PipelineGateState = namedtuple("PipelineGateState", "enabled frequency_minutes last_started_at")
+
+# attribute getters per pipeline, built once: (enabled, frequency) on SchedulerConfig, last started on UserSchedulerRuntimeStatus
+_PIPELINE_GATE_GETTERS = {
+    pipeline: (
+        attrgetter(f"is_{pipeline}_pipeline_enabled"),
+        attrgetter(f"{pipeline}_pipeline_frequency_minutes"),
+        attrgetter(f"last_{pipeline}_pipeline_started_at"),
+    )
+    for pipeline in ("ingestion", "publishing", "stats", "embeddings")
+}
+
+
+def pipeline_gate_state(pipeline: str, user, runtime_status, default_frequency_minutes: float = DEFAULT_USER_FREQUENCY_MINUTES) -> PipelineGateState:
+    """
+    Normalize the per-user gating fields of `pipeline` (ingestion, publishing, stats, embeddings).
+    Missing user scheduler config means enabled with the default frequency; missing runtime status means never started.
+    """
+    get_enabled, get_frequency, get_last_started_at = _PIPELINE_GATE_GETTERS[pipeline]
+    sc = user.scheduler_config
+    if sc is not None:
+        enabled = get_enabled(sc) is not False
+        frequency_minutes = get_frequency(sc)
+    else:
+        enabled, frequency_minutes = True, None
+    frequency_minutes = float(frequency_minutes) if frequency_minutes is not None else default_frequency_minutes
+    return PipelineGateState(enabled, frequency_minutes, get_last_started_at(runtime_status) if runtime_status is not None else None)
 
 # APScheduler instance
-scheduler = AsyncIOScheduler()
+# Coroutine jobs run directly on the event loop (AsyncIOExecutor + in-memory job store: no threads, no job-store I/O).
+# With a handful of interval jobs its per-tick bookkeeping is negligible next to the pipelines themselves; the fan-out
+# that matters is per user inside each job (PIPELINE_SEMAPHORE), and get_job/reschedule_job/coalesce/max_instances are relied upon.
+scheduler = AsyncIOScheduler(executors={"default": AsyncIOExecutor()}, jobstores={"default": MemoryJobStore()})
+
+# One run per job at a time; runs missed while a tick was still running (or the loop was blocked) collapse
+# into a single catch-up run instead of firing back-to-back
+JOB_OPTIONS = {"coalesce": True, "max_instances": 1, "misfire_grace_time": 60, "replace_existing": True}
+
+# App config allows a 0-minute pipeline frequency, which an APScheduler interval trigger turns into "every second":
+# job intervals are clamped to this floor (the per-user due checks keep using the configured values)
+MIN_JOB_INTERVAL_MINUTES = 1.0
+
+
+def job_interval_minutes(frequency_minutes) -> float:
+    return max(float(frequency_minutes), MIN_JOB_INTERVAL_MINUTES)
+
+# Max users whose due check (and work queue submit) runs concurrently within one job tick
+PIPELINE_SEMAPHORE = asyncio.Semaphore(config.PIPELINE_CONCURRENCY)
+
+# Per-pipeline work queues: job ticks only enqueue due users; PIPELINE_CONCURRENCY workers per pipeline run them
+# (pipelines are I/O-bound: YouTube, OpenAI, X, Mongo). Workers are started in lifespan.
+ingestion_work_queue    = PipelineWorkQueue("ingestion", workers=config.PIPELINE_CONCURRENCY, maxsize=config.PIPELINE_QUEUE_MAXSIZE)
+publishing_work_queue   = PipelineWorkQueue("publishing", workers=config.PIPELINE_CONCURRENCY, maxsize=config.PIPELINE_QUEUE_MAXSIZE)
+stats_work_queue        = PipelineWorkQueue("stats", workers=config.PIPELINE_CONCURRENCY, maxsize=config.PIPELINE_QUEUE_MAXSIZE)
+embeddings_work_queue   = PipelineWorkQueue("embeddings", workers=config.PIPELINE_CONCURRENCY, maxsize=config.PIPELINE_QUEUE_MAXSIZE)
+PIPELINE_WORK_QUEUES    = (ingestion_work_queue, publishing_work_queue, stats_work_queue, embeddings_work_queue)
+
+# "schedule_next" writes of finished runs are buffered and flushed in one bulk write (nobody reads them back right away)
+runtime_transition_buffer = PipelineTransitionBuffer(user_scheduler_runtime_repo, flush_interval_seconds=config.RUNTIME_STATUS_FLUSH_SECONDS)
+
+# users per bulk upsert when ensuring the runtime status documents at startup
+RUNTIME_STATUS_ENSURE_BATCH_SIZE = 500
 
 
 # Lifespan context manager (replaces deprecated @app.on_event)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
 
+    # MongoDB ping + collections log (async, at startup: importing main does no network round-trips)
+    await ping_database()
+
     # ===== START TEMPORARY BLOCK =====
     # Escribir en el document del USER_ID las credentials de usuario que temporalmente están en .env
     # TODO: remove this block when frontend/endpoints for user credential management is ready
@@ -232,355 +390,130 @@ async def lifespan(app: FastAPI):
     # ===== END TEMPORARY BLOCK =====
 
 
-    # ===== INGESTION PIPELINE job =====
-    async def ingestion_job():
-        # 1. Get pipeline execution frequency at app config level
-        app_config = await app_config_repo.get_config()
-        # app_frequency_minutes = float(app_config.scheduler_config.ingestion_pipeline_frequency_minutes)
-        default_user_frequency_minutes = 1440
-
-        users = await user_repo.find_all()
-        now = datetime.utcnow()
-
-        for user in users:
-            try:
-                # Set user_id for this iteration to make it available for logging
-                set_user_id(str(user.id))
-
-                # 2. Check if pipeline is enabled (user config takes priority, then app config)
-                user_scheduler_config = getattr(user, "scheduler_config", None)
-                if user_scheduler_config and hasattr(user_scheduler_config, "is_ingestion_pipeline_enabled") and user_scheduler_config.is_ingestion_pipeline_enabled is False:
-                    logger.info("Skipping Ingestion pipeline (disabled by user config)", extra={"job": "ingestion"})
-                    continue
-
-                app_scheduler_config = app_config.scheduler_config
-                if not app_scheduler_config or not hasattr(app_scheduler_config, "is_ingestion_pipeline_enabled") or app_scheduler_config.is_ingestion_pipeline_enabled is False:
-                    logger.info("Skipping Ingestion pipeline (disabled by app_config or app_config missing)", extra={"job": "ingestion"})
-                    continue
-
-                # 3. Determine effective pipeline frequency (user config takes priority, then app config)
-                user_frequency_minutes = getattr(user.scheduler_config, "ingestion_pipeline_frequency_minutes", None)
-                effective_frequency_minutes = float(user_frequency_minutes) if user_frequency_minutes is not None else default_user_frequency_minutes #app_frequency_minutes
-
-                # 4. Retrieve runtime status for this user
-                user_runtime_status = await user_scheduler_runtime_repo.get_by_user_id(user.id)
-                ingestion_last_started_at = getattr(user_runtime_status, "last_ingestion_pipeline_started_at", None) if user_runtime_status else None
-                is_running = getattr(user_runtime_status, "is_ingestion_pipeline_running", False) if user_runtime_status else False
-
-                # 5. Determine if pipeline should run
-                elapsed_minutes = (now - ingestion_last_started_at).total_seconds() / 60.0 if ingestion_last_started_at else None
-                # normal condition: enough time has passed AND pipeline is not running
-                enough_time_passed = elapsed_minutes is not None and elapsed_minutes > effective_frequency_minutes and not is_running
-                # protection condition: pipeline stuck (elapsed > 1x frequency)
-                stuck_protection = elapsed_minutes is not None and elapsed_minutes > (effective_frequency_minutes * 1)
-                # first run condition: no previous execution recorded 
-                first_run = elapsed_minutes is None
-                
-                should_run = first_run or enough_time_passed or stuck_protection
-                
-                # normalizo valor de elapsed_minutes para el caso de que sea None no falle el logger
-                elapsed_minutes = f"{elapsed_minutes:.2f}" if elapsed_minutes is not None else "N/A"
-                decision = "Yes" if should_run else "No"
-                logger.info("Ingestion pipeline: Configured freq %s mins, Last start %s mins ago", effective_frequency_minutes, elapsed_minutes, extra={"job": "ingestion"})
-                logger.info("Ingestion pipeline should run now? %s", decision, extra={"job": "ingestion"})
-
-                if not should_run:
-                    logger.info("Skipping Ingestion pipeline (already running or within freq)", extra={"job": "ingestion"})
-                    continue
-
-                # 6. Run pipeline
-                logger.info("Ingestion pipeline starting", extra={"job": "ingestion"})
-                set_user_id(user.id) # se aplica a todos los logs del job
-                await ingestion_pipeline_service_instance.run_for_user(user_id=user.id)
-                logger.info("Ingestion pipeline finished", extra={"job": "ingestion"})
-                
-                # 7. Update the time for next pipeline initiation using the effective frequency (user or app)
-                finish_time = datetime.utcnow()
-                next_start = finish_time + timedelta(minutes=effective_frequency_minutes)
-                await user_scheduler_runtime_repo.update_by_user_id(user.id, {"nextScheduledIngestionPipelineStartingAt": next_start})
-                logger.info("Next user's scheduled Ingestion pipeline starting at: %s", next_start.isoformat(), extra={"job": "ingestion"})
-            
-            except Exception as e:
-                logger.error("Ingestion pipeline failed: %s", str(e), extra={"job": "ingestion"})
-    
-        # 8. Refresh app config from repository and reschedule job if frequency changed
-        # get current app job/pipeline frequency
-        job = scheduler.get_job("ingestion_job")
-        current_ingestion_frequency_minutes = job.trigger.interval.total_seconds() / 60
-        logger.debug("Checking if Ingestion pipeline app config frequency has changed (current freq: %s mins)", current_ingestion_frequency_minutes, extra={"job": "ingestion"})
-        # get app configuration frequency from repo
-        new_app_config = await app_config_repo.get_config()
-        new_ingestion_frequency_minutes = new_app_config.scheduler_config.ingestion_pipeline_frequency_minutes
-        # if there is a new app pipeline config then reschedule job
-        if float(new_ingestion_frequency_minutes) != float(current_ingestion_frequency_minutes):
-            try:
-                scheduler.reschedule_job("ingestion_job", trigger="interval", minutes=new_ingestion_frequency_minutes)
-                logger.info("Rescheduled Ingestion pipeline app config frequency to %s minutes", new_ingestion_frequency_minutes, extra={"job": "ingestion"})
-            except Exception as ex:
-                logger.warning("Failed to reschedule Ingestion pipeline app config frequency: %s", str(ex), extra={"job": "ingestion"})
-        else:
-            logger.debug("Ingestion pipeline app config frequency has not changed (current freq: %s mins)", current_ingestion_frequency_minutes, extra={"job": "ingestion"})
-
-
-
-    # ===== PUBLISHING PIPELINE job =====
-    async def publishing_job():
-        # 1. Get pipeline execution frequency at app config level
-        app_config = await app_config_repo.get_config()
-        # app_frequency_minutes = float(app_config.scheduler_config.publishing_pipeline_frequency_minutes)
-        default_user_frequency_minutes = 1440
-
-        users = await user_repo.find_all()
-        now = datetime.utcnow()
-
-        for user in users:
-            try:
-                # Set user_id for this iteration to make it available for logging
-                set_user_id(str(user.id))
-                
-                # 2. Check if pipeline is enabled (user config takes priority, then app config)
-                user_scheduler_config = getattr(user, "scheduler_config", None)
-                if user_scheduler_config and hasattr(user_scheduler_config, "is_publishing_pipeline_enabled") and user_scheduler_config.is_publishing_pipeline_enabled is False:
-                    logger.info("Skipping Publishing pipeline (disabled by user config)", extra={"job": "publishing"})
-                    continue
-
-                app_scheduler_config = app_config.scheduler_config
-                if not app_scheduler_config or not hasattr(app_scheduler_config, "is_publishing_pipeline_enabled") or app_scheduler_config.is_publishing_pipeline_enabled is False:
-                    logger.info("Skipping Publishing pipeline (disabled by app_config or app_config missing)", extra={"job": "publishing"})
-                    continue
-
-                # 3. Determine effective pipeline frequency (user config takes priority, then app config)
-                user_frequency_minutes = getattr(user.scheduler_config, "publishing_pipeline_frequency_minutes", None)
-                effective_frequency_minutes = float(user_frequency_minutes) if user_frequency_minutes is not None else default_user_frequency_minutes #app_frequency_minutes
-
-                # 4. Retrieve runtime status for this user
-                user_runtime_status = await user_scheduler_runtime_repo.get_by_user_id(user.id)
-                publishing_last_started_at = getattr(user_runtime_status, "last_publishing_pipeline_started_at", None) if user_runtime_status else None
-                is_running = getattr(user_runtime_status, "is_publishing_pipeline_running", False) if user_runtime_status else False
-
-                # 5. Determine if pipeline should run
-                elapsed_minutes = (now - publishing_last_started_at).total_seconds() / 60.0 if publishing_last_started_at else None
-                # normal condition: enough time has passed AND pipeline is not running
-                enough_time_passed = elapsed_minutes is not None and elapsed_minutes > effective_frequency_minutes and not is_running
-                # protection condition: pipeline stuck (elapsed > 1x frequency)
-                stuck_protection = elapsed_minutes is not None and elapsed_minutes > (effective_frequency_minutes * 1)
-                # first run condition: no previous execution recorded 
-                first_run = elapsed_minutes is None
-
-                should_run = first_run or enough_time_passed or stuck_protection
-
-                # normalizo valor de elapsed_minutes para el caso de que sea None no falle el logger
-                elapsed_minutes = f"{elapsed_minutes:.2f}" if elapsed_minutes is not None else "N/A"
-                decision = "Yes" if should_run else "No"
-                logger.info("Publishing pipeline: Configured freq %s mins, Last start %s mins ago", effective_frequency_minutes, elapsed_minutes, extra={"job": "publishing"})
-                logger.info("Publishing pipeline should run now? %s", decision, extra={"job": "publishing"})
-                
-                if not should_run:
-                    logger.info("Skipping Publishing pipeline (already running or within freq)", extra={"job": "publishing"})
-                    continue
-
-                # 6. Run pipeline
-                logger.info("Publishing pipeline starting", extra={"job": "publishing"})
-                set_user_id(user.id) # se aplica a todos los logs del job
-                await publishing_pipeline_service_instance.run_for_user(user_id=user.id)
-                logger.info("Publishing pipeline finished", extra={"job": "publishing"})
-
-                # 7. Update the time for next pipeline initiation using the effective frequency (user or app)
-                finish_time = datetime.utcnow()
-                next_start = finish_time + timedelta(minutes=effective_frequency_minutes)
-                await user_scheduler_runtime_repo.update_by_user_id(user.id, {"nextScheduledPublishingPipelineStartingAt": next_start})
-                logger.info("Next user's scheduled Publishing pipeline starting at: %s", next_start.isoformat(), extra={"job": "publishing"})
-
-            except Exception as e:
-                logger.error("Publishing pipeline failed: %s", str(e), extra={"job": "publishing"})
-
-        # 8. Refresh app config from repository and reschedule job if frequency changed
-        # get current app job/pipeline frequency
-        job = scheduler.get_job("publishing_job")
-        current_publishing_frequency_minutes = job.trigger.interval.total_seconds() / 60
-        logger.debug("Checking if Publishing pipeline app config frequency has changed (current freq: %s mins)", current_publishing_frequency_minutes, extra={"job": "publishing"})
-        # get app configuration frequency from repo
-        new_app_config = await app_config_repo.get_config()
-        new_publishing_frequency_minutes = new_app_config.scheduler_config.publishing_pipeline_frequency_minutes
-        # if there is a new app pipeline config then reschedule job
-        if float(new_publishing_frequency_minutes) != float(current_publishing_frequency_minutes):
-            try:
-                scheduler.reschedule_job("publishing_job", trigger="interval", minutes=new_publishing_frequency_minutes)
-                logger.info("Rescheduled Publishing pipeline app config frequency to %s minutes", new_publishing_frequency_minutes, extra={"job": "publishing"})
-            except Exception as ex:
-                logger.warning("Failed to reschedule Publishing pipeline app config frequency: %s", str(ex), extra={"job": "publishing"})
-        else:   
-            logger.debug("Publishing pipeline app config frequency has not changed (current freq: %s mins)", current_publishing_frequency_minutes, extra={"job": "ingestion"})
-
-
-
-    # ===== STATS PIPELINE job =====
-    async def stats_job():
-        # 1. Get app-level config
-        app_config = await app_config_repo.get_config()
-        default_user_frequency_minutes = 1440
-
-        users = await user_repo.find_all()
-        now = datetime.utcnow()
-
-        for user in users:
-            try:
-                set_user_id(str(user.id))
-
-                # 2. Check if pipeline is enabled
-                user_scheduler_config = getattr(user, "scheduler_config", None)
-                if user_scheduler_config and hasattr(user_scheduler_config, "is_stats_pipeline_enabled") and user_scheduler_config.is_stats_pipeline_enabled is False:
-                    logger.info("Skipping Stats pipeline (disabled by user config)", extra={"job": "stats"})
-                    continue
-
-                app_scheduler_config = app_config.scheduler_config
-                if not app_scheduler_config or not hasattr(app_scheduler_config, "is_stats_pipeline_enabled") or app_scheduler_config.is_stats_pipeline_enabled is False:
-                    logger.info("Skipping Stats pipeline (disabled by app_config or app_config missing)", extra={"job": "stats"})
-                    continue
-
-                # 3. Determine effective frequency
-                user_frequency_minutes = getattr(user.scheduler_config, "stats_pipeline_frequency_minutes", None)
-                effective_frequency_minutes = float(user_frequency_minutes) if user_frequency_minutes is not None else default_user_frequency_minutes
-
-                # 4. Retrieve runtime status
-                user_runtime_status = await user_scheduler_runtime_repo.get_by_user_id(user.id)
-                stats_last_started_at = getattr(user_runtime_status, "last_stats_pipeline_started_at", None) if user_runtime_status else None
-                is_running = getattr(user_runtime_status, "is_stats_pipeline_running", False) if user_runtime_status else False
-
-                # 5. Determine if pipeline should run
-                elapsed_minutes = (now - stats_last_started_at).total_seconds() / 60.0 if stats_last_started_at else None
-                enough_time_passed = elapsed_minutes is not None and elapsed_minutes > effective_frequency_minutes and not is_running
-                stuck_protection = elapsed_minutes is not None and elapsed_minutes > (effective_frequency_minutes * 1)
-                first_run = elapsed_minutes is None
-
-                should_run = first_run or enough_time_passed or stuck_protection
-
-                elapsed_minutes_str = f"{elapsed_minutes:.2f}" if elapsed_minutes is not None else "N/A"
-                decision = "Yes" if should_run else "No"
-
-                logger.info("Stats pipeline: Configured freq %s mins, Last start %s mins ago", effective_frequency_minutes, elapsed_minutes_str, extra={"job": "stats"})
-                logger.info("Stats pipeline should run now? %s", decision, extra={"job": "stats"})
-
-                if not should_run:
-                    logger.info("Skipping Stats pipeline (already running or within freq)", extra={"job": "stats"})
-                    continue
-
-                # 6. Run pipeline
-                logger.info("Stats pipeline starting", extra={"job": "stats"})
-                set_user_id(user.id)
-                await stats_pipeline_service.run_for_user(user_id=user.id)
-                logger.info("Stats pipeline finished", extra={"job": "stats"})
-
-                # 7. Update next scheduled run
-                finish_time = datetime.utcnow()
-                next_start = finish_time + timedelta(minutes=effective_frequency_minutes)
-                await user_scheduler_runtime_repo.update_by_user_id(user.id, {"nextScheduledStatsPipelineStartingAt": next_start})
-                logger.info("Next user's scheduled Stats pipeline starting at: %s", next_start.isoformat(), extra={"job": "stats"})
-
-            except Exception as e:
-                logger.error("Stats pipeline failed: %s", str(e), extra={"job": "stats"})
-
-        # 8. Refresh app config and reschedule job if needed
-        # get current app job/pipeline frequency
-        job = scheduler.get_job("stats_job")
-        current_stats_frequency_minutes = job.trigger.interval.total_seconds() / 60
-        logger.debug("Checking if Stats pipeline app config frequency has changed (current freq: %s mins)", current_stats_frequency_minutes, extra={"job": "stats"})
-        # get app configuration frequency from repo
-        new_app_config = await app_config_repo.get_config()
-        new_stats_frequency_minutes = new_app_config.scheduler_config.stats_pipeline_frequency_minutes
-        # if there is a new app pipeline config then reschedule job
-        if float(new_stats_frequency_minutes) != float(current_stats_frequency_minutes):
-            try:
-                scheduler.reschedule_job("stats_job", trigger="interval", minutes=new_stats_frequency_minutes)
-                logger.info("Rescheduled Stats pipeline app config frequency to %s minutes", new_stats_frequency_minutes, extra={"job": "stats"})
-            except Exception as ex:
-                logger.warning("Failed to reschedule Stats pipeline app config frequency: %s", str(ex), extra={"job": "stats"})
-        else:
-            logger.debug("Stats pipeline app config frequency has not changed (current freq: %s mins)", current_stats_frequency_minutes, extra={"job": "stats"})
-    
-    
-
-    # ===== EMBEDDINGS PIPELINE job =====
-    async def embeddings_job():
-        # 1. Get app-level config
-        app_config = await app_config_repo.get_config()
-        default_user_frequency_minutes = 1440
-
-        users = await user_repo.find_all()
-        now = datetime.utcnow()
-
-        for user in users:
-            try:
-                set_user_id(str(user.id))
-
-                # 2. Check if pipeline is enabled
-                user_scheduler_config = getattr(user, "scheduler_config", None)
-                if user_scheduler_config and hasattr(user_scheduler_config, "is_embeddings_pipeline_enabled") and user_scheduler_config.is_embeddings_pipeline_enabled is False:
-                    logger.info("Skipping Embeddings pipeline (disabled by user config)", extra={"job": "embeddings"})
-                    continue
-
-                app_scheduler_config = app_config.scheduler_config
-                if not app_scheduler_config or not hasattr(app_scheduler_config, "is_embeddings_pipeline_enabled") or app_scheduler_config.is_embeddings_pipeline_enabled is False:
-                    logger.info("Skipping Embeddings pipeline (disabled by app_config or app_config missing)", extra={"job": "embeddings"})
-                    continue
-
-                # 3. Determine effective frequency
-                user_frequency_minutes = getattr(user.scheduler_config, "embeddings_pipeline_frequency_minutes", None)
-                effective_frequency_minutes = float(user_frequency_minutes) if user_frequency_minutes is not None else default_user_frequency_minutes
-
-                # 4. Retrieve runtime status
-                user_runtime_status = await user_scheduler_runtime_repo.get_by_user_id(user.id)
-                embeddings_last_started_at = getattr(user_runtime_status, "last_embeddings_pipeline_started_at", None) if user_runtime_status else None
-                is_running = getattr(user_runtime_status, "is_embeddings_pipeline_running", False) if user_runtime_status else False
-
-                # 5. Determine if pipeline should run
-                elapsed_minutes = (now - embeddings_last_started_at).total_seconds() / 60.0 if embeddings_last_started_at else None
-                enough_time_passed = elapsed_minutes is not None and elapsed_minutes > effective_frequency_minutes and not is_running
-                stuck_protection = elapsed_minutes is not None and elapsed_minutes > (effective_frequency_minutes * 1)
-                first_run = elapsed_minutes is None
-
-                should_run = first_run or enough_time_passed or stuck_protection
-
-                elapsed_minutes_str = f"{elapsed_minutes:.2f}" if elapsed_minutes is not None else "N/A"
-                decision = "Yes" if should_run else "No"
-
-                logger.info("Embeddings pipeline: Configured freq %s mins, Last start %s mins ago", effective_frequency_minutes, elapsed_minutes_str, extra={"job": "embeddings"})
-                logger.info("Embeddings pipeline should run now? %s", decision, extra={"job": "embeddings"})
-
-                if not should_run:
-                    logger.info("Skipping Embeddings pipeline (already running or within freq)", extra={"job": "embeddings"})
-                    continue
-
-                # 6. Run pipeline
-                logger.info("Embeddings pipeline starting", extra={"job": "embeddings"})
-                set_user_id(user.id)
-                await embeddings_pipeline_servive.run_for_user(user_id=user.id)
-                logger.info("Embeddings pipeline finished", extra={"job": "embeddings"})
-
-                # 7. Update next scheduled run
-                finish_time = datetime.utcnow()
-                next_start = finish_time + timedelta(minutes=effective_frequency_minutes)
-                await user_scheduler_runtime_repo.update_by_user_id(user.id, {"nextScheduledEmbeddingsPipelineStartingAt": next_start})
-                logger.info("Next user's scheduled Embeddings pipeline starting at: %s", next_start.isoformat(), extra={"job": "embeddings"})
-
-            except Exception as e:
-                logger.error("Embeddings pipeline failed: %s", str(e), extra={"job": "embeddings"})
-
-        # 8. Refresh app config and reschedule job if needed
-        job = scheduler.get_job("embeddings_job")
-        current_embeddings_frequency_minutes = job.trigger.interval.total_seconds() / 60
-        logger.debug("Checking if Embeddings pipeline app config frequency has changed (current freq: %s mins)", current_embeddings_frequency_minutes, extra={"job": "embeddings"})
-        new_app_config = await app_config_repo.get_config()
-        new_embeddings_frequency_minutes = new_app_config.scheduler_config.embeddings_pipeline_frequency_minutes
-        if float(new_embeddings_frequency_minutes) != float(current_embeddings_frequency_minutes):
-            try:
-                scheduler.reschedule_job("embeddings_job", trigger="interval", minutes=new_embeddings_frequency_minutes)
-                logger.info("Rescheduled Embeddings pipeline app config frequency to %s minutes", new_embeddings_frequency_minutes, extra={"job": "embeddings"})
-            except Exception as ex:
-                logger.warning("Failed to reschedule Embeddings pipeline app config frequency: %s", str(ex), extra={"job": "embeddings"})
-        else:
-            logger.debug("Embeddings pipeline app config frequency has not changed (current freq: %s mins)", current_embeddings_frequency_minutes, extra={"job": "embeddings"})
-
+    # ===== PIPELINE jobs (ingestion, publishing, stats, embeddings) =====
+    # One parameterized tick per pipeline: each keeps its own interval (rescheduled from app config), due-user
+    # pre-filter and work queue; only the field names, the service call and the log labels differ.
+    def make_pipeline_job(pipeline: PipelineName, work_queue: PipelineWorkQueue, run_for_user: Callable[..., Awaitable[None]], with_channels: bool = False):
+        label = pipeline.capitalize()
+        job_id = f"{pipeline}_job"
+        log_extra = {"job": pipeline}     # built once per job, shared by every log call of its ticks
+
+        async def pipeline_job():
+            # 0. Only the scheduler leader runs pipelines (other processes skip the tick)
+            if not await is_scheduler_leader(trust_seconds=SCHEDULER_LEADER_TRUST_SECONDS):
+                logger.debug("Skipping %s job tick (not the scheduler leader)", label, extra=log_extra)
+                return
+
+            # 1. Get pipeline execution frequency at app config level
+            app_config = await app_config_repo.get_config()
+
+            now = datetime.utcnow()
+
+            async def _run_one(user, channels, user_runtime_status):
+                async with PIPELINE_SEMAPHORE:
+                    try:
+                        # Set user_id for this iteration to make it available for logging
+                        set_user_id(str(user.id))
+
+                        # 2. Check if pipeline is enabled at app level
+                        app_scheduler_config = app_config.scheduler_config
+                        if not app_scheduler_config or getattr(app_scheduler_config, f"is_{pipeline}_pipeline_enabled", False) is False:
+                            logger.info("Skipping %s pipeline (disabled by app_config or app_config missing)", label, extra=log_extra)
+                            return
+
+                        # 3. Read user scheduler config + runtime status (batch-fetched for the tick) into one gating state
+                        gate = pipeline_gate_state(pipeline, user, user_runtime_status)
+
+                        # 4. Check if pipeline is enabled by the user
+                        if not gate.enabled:
+                            logger.info("Skipping %s pipeline (disabled by user config)", label, extra=log_extra)
+                            return
+                        effective_frequency_minutes, last_started_at = gate.frequency_minutes, gate.last_started_at
+
+                        # 5. Determine if pipeline is due (whether a previous run is still going is decided atomically by the claim in step 6)
+                        elapsed_minutes = (now - last_started_at) / ONE_MINUTE if last_started_at is not None else None
+                        # normal condition: more than one frequency since the last start
+                        enough_time_passed = elapsed_minutes is not None and elapsed_minutes > effective_frequency_minutes
+                        # first run condition: no previous execution recorded 
+                        first_run = elapsed_minutes is None
+
+                        should_run = first_run or enough_time_passed
+
+                        # per-user decision logs: only formatted when INFO is enabled (one pair per user per tick)
+                        if logger.isEnabledFor(logging.INFO):
+                            # normalizo valor de elapsed_minutes para el caso de que sea None no falle el logger
+                            elapsed_minutes = f"{elapsed_minutes:.2f}" if elapsed_minutes is not None else "N/A"
+                            decision = "Yes" if should_run else "No"
+                            logger.info("%s pipeline: Configured freq %s mins, Last start %s mins ago", label, effective_frequency_minutes, elapsed_minutes, extra=log_extra)
+                            logger.info("%s pipeline should run now? %s", label, decision, extra=log_extra)
+
+                        if not should_run:
+                            logger.info("Skipping %s pipeline (within freq)", label, extra=log_extra)
+                            return
+
+                        # Hand the run (steps 6-7) over to the pipeline's work queue: the tick doesn't wait for it, the queue workers bound concurrency
+                        async def _run_pipeline():
+                            try:
+                                # 6. Claim the run (running flag + start time in one findAndModify; a run still in progress keeps it
+                                # for one frequency, and never less than PIPELINE_MIN_RUN_LEASE_MINUTES: frequencies can be 0, then it is
+                                # treated as stuck), then run the pipeline. Users without a runtime status document yet are not claimable:
+                                # their first run creates it (mark_<pipeline>_started upserts).
+                                run_lease_minutes = max(effective_frequency_minutes, config.PIPELINE_MIN_RUN_LEASE_MINUTES)
+                                if user_runtime_status is not None and not await user_scheduler_runtime_repo.try_claim_pipeline(user.id, pipeline, datetime.utcnow(), lease_minutes=run_lease_minutes):
+                                    logger.info("Skipping %s pipeline (already running)", label, extra=log_extra)
+                                    return
+                                logger.info("%s pipeline starting", label, extra=log_extra)
+                                set_user_id(user.id) # se aplica a todos los logs del job
+                                await run_for_user(user, channels)
+                                logger.info("%s pipeline finished", label, extra=log_extra)
+
+                                # 7. Update the time for next pipeline initiation using the effective frequency (user or app)
+                                finish_time = datetime.utcnow()
+                                next_start = finish_time + timedelta(minutes=effective_frequency_minutes)
+                                runtime_transition_buffer.add(user.id, PipelineTransition(pipeline=pipeline, action="schedule_next", at=next_start))
+                                logger.info("Next user's scheduled %s pipeline starting at: %s", label, next_start.isoformat(), extra=log_extra)
+                            except Exception as e:
+                                logger.error("%s pipeline failed: %s", label, str(e), extra=log_extra)
+
+                        if not await work_queue.submit(user.id, _run_pipeline):
+                            logger.info("Skipping %s pipeline (already queued or running)", label, extra=log_extra)
+
+                    except Exception as e:
+                        logger.error("%s pipeline failed: %s", label, str(e), extra=log_extra)
+
+            # due users (not-due users filtered out in Mongo; ingestion co-fetches their channels in the same aggregation) and their runtime status (one $in query),
+            # then fan out the per-user due checks concurrently (bounded by PIPELINE_SEMAPHORE); due runs go to the work queue
+            if with_channels:
+                users_with_channels = [(user, channels) async for user, channels in user_repo.iter_scheduler_users_with_channels(due_pipeline=pipeline, now=now)]
+            else:
+                users_with_channels = [(user, None) async for user in user_repo.iter_scheduler_users(due_pipeline=pipeline, now=now)]
+            runtime_by_user_id = await user_scheduler_runtime_repo.get_many_by_user_ids([user.id for user, _ in users_with_channels])
+            await asyncio.gather(*[_run_one(user, channels, runtime_by_user_id.get(str(user.id))) for user, channels in users_with_channels], return_exceptions=True)
+
+            # 8. Reschedule job if the app config frequency changed
+            # get current app job/pipeline frequency
+            job = scheduler.get_job(job_id)
+            current_frequency_minutes = job.trigger.interval.total_seconds() / 60
+            logger.debug("Checking if %s pipeline app config frequency has changed (current freq: %s mins)", label, current_frequency_minutes, extra=log_extra)
+            # app configuration frequency (config read once at the start of the tick, step 1)
+            new_frequency_minutes = job_interval_minutes(getattr(app_config.scheduler_config, f"{pipeline}_pipeline_frequency_minutes"))
+            # if there is a new app pipeline config then reschedule job
+            if new_frequency_minutes != float(current_frequency_minutes):
+                try:
+                    scheduler.reschedule_job(job_id, trigger="interval", minutes=new_frequency_minutes)
+                    logger.info("Rescheduled %s pipeline app config frequency to %s minutes", label, new_frequency_minutes, extra=log_extra)
+                except Exception as ex:
+                    logger.warning("Failed to reschedule %s pipeline app config frequency: %s", label, str(ex), extra=log_extra)
+            else:
+                logger.debug("%s pipeline app config frequency has not changed (current freq: %s mins)", label, current_frequency_minutes, extra=log_extra)
+
+        pipeline_job.__name__ = job_id
+        return pipeline_job
+
+    ingestion_job = make_pipeline_job("ingestion", ingestion_work_queue, lambda user, channels: ingestion_pipeline_service_instance.run_for_user(user_id=user.id, user=user, channels=channels), with_channels=True)
+    publishing_job = make_pipeline_job("publishing", publishing_work_queue, lambda user, _: publishing_pipeline_service_instance.run_for_user(user_id=user.id))
+    stats_job = make_pipeline_job("stats", stats_work_queue, lambda user, _: stats_pipeline_service.run_for_user(user_id=user.id))
+    embeddings_job = make_pipeline_job("embeddings", embeddings_work_queue, lambda user, _: embeddings_pipeline_servive.run_for_user(user_id=user.id))
 
 
 
@@ -592,31 +525,106 @@ async def lifespan(app: FastAPI):
     embeddings_pipeline_frequency_minutes = app_config.scheduler_config.embeddings_pipeline_frequency_minutes
     logger.info("Loaded DB app config: ingestion_freq=%s min, publishing_freq=%s min, stats_freq=%s min, embeddings_freq=%s min", ingestion_pipeline_frequency_minutes, publishing_pipeline_frequency_minutes, stats_pipeline_frequency_minutes, embeddings_pipeline_frequency_minutes)
     
-    # setup job execution frequency
-    scheduler.add_job(ingestion_job, "interval", minutes=ingestion_pipeline_frequency_minutes, id="ingestion_job")
-    scheduler.add_job(publishing_job, "interval", minutes=publishing_pipeline_frequency_minutes, id="publishing_job")
-    scheduler.add_job(stats_job, "interval", minutes=stats_pipeline_frequency_minutes, id="stats_job")
-    scheduler.add_job(embeddings_job, "interval", minutes=embeddings_pipeline_frequency_minutes, id="embeddings_job")
+    # create indexes backing the repository query contracts (idempotent)
+    await video_repo.ensure_indexes()
+    await channel_repo.ensure_indexes()
+    await user_scheduler_runtime_repo.ensure_indexes()
+
+    # ensure every user has a runtime status document (one bulk write per batch of users instead of one upsert per user;
+    # users are streamed, so memory stays bounded by the batch instead of the users collection)
+    ensured_statuses = []
+    ensured_count = 0
+    async for user_doc in user_repo.iter_all(batch_size=RUNTIME_STATUS_ENSURE_BATCH_SIZE, fields=["_id"]):
+        ensured_statuses.append(UserSchedulerRuntimeStatus(user_id=user_doc["_id"]))
+        if len(ensured_statuses) == RUNTIME_STATUS_ENSURE_BATCH_SIZE:
+            await user_scheduler_runtime_repo.upsert_many(ensured_statuses)
+            ensured_count += len(ensured_statuses)
+            ensured_statuses = []
+    await user_scheduler_runtime_repo.upsert_many(ensured_statuses)
+    ensured_count += len(ensured_statuses)
+    logger.info("Runtime status documents ensured for %s users", ensured_count)
+
+    # warm up bcrypt before the first login request (errors are not fatal: login just pays the setup itself)
+    try:
+        await PasswordHasher().warm_up()
+    except Exception as exc:
+        logger.warning("bcrypt warm-up failed: %s", str(exc))
+
+    # web-only process: the scheduler (and the ingestion fallbacks it needs) runs in exactly one process
+    if not config.RUN_SCHEDULER:
+        logger.info("APScheduler disabled in this process (RUN_SCHEDULER != 1)")
+        gc.collect()
+        yield
+        await close_http_session()
+        close_mongo_client()
+        return
+
+    # create a youtube_client resource (OAuth refresh over the network, off the event loop) and chain YouTubeTranscriptionClientOfficialDataAPI as 2nd fallback
+    # (factory imported here: google-auth / googleapiclient.discovery are only loaded by the scheduler process)
+    from infrastructure.auth.youtube_credentials import get_youtube_client
+    try:
+        youtube_client = await asyncio.to_thread(get_youtube_client, client_id=config.YOUTUBE_OAUTH_CLIENT_ID, client_secret=config.YOUTUBE_OAUTH_CLIENT_SECRET, refresh_token=config.YOUTUBE_OAUTH_CLIENT_REFRESH_TOKEN)
+        transcription_client.add(YouTubeTranscriptionClientOfficialDataAPI(youtube_client=youtube_client))
+    except RuntimeError as exc:
+        logger.error("YouTube client could not be constructed: %s", str(exc), extra={"mod": __name__})
+
+    # take (or wait for) the leader lease right away: the leader loads the Whisper model of the ASR fallback in the
+    # background (startup and first job tick are not blocked by it); the heartbeat job below keeps retrying
+    await is_scheduler_leader()
 
-    # start scheduler.
+    # setup job execution frequency
+    scheduler.add_job(ingestion_job, "interval", minutes=job_interval_minutes(ingestion_pipeline_frequency_minutes), id="ingestion_job", **JOB_OPTIONS)
+    scheduler.add_job(publishing_job, "interval", minutes=job_interval_minutes(publishing_pipeline_frequency_minutes), id="publishing_job", **JOB_OPTIONS)
+    scheduler.add_job(stats_job, "interval", minutes=job_interval_minutes(stats_pipeline_frequency_minutes), id="stats_job", **JOB_OPTIONS)
+    scheduler.add_job(embeddings_job, "interval", minutes=job_interval_minutes(embeddings_pipeline_frequency_minutes), id="embeddings_job", **JOB_OPTIONS)
+    # keep (or take over) the leader lease while long pipeline ticks run
+    scheduler.add_job(is_scheduler_leader, "interval", seconds=max(config.SCHEDULER_LOCK_TTL_SECONDS // 3, 1), id="scheduler_lock_heartbeat_job", **JOB_OPTIONS)
+
+    # start the pipeline queue workers and the runtime status flusher, then the scheduler.
+    for work_queue in PIPELINE_WORK_QUEUES:
+        work_queue.start()
+    runtime_transition_buffer.start()
     scheduler.start()
     logger.info("APScheduler started")
 
+    # reap the garbage left by adapter/service construction and startup before serving requests
+    gc.collect()
+
     yield  # Application runs here
 
     # shutdown scheduler
     scheduler.shutdown()
+    for work_queue in PIPELINE_WORK_QUEUES:
+        await work_queue.stop()
+    await runtime_transition_buffer.stop()     # flush what is still buffered
+    try:
+        await scheduler_lock_repo.release(SCHEDULER_LOCK_NAME, SCHEDULER_OWNER_ID)
+    except Exception as exc:
+        logger.warning("Scheduler lock release failed (lease will expire): %s", str(exc), extra=SCHEDULER_LOCK_LOG_EXTRA)
+    if asr_warm_up_task is not None:
+        asr_warm_up_task.cancel()
+    if similarity_load_task is not None:
+        similarity_load_task.cancel()
     logger.info("APScheduler stopped")
 
+    # close the shared outbound HTTP session and MongoDB connection pool (last: the flush and lock release above still use Mongo)
+    await close_http_session()
+    close_mongo_client()
+
 
 # Start FastAPI application
 app = FastAPI(
     title       = "Pipelines: | Ingestion | Publishing | Stats | Embeddings |",
     version     = "1.0.0",
     description = "",
-    lifespan    = lifespan   # start the scheduler
+    lifespan    = lifespan,  # start the scheduler
+    default_response_class = ORJSONResponse     # orjson serialization for every route (native datetime support)
 )
 
+# Inject the service instances (with all the Adapters) for the pipeline controller
+app.state.ingestion_pipeline_service    = ingestion_pipeline_service_instance
+app.state.publishing_pipeline_service   = publishing_pipeline_service_instance
+
 # Register routes
 app.include_router(pipeline_controller.router)
 app.include_router(auth_router)
@@ -625,4 +633,6 @@ app.include_router(twitter_oauth2_router)
 
 if __name__ == "__main__":
     # wrap ASGI server start-up under if __name__ == "__main__":, so the run doesnt double-execute
-    uvicorn.run("main:app", host="0.0.0.0", port=8081)       # En PRO --> reload=False
\ No newline at end of file
+    import uvicorn      # ASGI ligero y de alto rendimiento (Asynchronous Server Gateway Interface server); not needed when served by the uvicorn CLI/gunicorn
+    # uvloop event loop + httptools HTTP parser; with WEB_CONCURRENCY > 1 only the scheduler lock holder runs the jobs (RUN_SCHEDULER=0 skips the scheduler entirely)
+    uvicorn.run("main:app", host="0.0.0.0", port=8081, loop="uvloop", http="httptools", workers=config.WEB_CONCURRENCY, access_log=config.UVICORN_ACCESS_LOG, backlog=config.UVICORN_BACKLOG, proxy_headers=True, reload=config.UVICORN_RELOAD)       # En PRO --> reload=False (UVICORN_RELOAD unset)
\ No newline at end of file
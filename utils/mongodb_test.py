@@ -4,15 +4,15 @@
 # this is a snippet code, NOT part of the application code base.
 # What´s this script used for? --> to validate that mongoDB works properly
 
-import sys
 import asyncio
-import threading
+import sys
+
+import uvloop     # same event loop as the app (uvicorn --loop uvloop)
 
 # logging
 import logging 
-import inspect  
 
-from src.infrastructure.mongodb import ping_mongo, db, _sync_client, _motor_client
+from src.infrastructure.mongodb import ping_mongo, db, get_sync_client, close_mongo_client
 
 # Specific logger for this module
 logger = logging.getLogger(__name__)
@@ -29,30 +29,35 @@ async def test_async_list_collections():
     """
     names = await db.list_collection_names()
     # print("✅ Colecciones encontradas:", names)
-    logger.info("✅ Collections found (%s): %s", len(names), names, extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+    logger.info("✅ Collections found (%s): %s", len(names), names)
 
 
-def main():
+async def run_tests():
+    """
+    Ambas pruebas en un único event loop; el ping síncrono (PyMongo, bloqueante) corre en un hilo para no bloquear el loop.
+    Los clientes se cierran aquí, dentro del loop; al salir, uvloop.run() drena el executor por defecto (shutdown_default_executor),
+    así que no quedan hilos colgando en el teardown de Python.
+    """
     try:
         # 1) Ping síncrono
-        test_sync_ping()
+        await asyncio.to_thread(test_sync_ping)
 
         # 2) Ping asíncrono + listado
-        asyncio.run(test_async_list_collections())
+        await test_async_list_collections()
+    finally:
+        # 3) Cerramos clientes para evitar hilos colgando
+        get_sync_client().close()
+        close_mongo_client()
+
 
-        logger.info("🎉 All MongoDB tests passed successfully!", extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+def main():
+    try:
+        uvloop.run(run_tests())
+
+        logger.info("🎉 All MongoDB tests passed successfully!")
     except Exception as e:
-        logger.info("❌ Error ni MongoDB test: %s", e, extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+        logger.info("❌ Error ni MongoDB test: %s", e)
         sys.exit(1)
-    finally:
-        # 3) Cerramos clientes para evitar hilos colgando
-        _sync_client.close()
-        _motor_client.close()
-         # Limpiar hilos dummy antes del teardown de Python
-        try:
-            threading._shutdown()
-        except Exception:
-            pass
 
     sys.exit(0)
 
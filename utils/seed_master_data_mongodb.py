@@ -9,7 +9,6 @@ import asyncio
 import os
 import sys
 import threading
-import inspect
 import logging
 import datetime as _dt
 from datetime import timezone
@@ -24,6 +23,8 @@ from infrastructure.mongodb import db  # AsyncIOMotorDatabase
 
 # IMPORTAR repos/adapters solo para app_config fallback
 from adapters.outbound.mongodb.app_config_repository import MongoAppConfigRepository
+from adapters.outbound.mongodb.user_repository import MongoUserRepository
+from adapters.outbound.mongodb.user_prompt_repository import MongoUserPromptRepository
 
 # Specific logger for this module (follow existing project logging style)
 logger = logging.getLogger(__name__)
@@ -92,7 +93,7 @@ def prompt_confirm(message: str, timeout: int = 60, default: bool = True) -> boo
 # SEED DB WITH DATA 
 # -----------------------
 async def seed():
-    logger.info("Script - Seeding data to MongoDB starting", extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+    logger.info("Script - Seeding data to MongoDB starting")
 
     # ---------------------------
     # REQUEST USER PERMISSION PRIOR TO ERASE COLLECTIONS
@@ -134,35 +135,35 @@ async def seed():
         pass
 
     if CLEAN_USERS:
-        await db.get_collection("users").delete_many({})
-        logger.info("[ok] erased users", extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+        await MongoUserRepository(database=db).truncate()
+        logger.info("[ok] erased users")
     if CLEAN_CHANNELS:
         await db.get_collection("channels").delete_many({})
-        logger.info("[ok] erased channels", extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+        logger.info("[ok] erased channels")
     if CLEAN_USER_PROMPTS:
-        await db.get_collection("user_prompts").delete_many({})
-        logger.info("[ok] erased user_prompts", extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+        await MongoUserPromptRepository(database=db).truncate()
+        logger.info("[ok] erased user_prompts")
     if CLEAN_MASTER_PROMPTS:
         await db.get_collection("master_prompts").delete_many({})
-        logger.info("[ok] erased master_prompts", extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+        logger.info("[ok] erased master_prompts")
     if CLEAN_APP_CONFIG:
         await db.get_collection("app_config").delete_many({})
-        logger.info("[ok] erased app_config", extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+        logger.info("[ok] erased app_config")
     if CLEAN_TWEET_GENERATIONS:
         await db.get_collection("tweet_generations").delete_many({})
-        logger.info("[ok] erased tweet_generations", extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+        logger.info("[ok] erased tweet_generations")
     if CLEAN_TWEETS:
         await db.get_collection("tweets").delete_many({})
-        logger.info("[ok] erased tweets", extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+        logger.info("[ok] erased tweets")
     if CLEAN_VIDEOS:
         await db.get_collection("videos").delete_many({})
-        logger.info("[ok] erased videos", extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+        logger.info("[ok] erased videos")
     if CLEAN_USER_SCHEDULER_STATUS_RUNTIME:
         await db.get_collection("user_scheduler_runtime_status").delete_many({})
-        logger.info("[ok] erased user_scheduler_runtime_status", extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+        logger.info("[ok] erased user_scheduler_runtime_status")
     if CLEAN_EMBEDDINGS:
         await db.get_collection("embeddings").delete_many({})
-        logger.info("[ok] erased embeddings", extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+        logger.info("[ok] erased embeddings")
 
     # Ensure collections exist (create empty collections if missing)
     existing_collections = await db.list_collection_names()
@@ -182,9 +183,9 @@ async def seed():
         if coll_name not in existing_collections:
             try:
                 await db.create_collection(coll_name)
-                logger.info(f"[ok] created collection {coll_name}", extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+                logger.info(f"[ok] created collection {coll_name}")
             except Exception:
-                logger.warning(f"[warn] could not create collection {coll_name} (it may already exist)", extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+                logger.warning(f"[warn] could not create collection {coll_name} (it may already exist)")
 
     _msg2 = "\nMongoDB collections have been erased, and seed data will be written now, Do you want to proceed?"
     if not prompt_confirm(_msg2, timeout=60, default=True):
@@ -288,17 +289,17 @@ async def seed():
             found = await db.get_collection("users").find_one({"_id": MASTER_USER_ID})
             if not found:
                 await db.get_collection("users").replace_one({"_id": MASTER_USER_ID}, user_doc, upsert=True)
-                logger.info(f"[ok] user not found after update; enforced stable _id via direct DB replace = {MASTER_USER_ID}", extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+                logger.info(f"[ok] user not found after update; enforced stable _id via direct DB replace = {MASTER_USER_ID}")
             else:
-                logger.info(f"[ok] user updated via repo, id={user_entity.id}", extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+                logger.info(f"[ok] user updated via repo, id={user_entity.id}")
         except Exception:
             # If something fails in the repo, force the _id with replace_one
             await db.get_collection("users").replace_one({"_id": MASTER_USER_ID}, user_doc, upsert=True)
-            logger.info("[ok] user upserted with stable _id via direct DB fallback = %s", str(MASTER_USER_ID), extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+            logger.info("[ok] user upserted with stable _id via direct DB fallback = %s", str(MASTER_USER_ID))
     except Exception:
         # If adapter import fails, fallback direct (ensures stable _id)
         await db.get_collection("users").replace_one({"_id": MASTER_USER_ID}, user_doc, upsert=True)
-        logger.info("[ok] user upserted with stable _id via direct DB (adapter missing) = %s", str(MASTER_USER_ID), extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+        logger.info("[ok] user upserted with stable _id via direct DB (adapter missing) = %s", str(MASTER_USER_ID))
 
 
     # -----------------------
@@ -364,8 +365,7 @@ async def seed():
                     updated_at=channel_doc.get("updatedAt")
                 )
                 saved_channel_id = await channel_repo.save(temp_channel_entity)  # type: ignore
-                logger.info(f"[ok] channel saved via repo, id={saved_channel_id}",
-                            extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+                logger.info(f"[ok] channel saved via repo, id={saved_channel_id}")
 
                 # Try to convert repo id to ObjectId for DB references; if not valid, keep string
                 try:
@@ -379,16 +379,14 @@ async def seed():
                 channel_doc["_id"] = channel_obj_id
                 await db.get_collection("channels").replace_one({"_id": channel_obj_id}, channel_doc, upsert=True)
                 saved_channel_id = str(channel_obj_id)
-                logger.info(f"[ok] channel upserted with _id={channel_obj_id} via direct DB fallback",
-                            extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+                logger.info(f"[ok] channel upserted with _id={channel_obj_id} via direct DB fallback")
         else:
             # adapter import failed -> direct DB upsert with a generated ObjectId
             channel_obj_id = ObjectId()
             channel_doc["_id"] = channel_obj_id
             await db.get_collection("channels").replace_one({"_id": channel_obj_id}, channel_doc, upsert=True)
             saved_channel_id = str(channel_obj_id)
-            logger.info(f"[ok] channel upserted with _id={channel_obj_id} via direct DB (adapter missing)",
-                        extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+            logger.info(f"[ok] channel upserted with _id={channel_obj_id} via direct DB (adapter missing)")
 
         # Ensure we have a canonical channel_obj_id (prefer ObjectId form)
         if channel_obj_id is None and saved_channel_id is not None:
@@ -465,7 +463,6 @@ async def seed():
 
             logger.info(
                 f"[ok] master_prompt saved via repo, id={saved_master_prompt_id}",
-                extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name},
             )
         except Exception:
             await db.get_collection("master_prompts").replace_one(
@@ -476,7 +473,6 @@ async def seed():
             saved_master_prompt_id = str(master_prompt_doc["_id"])
             logger.info(
                 f"[ok] master_prompt upserted via direct DB fallback, id={saved_master_prompt_id}",
-                extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name},
             )
     else:
         await db.get_collection("master_prompts").replace_one(
@@ -487,7 +483,6 @@ async def seed():
         saved_master_prompt_id = str(master_prompt_doc["_id"])
         logger.info(
             f"[ok] master_prompt upserted via direct DB (adapter missing), id={saved_master_prompt_id}",
-            extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name},
         )
 
         # If still needed to keep an array of affected channel ids, saved_channel_ids can be reused.
@@ -537,7 +532,6 @@ async def seed():
 
     logger.info(
         f"[ok] user_prompt created and linked to master_prompt {saved_master_prompt_id}, id={saved_user_prompt_id}",
-        extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name},
     )
 
     # Update all seeded channels to reference this USER prompt
@@ -559,7 +553,6 @@ async def seed():
 
         logger.info(
             f"[ok] channel {channel_ref} updated with selectedPromptId={saved_user_prompt_id}",
-            extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name},
         )
 
 
@@ -580,7 +573,7 @@ async def seed():
     app_config_repo = MongoAppConfigRepository(db)
     try:
         await app_config_repo.update_config(app_config)
-        logger.info("[ok] app config updated via repo", extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+        logger.info("[ok] app config updated via repo")
     except AttributeError:
         # fallback direct write to the app_config collection (collection name is app_config)
         await db.get_collection("app_config").replace_one(
@@ -600,7 +593,7 @@ async def seed():
             },
             upsert=True
         )
-        logger.info("[ok] app config upserted directly", extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+        logger.info("[ok] app config upserted directly")
 
 
     # -----------------------
@@ -616,7 +609,7 @@ async def seed():
             await usr_status_coll.create_index("userId", unique=True)
         except Exception:
             # index creation non-fatal if it already exists or if permissions differ
-            logger.debug("Could not create index userId on user_scheduler_runtime_status (may already exist)", extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+            logger.debug("Could not create index userId on user_scheduler_runtime_status (may already exist)")
 
         # Document shape aligned with the design
         status_doc = {
@@ -662,14 +655,14 @@ async def seed():
             upsert=True
         )
         if res.upserted_id:
-            logger.info("[ok] user_scheduler_runtime_status created for user=%s", str(MASTER_USER_ID), extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+            logger.info("[ok] user_scheduler_runtime_status created for user=%s", str(MASTER_USER_ID))
         else:
-            logger.info("[ok] user_scheduler_runtime_status ensured for user=%s (already existed)", str(MASTER_USER_ID), extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+            logger.info("[ok] user_scheduler_runtime_status ensured for user=%s (already existed)", str(MASTER_USER_ID))
     except Exception as exc:
-        logger.exception("Failed to seed user_scheduler_runtime_status: %s", exc, extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+        logger.exception("Failed to seed user_scheduler_runtime_status: %s", exc)
 
 
-    logger.info("Script - Seeding data to MongoDB finished.", extra={"module_name": __name__, "function_name": inspect.currentframe().f_code.co_name})
+    logger.info("Script - Seeding data to MongoDB finished.")
 
 
 if __name__ == "__main__":